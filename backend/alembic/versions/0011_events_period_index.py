@@ -0,0 +1,35 @@
+"""Indexes for interval-overlap queries on events
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # btree_gist pozwala trzymać user_id (=) i tstzrange (&&) w jednym indeksie GiST
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    # tstzrange(start, end) rzuca błąd dla end < start — odwrócone wiersze
+    # (zapisane przed walidacją w API) dostają zamienione granice
+    op.execute(
+        "UPDATE events SET start_datetime = end_datetime, "
+        "end_datetime = start_datetime WHERE end_datetime < start_datetime"
+    )
+    op.execute(
+        "CREATE INDEX ix_events_user_period ON events "
+        "USING gist (user_id, tstzrange(start_datetime, end_datetime, '[)'))"
+    )
+    # Sortowanie / paginacja po start_datetime w obrębie usera
+    op.create_index("ix_events_user_start", "events", ["user_id", "start_datetime"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_user_start", table_name="events")
+    op.drop_index("ix_events_user_period", table_name="events")
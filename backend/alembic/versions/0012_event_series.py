@@ -0,0 +1,74 @@
+"""event_series and event_series_exceptions tables
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_series",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("start_datetime", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_datetime", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("rrule", sa.String(500), nullable=False),
+        sa.Column("until_datetime", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("location", sa.String(200), nullable=True),
+        sa.Column(
+            "activity_template_id",
+            sa.Integer(),
+            sa.ForeignKey("activity_templates.id"),
+            nullable=True,
+        ),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column(
+            "is_background", sa.Boolean(), nullable=False, server_default="false"
+        ),
+        sa.Column("color", sa.String(20), nullable=True),
+        sa.Column("icon", sa.String(100), nullable=True),
+        sa.Column("eisenhower_quadrant", sa.String(20), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_event_series_id", "event_series", ["id"])
+    op.create_index(
+        "ix_event_series_user_start", "event_series", ["user_id", "start_datetime"]
+    )
+
+    op.create_table(
+        "event_series_exceptions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "series_id",
+            sa.Integer(),
+            sa.ForeignKey("event_series.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("original_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_cancelled", sa.Boolean(), nullable=False, server_default="false"),
+        sa.Column("title", sa.String(200), nullable=True),
+        sa.Column("start_datetime", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("end_datetime", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("location", sa.String(200), nullable=True),
+        sa.UniqueConstraint(
+            "series_id", "original_start", name="uq_event_series_exceptions_occ"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("event_series_exceptions")
+    op.drop_index("ix_event_series_user_start", table_name="event_series")
+    op.drop_index("ix_event_series_id", table_name="event_series")
+    op.drop_table("event_series")
@@ -0,0 +1,71 @@
+"""updated_at / change_seq columns and sync_tombstones for delta sync
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+SYNCED_TABLES = [
+    "events",
+    "event_series",
+    "eisenhower_tasks",
+    "activity_templates",
+    "contacts",
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("change_seq", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    for table in SYNCED_TABLES:
+        op.add_column(
+            table, sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "change_seq", sa.BigInteger(), nullable=False, server_default="0"
+            ),
+        )
+        op.execute(f"UPDATE {table} SET updated_at = created_at")
+        op.create_index(f"ix_{table}_user_change_seq", table, ["user_id", "change_seq"])
+
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("entity", sa.String(40), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("change_seq", sa.BigInteger(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_sync_tombstones_user_change_seq",
+        "sync_tombstones",
+        ["user_id", "change_seq"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sync_tombstones")
+    for table in SYNCED_TABLES:
+        op.drop_index(f"ix_{table}_user_change_seq", table_name=table)
+        op.drop_column(table, "change_seq")
+        op.drop_column(table, "updated_at")
+    op.drop_column("users", "change_seq")
@@ -0,0 +1,37 @@
+"""Events inherit template description by reference (NULL = inherit)
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Kopie opisu szablonu → NULL; różniące się opisy zostają jako nadpisania
+    for table in ("events", "event_series"):
+        op.execute(f"""
+            UPDATE {table} AS e
+            SET description = NULL
+            FROM activity_templates AS t
+            WHERE e.activity_template_id = t.id
+              AND e.description IS NOT NULL
+              AND e.description = t.description
+            """)
+
+
+def downgrade() -> None:
+    for table in ("events", "event_series"):
+        op.execute(f"""
+            UPDATE {table} AS e
+            SET description = t.description
+            FROM activity_templates AS t
+            WHERE e.activity_template_id = t.id
+              AND e.description IS NULL
+            """)
@@ -0,0 +1,28 @@
+"""Secret-URL .ics feed: users.feed_token and users.changed_at
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users", sa.Column("changed_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column("users", sa.Column("feed_token", sa.String(64), nullable=True))
+    op.create_unique_constraint("uq_users_feed_token", "users", ["feed_token"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_users_feed_token", "users", type_="unique")
+    op.drop_column("users", "feed_token")
+    op.drop_column("users", "changed_at")
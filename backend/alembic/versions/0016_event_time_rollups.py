@@ -0,0 +1,122 @@
+"""Time-spent rollup per (user, UTC day, template) maintained by triggers
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def _rows(table: str, sign: str) -> str:
+    return (
+        "SELECT user_id, (start_datetime AT TIME ZONE 'UTC')::date AS day, "
+        "activity_template_id, "
+        f"{sign}EXTRACT(EPOCH FROM end_datetime - start_datetime)::bigint AS seconds, "
+        f"{sign}1 AS count "
+        f"FROM {table} WHERE NOT is_background"
+    )
+
+
+def _apply_delta(*parts: str) -> str:
+    """
+    Upsert zsumowanej delty. Klucze w stałej kolejności (mniej zakleszczeń
+    przy równoległych zapisach); delta zerowa — np. zmiana samego tytułu —
+    nie zapisuje nic.
+    """
+    return (
+        "INSERT INTO event_time_rollups AS r "
+        "(user_id, day, activity_template_id, seconds, count) "
+        "SELECT user_id, day, activity_template_id, SUM(seconds), SUM(count) "
+        f"FROM ({' UNION ALL '.join(parts)}) AS delta "
+        "GROUP BY user_id, day, activity_template_id "
+        "HAVING SUM(seconds) <> 0 OR SUM(count) <> 0 "
+        "ORDER BY user_id, day, activity_template_id "
+        "ON CONFLICT (user_id, day, COALESCE(activity_template_id, 0)) "
+        "DO UPDATE SET seconds = r.seconds + EXCLUDED.seconds, "
+        "count = r.count + EXCLUDED.count;"
+    )
+
+
+# Wiersze, które spadły do zera, znikają — tabela rośnie z liczbą dni, nie zmian
+_PRUNE = (
+    "DELETE FROM event_time_rollups WHERE count = 0 AND (user_id, day) IN "
+    "(SELECT user_id, (start_datetime AT TIME ZONE 'UTC')::date FROM old_rows);"
+)
+
+# Triggery per instrukcja z tabelami przejściowymi: COPY 5000 wierszy
+# to jeden upsert zgrupowany po dniach, nie 5000 upsertów.
+# Tabele przejściowe wymagają osobnego triggera na każdą operację.
+_FUNCTION = f"""
+CREATE FUNCTION event_time_rollups_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_apply_delta(_rows("new_rows", ""))}
+    ELSIF TG_OP = 'UPDATE' THEN
+        {_apply_delta(_rows("old_rows", "-"), _rows("new_rows", ""))}
+        {_PRUNE}
+    ELSE
+        {_apply_delta(_rows("old_rows", "-"))}
+        {_PRUNE}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+_TRIGGERS = {
+    "event_time_rollups_insert": "INSERT ON events REFERENCING NEW TABLE AS new_rows",
+    "event_time_rollups_update": (
+        "UPDATE ON events REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "event_time_rollups_delete": "DELETE ON events REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "event_time_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("activity_template_id", sa.Integer(), nullable=True),
+        sa.Column("seconds", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX uq_event_time_rollups_key ON event_time_rollups "
+        "(user_id, day, COALESCE(activity_template_id, 0))"
+    )
+    # Stan początkowy z istniejących eventów
+    op.execute(
+        "INSERT INTO event_time_rollups "
+        "(user_id, day, activity_template_id, seconds, count) "
+        "SELECT user_id, day, activity_template_id, SUM(seconds), SUM(count) "
+        f"FROM ({_rows('events', '')}) AS initial "
+        "GROUP BY user_id, day, activity_template_id"
+    )
+    op.execute(_FUNCTION)
+    for name, spec in _TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {spec} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION event_time_rollups_apply()"
+        )
+
+
+def downgrade() -> None:
+    for name in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON events")
+    op.execute("DROP FUNCTION IF EXISTS event_time_rollups_apply()")
+    op.drop_table("event_time_rollups")
@@ -0,0 +1,83 @@
+"""Full-text search: generated tsvector columns with GIN indexes
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def _weighted(column: str, weight: str, html: bool = False) -> str:
+    value = f"coalesce({column}, '')"
+    if html:
+        value = f"strip_html({value})"
+    return f"setweight(to_tsvector('simple'::regconfig, {value}), '{weight}')"
+
+
+# Tabela → wyrażenie kolumny search_vector (A = tytuł/nazwa, B = opis, C = reszta).
+# Kolumny nie są mapowane w modelach ORM (nie wracają w każdym SELECT /
+# RETURNING) — app.core.search odwołuje się do nich po nazwie.
+VECTORS = {
+    "events": " || ".join(
+        [
+            _weighted("title", "A"),
+            _weighted("description", "B", html=True),
+            _weighted("location", "C"),
+        ]
+    ),
+    "event_series": " || ".join(
+        [
+            _weighted("title", "A"),
+            _weighted("description", "B", html=True),
+            _weighted("location", "C"),
+        ]
+    ),
+    "eisenhower_tasks": " || ".join(
+        [_weighted("title", "A"), _weighted("description", "B", html=True)]
+    ),
+    "activity_templates": " || ".join(
+        [_weighted("name", "A"), _weighted("description", "B", html=True)]
+    ),
+    "contacts": " || ".join(
+        [_weighted("name", "A"), _weighted("notes", "B", html=True)]
+    ),
+}
+
+
+def upgrade() -> None:
+    # btree_gin: user_id i tsvector w jednym indeksie GIN — wyszukiwanie
+    # nie przegląda dopasowań innych userów
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    # Tagi i encje HTML → spacje; IMMUTABLE, więc można go użyć w kolumnie generowanej
+    op.execute("""
+        CREATE FUNCTION strip_html(value text) RETURNS text
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+        AS $$
+            SELECT regexp_replace(
+                regexp_replace(value, '<[^>]*>', ' ', 'g'),
+                '&(#[0-9]+|#x[0-9a-f]+|[a-z]+);', ' ', 'gi'
+            )
+        $$
+        """)
+    for table, expression in VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX ix_{table}_search ON {table} "
+            "USING gin (user_id, search_vector)"
+        )
+
+
+def downgrade() -> None:
+    for table in VECTORS:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN search_vector")
+    op.execute("DROP FUNCTION IF EXISTS strip_html(text)")
@@ -0,0 +1,74 @@
+"""Reminders: reminder_minutes + trigger-maintained remind_at with partial indexes
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+# Tabela → wyrażenie remind_at. timestamptz - interval nie jest IMMUTABLE,
+# więc zamiast kolumny generowanej liczy je trigger BEFORE INSERT/UPDATE
+# (obejmuje też COPY i INSERT ... SELECT). Zrobione taski nie przypominają.
+REMIND_AT = {
+    "events": "NEW.start_datetime - make_interval(mins => NEW.reminder_minutes)",
+    "eisenhower_tasks": (
+        "CASE WHEN NEW.status = 'done' THEN NULL "
+        "ELSE NEW.due_date - make_interval(mins => NEW.reminder_minutes) END"
+    ),
+}
+
+
+def upgrade() -> None:
+    for table in ("events", "event_series", "eisenhower_tasks"):
+        op.add_column(table, sa.Column("reminder_minutes", sa.Integer(), nullable=True))
+    for table, expression in REMIND_AT.items():
+        op.add_column(
+            table,
+            sa.Column("remind_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.execute(f"""
+            CREATE FUNCTION {table}_set_remind_at() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                NEW.remind_at := {expression};
+                RETURN NEW;
+            END
+            $$
+            """)
+        op.execute(
+            f"CREATE TRIGGER {table}_remind_at BEFORE INSERT OR UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {table}_set_remind_at()"
+        )
+        # Worker: kolejne okna czasu (remind_at) i zmiany od ostatniego
+        # przebiegu (updated_at) — tylko wiersze z przypomnieniem
+        op.execute(
+            f"CREATE INDEX ix_{table}_remind_at ON {table} (remind_at) "
+            "WHERE remind_at IS NOT NULL"
+        )
+        op.execute(
+            f"CREATE INDEX ix_{table}_reminder_updated ON {table} (updated_at) "
+            "WHERE remind_at IS NOT NULL"
+        )
+    op.execute(
+        "CREATE INDEX ix_event_series_reminder ON event_series (start_datetime) "
+        "WHERE reminder_minutes IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_event_series_reminder")
+    for table in REMIND_AT:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_reminder_updated")
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_remind_at")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_remind_at ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_set_remind_at()")
+        op.drop_column(table, "remind_at")
+    for table in ("events", "event_series", "eisenhower_tasks"):
+        op.drop_column(table, "reminder_minutes")
@@ -0,0 +1,43 @@
+"""Indexes for filtered / paginated task lists (partial on open tasks)
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+OPEN = sa.text("status <> 'done'")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_eisenhower_tasks_user_created",
+        "eisenhower_tasks",
+        ["user_id", "created_at", "id"],
+    )
+    # Zapytanie macierzy (otwarte taski) nie rośnie z historią zrobionych
+    op.create_index(
+        "ix_eisenhower_tasks_open_created",
+        "eisenhower_tasks",
+        ["user_id", "created_at", "id"],
+        postgresql_where=OPEN,
+    )
+    op.create_index(
+        "ix_eisenhower_tasks_open_due",
+        "eisenhower_tasks",
+        ["user_id", "due_date", "id"],
+        postgresql_where=OPEN,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_eisenhower_tasks_open_due", table_name="eisenhower_tasks")
+    op.drop_index("ix_eisenhower_tasks_open_created", table_name="eisenhower_tasks")
+    op.drop_index("ix_eisenhower_tasks_user_created", table_name="eisenhower_tasks")
@@ -0,0 +1,55 @@
+"""Eisenhower task rank: lexicographic fractional-index ordering per quadrant
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0020"
+down_revision = "0019"
+branch_labels = None
+depends_on = None
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+WIDTH = 4
+
+
+def _digit(power: int) -> str:
+    return f"substr('{DIGITS}', (value / {62 ** power} % 62)::int + 1, 1)"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "eisenhower_tasks",
+        sa.Column("rank", sa.String(64, collation="C"), nullable=True),
+    )
+    # Istniejące taski: równe odstępy w kwadrancie wg created_at — to samo
+    # co app.core.ranking.spread_ranks() przy 4 cyfrach base-62
+    key = " || ".join(_digit(power) for power in reversed(range(WIDTH)))
+    op.execute(f"""
+        UPDATE eisenhower_tasks t
+        SET rank = rtrim({key}, '0')
+        FROM (
+            SELECT id,
+                   row_number() OVER w * {62 ** WIDTH}::bigint
+                       / (count(*) OVER (PARTITION BY user_id, urgent, important) + 1)
+                       AS value
+            FROM eisenhower_tasks
+            WINDOW w AS (PARTITION BY user_id, urgent, important
+                         ORDER BY created_at, id)
+        ) s
+        WHERE t.id = s.id
+        """)
+    op.create_index(
+        "ix_eisenhower_tasks_quadrant_rank",
+        "eisenhower_tasks",
+        ["user_id", "urgent", "important", "rank"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_eisenhower_tasks_quadrant_rank", table_name="eisenhower_tasks")
+    op.drop_column("eisenhower_tasks", "rank")
@@ -0,0 +1,40 @@
+"""Recurring task roll-forward: rolled_forward_at marker + partial index
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0021"
+down_revision = "0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "eisenhower_tasks",
+        sa.Column("rolled_forward_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Bez backfillu: frontend przy odhaczeniu cyklicznego resetuje ten sam
+    # wiersz do todo i nie tworzy następcy, więc zrobione cykliczne sprzed
+    # workera (odhaczone przez API) następcy nie mają — dostaje go pierwszy
+    # przebieg workera. Oznaczenie ich tutaj gubiłoby powtórzenie, a archiwum
+    # od razu brałoby je jako zakończone
+    op.create_index(
+        "ix_eisenhower_tasks_rollover",
+        "eisenhower_tasks",
+        ["id"],
+        postgresql_where=sa.text(
+            "status = 'done' AND recurrence_days IS NOT NULL "
+            "AND rolled_forward_at IS NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_eisenhower_tasks_rollover", table_name="eisenhower_tasks")
+    op.drop_column("eisenhower_tasks", "rolled_forward_at")
@@ -0,0 +1,32 @@
+"""Partial due_date index for the scheduled-task promotion job
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0022"
+down_revision = "0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Każdy próg promocji to zakres due_date po tym indeksie — bez skanu
+    # niezaplanowanych i zrobionych tasków
+    op.create_index(
+        "ix_eisenhower_tasks_promotion",
+        "eisenhower_tasks",
+        ["due_date"],
+        postgresql_where=sa.text(
+            "due_date IS NOT NULL AND target_quadrant IS NOT NULL "
+            "AND status <> 'done'"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_eisenhower_tasks_promotion", table_name="eisenhower_tasks")
@@ -0,0 +1,66 @@
+"""Cold-storage archive: archive_chunks (JSONB, lz4) + rollup-preserving delete trigger
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0023"
+down_revision = "0022"
+branch_labels = None
+depends_on = None
+
+_DELETE_TRIGGER = (
+    "CREATE TRIGGER event_time_rollups_delete AFTER DELETE ON events "
+    "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT {when}"
+    "EXECUTE FUNCTION event_time_rollups_apply()"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archive_chunks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "user_id",
+            sa.Integer(),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("entity", sa.String(32), nullable=False),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("period_end", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("rows", postgresql.JSONB(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_archive_chunks_user_period",
+        "archive_chunks",
+        ["user_id", "entity", "period_start"],
+    )
+    # Paczki są duże i czytane rzadko — lz4 zamiast domyślnego pglz
+    op.execute("ALTER TABLE archive_chunks ALTER COLUMN rows SET COMPRESSION lz4")
+
+    # Archiwizacja usuwa eventy z app.archiving = on — rollup czasu ma
+    # zachować ich dni, więc trigger DELETE takie instrukcje pomija
+    op.execute("DROP TRIGGER event_time_rollups_delete ON events")
+    op.execute(
+        _DELETE_TRIGGER.format(
+            when=(
+                "WHEN (current_setting('app.archiving', true) "
+                "IS DISTINCT FROM 'on') "
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER event_time_rollups_delete ON events")
+    op.execute(_DELETE_TRIGGER.format(when=""))
+    op.drop_index("ix_archive_chunks_user_period", table_name="archive_chunks")
+    op.drop_table("archive_chunks")
@@ -0,0 +1,26 @@
+"""Birthday anniversary expression index on contacts (month*100 + day)
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0024"
+down_revision = "0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Wyrażenie 1:1 z app.models.contact.birthday_key()
+    op.execute(
+        "CREATE INDEX ix_contacts_user_birthday ON contacts "
+        "(user_id, (EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday))) "
+        "WHERE birthday IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_contacts_user_birthday")
@@ -0,0 +1,41 @@
+"""event_series.activity_template_id ON DELETE SET NULL
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "0025"
+down_revision = "0024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nazwa nadana przez Postgresa w 0012 (FK bez nazwy)
+    op.drop_constraint(
+        "event_series_activity_template_id_fkey", "event_series", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "event_series_activity_template_id_fkey",
+        "event_series",
+        "activity_templates",
+        ["activity_template_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "event_series_activity_template_id_fkey", "event_series", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "event_series_activity_template_id_fkey",
+        "event_series",
+        "activity_templates",
+        ["activity_template_id"],
+        ["id"],
+    )
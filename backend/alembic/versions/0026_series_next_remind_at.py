@@ -0,0 +1,70 @@
+"""event_series.next_remind_at — series reminder lower bound kept by the worker
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0026"
+down_revision = "0025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Żadne wystąpienie serii nie przypomina przed next_remind_at. Worker
+    # przesuwa je za wczytany plaster (app.core.reminders); każdy inny zapis
+    # serii — też zmiana wyjątku, bo podbija change_seq serii — cofa je do
+    # -infinity, więc seria wraca do najbliższego plastra. NULL = bez
+    # przypomnień (albo seria już się skończyła).
+    op.add_column(
+        "event_series",
+        sa.Column("next_remind_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute("""
+        CREATE FUNCTION event_series_set_next_remind_at() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF NEW.reminder_minutes IS NULL THEN
+                NEW.next_remind_at := NULL;
+                RETURN NEW;
+            END IF;
+            IF TG_OP = 'UPDATE' THEN
+                -- Zapis workera zmienia tylko next_remind_at
+                IF NEW.next_remind_at IS DISTINCT FROM OLD.next_remind_at THEN
+                    RETURN NEW;
+                END IF;
+            END IF;
+            NEW.next_remind_at := '-infinity';
+            RETURN NEW;
+        END
+        $$
+        """)
+    op.execute(
+        "CREATE TRIGGER event_series_next_remind_at "
+        "BEFORE INSERT OR UPDATE ON event_series "
+        "FOR EACH ROW EXECUTE FUNCTION event_series_set_next_remind_at()"
+    )
+    op.execute(
+        "UPDATE event_series SET reminder_minutes = reminder_minutes "
+        "WHERE reminder_minutes IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX ix_event_series_next_remind_at ON event_series "
+        "(next_remind_at) WHERE next_remind_at IS NOT NULL"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_event_series_reminder")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_event_series_reminder ON event_series (start_datetime) "
+        "WHERE reminder_minutes IS NOT NULL"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_event_series_next_remind_at")
+    op.execute("DROP TRIGGER IF EXISTS event_series_next_remind_at ON event_series")
+    op.execute("DROP FUNCTION IF EXISTS event_series_set_next_remind_at()")
+    op.drop_column("event_series", "next_remind_at")
@@ -14,7 +14,8 @@ def get_current_user(
     db: Session = Depends(get_db),
 ) -> User:
     payload = decode_token(token)
-    if not payload:
+    # Tylko access token — token strumienia SSE nie autoryzuje API
+    if not payload or payload.get("type") != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
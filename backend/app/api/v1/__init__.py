@@ -2,12 +2,20 @@ from fastapi import APIRouter
 
 from app.api.v1 import (
     admin,
+    agenda,
     auth,
     activity_templates,
+    calendar_feed,
     events,
+    forecast,
+    event_import,
+    event_series,
     eisenhower_tasks,
     contacts,
+    reminders,
+    search,
     settings,
+    sync,
 )
 
 api_router = APIRouter(prefix="/api/v1")
@@ -15,6 +23,14 @@ api_router.include_router(admin.router)
 api_router.include_router(auth.router)
 api_router.include_router(activity_templates.router)
 api_router.include_router(events.router)
+api_router.include_router(event_series.router)
+api_router.include_router(event_import.router)
 api_router.include_router(eisenhower_tasks.router)
 api_router.include_router(contacts.router)
 api_router.include_router(settings.router)
+api_router.include_router(sync.router)
+api_router.include_router(calendar_feed.router)
+api_router.include_router(forecast.router)
+api_router.include_router(search.router)
+api_router.include_router(reminders.router)
+api_router.include_router(agenda.router)
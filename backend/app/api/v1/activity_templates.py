@@ -1,12 +1,16 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
+from app.core.sync import stamp
 from app.db.base import get_db
+from app.db.writes import insert_returning, update_returning
 from app.models.activity_template import ActivityTemplate
 from app.models.event import Event
+from app.models.event_series import EventSeries
 from app.models.user import User
 from app.schemas.activity_template import (
     ActivityTemplateCreate,
@@ -36,11 +40,12 @@ def create_template(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    template = ActivityTemplate(**payload.model_dump(), user_id=current_user.id)
-    db.add(template)
+    template = insert_returning(
+        db, ActivityTemplate, {**payload.model_dump(), "user_id": current_user.id}
+    )
+    out = ActivityTemplateOut.model_validate(template)
     db.commit()
-    db.refresh(template)
-    return template
+    return out
 
 
 @router.put("/{template_id}", response_model=ActivityTemplateOut)
@@ -50,39 +55,20 @@ def update_template(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    template = (
-        db.query(ActivityTemplate)
-        .filter(
-            ActivityTemplate.id == template_id,
-            ActivityTemplate.user_id == current_user.id,
-        )
-        .first()
+    # Opis NIE jest kopiowany do eventów — dziedziczą go przez referencję
+    # (Event.description = NULL), więc edycja opisu to zapis jednego wiersza
+    template = update_returning(
+        db,
+        ActivityTemplate,
+        template_id,
+        current_user.id,
+        payload.model_dump(exclude_unset=True),
     )
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-
-    for key, value in update_data.items():
-        setattr(template, key, value)
-
-    # Propaguj zmianę description do WSZYSTKICH powiązanych eventów
-    if "description" in update_data:
-        (
-            db.query(Event)
-            .filter(
-                Event.activity_template_id == template_id,
-                Event.user_id == current_user.id,
-            )
-            .update(
-                {Event.description: update_data["description"]},
-                synchronize_session="fetch",
-            )
-        )
-
+    out = ActivityTemplateOut.model_validate(template)
     db.commit()
-    db.refresh(template)
-    return template
+    return out
 
 
 @router.delete("/{template_id}", status_code=204)
@@ -101,5 +87,34 @@ def delete_template(
     )
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
+    # Eventy i serie tracą szablon, a dziedziczące opis (description = NULL)
+    # dostają jego kopię — jeden UPDATE na tabelę, z numerem zmiany dla /sync
+    changed = stamp(db, current_user.id)
+    db.execute(
+        update(Event)
+        .where(
+            Event.activity_template_id == template.id,
+            Event.user_id == current_user.id,
+        )
+        .values(
+            activity_template_id=None,
+            description=func.coalesce(Event.description, template.description),
+            **changed,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        update(EventSeries)
+        .where(
+            EventSeries.activity_template_id == template.id,
+            EventSeries.user_id == current_user.id,
+        )
+        .values(
+            activity_template_id=None,
+            description=func.coalesce(EventSeries.description, template.description),
+            **changed,
+        )
+        .execution_options(synchronize_session=False)
+    )
     db.delete(template)
     db.commit()
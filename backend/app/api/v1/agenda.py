@@ -0,0 +1,90 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, joinedload
+
+from app.api.deps import get_current_user
+from app.core.birthdays import birthdays_between
+from app.core.recurrence import series_in_window
+from app.db.base import get_db
+from app.models.eisenhower_task import EisenhowerTask, TaskStatus
+from app.models.event import Event
+from app.models.user import User
+from app.schemas.agenda import AgendaDayOut
+from app.schemas.eisenhower_task import EisenhowerTaskOut
+from app.schemas.event import EventOut
+
+router = APIRouter(prefix="/agenda", tags=["agenda"])
+
+MAX_AGENDA_DAYS = 31
+
+
+@router.get("", response_model=List[AgendaDayOut])
+def agenda(
+    from_: Optional[date] = Query(
+        None, alias="from", description="First local day (default: today)"
+    ),
+    days: int = Query(7, ge=1, le=MAX_AGENDA_DAYS),
+    timezone_name: str = Query("UTC", alias="timezone"),
+    include_birthdays: bool = Query(True),
+    include_tasks: bool = Query(True),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Agenda dzień po dniu (dni lokalne w `timezone`): eventy, wystąpienia
+    serii, urodziny kontaktów i otwarte taski z terminem. Każde źródło to
+    jedno zapytanie po indeksie okna — ix_events_user_period,
+    ix_contacts_user_birthday, ix_eisenhower_tasks_open_due.
+    """
+    try:
+        zone = ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    first = from_ or datetime.now(zone).date()
+    day_starts = [
+        datetime.combine(first + timedelta(days=i), time(0), tzinfo=zone)
+        for i in range(days + 1)
+    ]
+    start, end = day_starts[0], day_starts[-1]
+
+    events = [
+        EventOut.model_validate(ev)
+        for ev in db.query(Event)
+        .options(joinedload(Event.activity_template))
+        .filter(Event.user_id == current_user.id, Event.overlaps(start, end))
+    ]
+    events += series_in_window(db, current_user.id, start, end)
+    if include_birthdays:
+        events += birthdays_between(db, current_user.id, start, end, zone)
+    events.sort(key=lambda ev: ev.start_datetime)
+
+    tasks = []
+    if include_tasks:
+        tasks = [
+            EisenhowerTaskOut.model_validate(task)
+            for task in db.query(EisenhowerTask)
+            .filter(
+                EisenhowerTask.user_id == current_user.id,
+                # Dosłownie predykat indeksu częściowego otwartych tasków
+                EisenhowerTask.status != TaskStatus.DONE.value,
+                EisenhowerTask.due_date >= start,
+                EisenhowerTask.due_date < end,
+            )
+            .order_by(EisenhowerTask.due_date, EisenhowerTask.id)
+        ]
+
+    return [
+        AgendaDayOut(
+            date=day_start.date(),
+            events=[
+                ev
+                for ev in events
+                if ev.start_datetime < day_end and ev.end_datetime > day_start
+            ],
+            tasks=[task for task in tasks if day_start <= task.due_date < day_end],
+        )
+        for day_start, day_end in zip(day_starts, day_starts[1:])
+    ]
@@ -0,0 +1,294 @@
+import secrets
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.api.deps import get_current_user
+from app.core.ical import CALENDAR_FOOTER, calendar_header, vevent
+from app.db.base import SessionLocal, get_db
+from app.models.contact import Contact
+from app.models.eisenhower_task import EisenhowerTask, TaskStatus
+from app.models.event import Event
+from app.models.event_series import EventSeries
+from app.models.user import User
+from app.schemas.calendar_feed import CalendarFeedOut
+
+router = APIRouter(prefix="/calendar-feed", tags=["calendar-feed"])
+
+MEDIA_TYPE = "text/calendar; charset=utf-8"
+# Wiersze z kursora na jedną porcję strumienia
+STREAM_BATCH = 500
+# Wygenerowane feedy w pamięci procesu: (user_id, tasks, birthdays) →
+# (change_seq, treść); wpis jest ważny, dopóki change_seq usera się nie zmieni
+FEED_CACHE_SIZE = 128
+FEED_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+_feed_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_feed_cache_lock = threading.Lock()
+
+
+def _cache_get(key: tuple, version: int) -> Optional[bytes]:
+    with _feed_cache_lock:
+        entry = _feed_cache.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        _feed_cache.move_to_end(key)
+        return entry[1]
+
+
+def _cache_put(key: tuple, version: int, body: bytes) -> None:
+    if len(body) > FEED_CACHE_MAX_BYTES:
+        return
+    with _feed_cache_lock:
+        _feed_cache[key] = (version, body)
+        _feed_cache.move_to_end(key)
+        while len(_feed_cache) > FEED_CACHE_SIZE:
+            _feed_cache.popitem(last=False)
+
+
+def _feed_chunks(user_id: int, stamp: datetime, tasks: bool, birthdays: bool):
+    """
+    Treść .ics po kawałku — kursor po stronie serwera (yield_per), własna
+    sesja (sesja z get_db jest zamykana przed końcem odpowiedzi).
+    """
+    db = SessionLocal()
+    try:
+        yield calendar_header("ADHD Calendar")
+
+        events = db.scalars(
+            select(Event)
+            .options(joinedload(Event.activity_template))
+            .where(Event.user_id == user_id)
+            .order_by(Event.id)
+            .execution_options(yield_per=STREAM_BATCH)
+        )
+        for partition in events.partitions():
+            yield "".join(
+                vevent(
+                    f"event-{ev.id}@adhd-calendar",
+                    stamp,
+                    ev.title,
+                    ev.start_datetime,
+                    ev.end_datetime,
+                    description=(
+                        ev.description
+                        if ev.description is not None or ev.activity_template is None
+                        else ev.activity_template.description
+                    ),
+                    location=ev.location,
+                    transparent=ev.is_background,
+                )
+                for ev in partition
+            )
+
+        # Serie: RRULE + EXDATE dla odwołanych, osobny VEVENT z RECURRENCE-ID
+        # dla zmienionych wystąpień
+        series_result = db.scalars(
+            select(EventSeries)
+            .options(
+                joinedload(EventSeries.activity_template),
+                selectinload(EventSeries.exceptions),
+            )
+            .where(EventSeries.user_id == user_id)
+            .order_by(EventSeries.id)
+            .execution_options(yield_per=STREAM_BATCH)
+        )
+        for partition in series_result.partitions():
+            chunk = []
+            for series in partition:
+                uid = f"series-{series.id}@adhd-calendar"
+                description = series.description
+                if description is None and series.activity_template is not None:
+                    description = series.activity_template.description
+                duration = series.end_datetime - series.start_datetime
+                chunk.append(
+                    vevent(
+                        uid,
+                        stamp,
+                        series.title,
+                        series.start_datetime,
+                        series.end_datetime,
+                        description=description,
+                        location=series.location,
+                        rrule=series.rrule,
+                        exdates=[
+                            ex.original_start
+                            for ex in series.exceptions
+                            if ex.is_cancelled
+                        ],
+                        transparent=series.is_background,
+                    )
+                )
+                for ex in series.exceptions:
+                    if ex.is_cancelled:
+                        continue
+                    start = ex.start_datetime or ex.original_start
+                    chunk.append(
+                        vevent(
+                            uid,
+                            stamp,
+                            ex.title or series.title,
+                            start,
+                            ex.end_datetime or start + duration,
+                            description=(
+                                ex.description
+                                if ex.description is not None
+                                else description
+                            ),
+                            location=ex.location or series.location,
+                            recurrence_id=ex.original_start,
+                            transparent=series.is_background,
+                        )
+                    )
+            yield "".join(chunk)
+
+        if tasks:
+            task_result = db.scalars(
+                select(EisenhowerTask)
+                .where(
+                    EisenhowerTask.user_id == user_id,
+                    EisenhowerTask.due_date.isnot(None),
+                    EisenhowerTask.status != TaskStatus.DONE,
+                )
+                .order_by(EisenhowerTask.id)
+                .execution_options(yield_per=STREAM_BATCH)
+            )
+            for partition in task_result.partitions():
+                yield "".join(
+                    vevent(
+                        f"task-{task.id}@adhd-calendar",
+                        stamp,
+                        f"⏰ {task.title}",
+                        task.due_date,
+                        task.due_date,
+                        description=task.description,
+                        transparent=True,
+                    )
+                    for task in partition
+                )
+
+        if birthdays:
+            contact_result = db.scalars(
+                select(Contact)
+                .where(Contact.user_id == user_id, Contact.birthday.isnot(None))
+                .order_by(Contact.id)
+                .execution_options(yield_per=STREAM_BATCH)
+            )
+            for partition in contact_result.partitions():
+                yield "".join(
+                    vevent(
+                        f"birthday-{contact.id}@adhd-calendar",
+                        stamp,
+                        f"🎂 {contact.name}",
+                        contact.birthday,
+                        contact.birthday + timedelta(days=1),
+                        rrule="FREQ=YEARLY",
+                        transparent=True,
+                    )
+                    for contact in partition
+                )
+
+        yield CALENDAR_FOOTER
+    finally:
+        db.close()
+
+
+def _cached_stream(key: tuple, version: int, chunks):
+    """Przepuszcza strumień do klienta i po pełnym przebiegu zapisuje go w cache."""
+    parts = []
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        parts.append(data)
+        yield data
+    _cache_put(key, version, b"".join(parts))
+
+
+def _not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(",")]
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+@router.post("/token", response_model=CalendarFeedOut)
+def rotate_feed_token(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Nowy sekretny URL subskrypcji — poprzedni przestaje działać."""
+    current_user.feed_token = secrets.token_urlsafe(32)
+    token = current_user.feed_token
+    db.commit()
+    return CalendarFeedOut(token=token, path=f"/api/v1/calendar-feed/{token}.ics")
+
+
+@router.delete("/token", status_code=204)
+def disable_feed(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    current_user.feed_token = None
+    db.commit()
+
+
+@router.get("/{token}.ics")
+def calendar_feed(
+    token: str,
+    request: Request,
+    tasks: bool = Query(False, description="Include task due dates"),
+    birthdays: bool = Query(False, description="Include contact birthdays"),
+    db: Session = Depends(get_db),
+):
+    """
+    Feed .ics dla klientów kalendarza (bez logowania — sekret w URL-u).
+    Wersja = users.change_seq: ETag/Last-Modified pozwalają odpowiadać 304
+    jednym zapytaniem, niezmieniony feed idzie z cache, zmieniony jest
+    generowany strumieniowo.
+    """
+    row = (
+        db.query(User.id, User.change_seq, User.changed_at, User.created_at)
+        .filter(User.feed_token == token)
+        .first()
+    )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Feed not found")
+
+    last_modified = row.changed_at or row.created_at
+    etag = f'"{row.id}-{row.change_seq}-{int(tasks)}{int(birthdays)}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        ),
+        "Cache-Control": "private, no-cache",
+    }
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    key = (row.id, tasks, birthdays)
+    body = _cache_get(key, row.change_seq)
+    if body is not None:
+        return Response(body, media_type=MEDIA_TYPE, headers=headers)
+    return StreamingResponse(
+        _cached_stream(
+            key,
+            row.change_seq,
+            _feed_chunks(row.id, last_modified, tasks, birthdays),
+        ),
+        media_type=MEDIA_TYPE,
+        headers=headers,
+    )
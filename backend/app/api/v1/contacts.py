@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
 from app.db.base import get_db
+from app.db.writes import insert_returning, update_returning
 from app.models.contact import Contact
 from app.models.user import User
 from app.schemas.contact import ContactCreate, ContactUpdate, ContactOut
@@ -31,11 +32,12 @@ def create_contact(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    contact = Contact(**body.model_dump(), user_id=current_user.id)
-    db.add(contact)
+    contact = insert_returning(
+        db, Contact, {**body.model_dump(), "user_id": current_user.id}
+    )
+    out = ContactOut.model_validate(contact)
     db.commit()
-    db.refresh(contact)
-    return contact
+    return out
 
 
 @router.get("/{contact_id}", response_model=ContactOut)
@@ -61,18 +63,14 @@ def update_contact(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    contact = (
-        db.query(Contact)
-        .filter(Contact.id == contact_id, Contact.user_id == current_user.id)
-        .first()
+    contact = update_returning(
+        db, Contact, contact_id, current_user.id, body.model_dump(exclude_unset=True)
     )
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
-    for k, v in body.model_dump(exclude_unset=True).items():
-        setattr(contact, k, v)
+    out = ContactOut.model_validate(contact)
     db.commit()
-    db.refresh(contact)
-    return contact
+    return out
 
 
 @router.delete("/{contact_id}", status_code=204)
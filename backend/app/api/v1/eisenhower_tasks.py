@@ -1,31 +1,167 @@
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, case, func, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
+from app.core.archive import archived_tasks
+from app.core.pagination import cursor_datetime, decode_cursor, encode_cursor
+from app.core.ranking import REBALANCE_LENGTH, rank_between
+from app.core.scheduling import (
+    busy_intervals,
+    daily_windows,
+    free_intervals,
+    place_tasks,
+    rank_tasks,
+    task_quadrant,
+)
+from app.core.sync import next_change_seq, stamp
 from app.db.base import get_db
-from app.models.eisenhower_task import EisenhowerTask
+from app.db.ranks import rebalance_later, rebalance_quadrant
+from app.db.writes import insert_many_returning, insert_returning, update_returning
+from app.models.eisenhower_task import EisenhowerTask, TaskStatus
+from app.models.event import Event
 from app.models.user import User
 from app.schemas.eisenhower_task import (
+    AutoScheduledTask,
+    AutoScheduleOut,
+    AutoScheduleRequest,
     EisenhowerTaskCreate,
     EisenhowerTaskUpdate,
     EisenhowerTaskOut,
+    TaskReorderRequest,
 )
+from app.schemas.event import EventOut
 
 router = APIRouter(prefix="/eisenhower-tasks", tags=["eisenhower-tasks"])
 
+MAX_PAGE_SIZE = 1000
+
 
 @router.get("", response_model=List[EisenhowerTaskOut])
 def list_tasks(
+    response: Response,
+    quadrant: Optional[str] = Query(
+        None, pattern="^(do_first|schedule|delegate|eliminate)$"
+    ),
+    urgent: Optional[bool] = Query(None),
+    important: Optional[bool] = Query(None),
+    status: Optional[List[TaskStatus]] = Query(None),
+    due_from: Optional[datetime] = Query(None, description="due_date >= (inclusive)"),
+    due_to: Optional[datetime] = Query(None, description="due_date < (exclusive)"),
+    sort: str = Query("created_at", pattern="^(created_at|due_date|rank)$"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of previous page"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Page size (default: all)"
+    ),
+    include_archived: bool = Query(
+        False, description="Also read archived done tasks (without pagination)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return (
-        db.query(EisenhowerTask)
-        .filter(EisenhowerTask.user_id == current_user.id)
-        .order_by(EisenhowerTask.created_at)
-        .all()
+    """
+    Taski z filtrami i paginacją keyset (po sort + id; następna strona
+    w nagłówku X-Next-Cursor). Filtr statusu bez "done" trafia w częściowe
+    indeksy otwartych tasków — zapytanie macierzy nie rośnie z historią.
+    """
+    q = db.query(EisenhowerTask).filter(EisenhowerTask.user_id == current_user.id)
+    if quadrant is not None:
+        urgent = quadrant in ("do_first", "delegate")
+        important = quadrant in ("do_first", "schedule")
+    if urgent is not None:
+        q = q.filter(EisenhowerTask.urgent.is_(urgent))
+    if important is not None:
+        q = q.filter(EisenhowerTask.important.is_(important))
+    if status:
+        q = q.filter(EisenhowerTask.status.in_([s.value for s in status]))
+        if TaskStatus.DONE not in status:
+            # Dosłownie predykat indeksów częściowych — planner ich użyje
+            q = q.filter(EisenhowerTask.status != TaskStatus.DONE.value)
+    if due_from is not None:
+        q = q.filter(EisenhowerTask.due_date >= due_from)
+    if due_to is not None:
+        q = q.filter(EisenhowerTask.due_date < due_to)
+
+    key = getattr(EisenhowerTask, sort)
+    if cursor:
+        after, after_id = decode_cursor(cursor, 2)
+        if not isinstance(after_id, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if after is None:
+            # Strona w ogonie bez due_date / rank (NULLS LAST)
+            q = q.filter(key.is_(None), EisenhowerTask.id > after_id)
+        else:
+            if sort != "rank":
+                after = cursor_datetime(after)
+            elif not isinstance(after, str):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            q = q.filter(
+                or_(
+                    key > after,
+                    and_(key == after, EisenhowerTask.id > after_id),
+                    key.is_(None),
+                )
+            )
+    q = q.order_by(key.asc().nulls_last(), EisenhowerTask.id)
+    if include_archived:
+        if cursor or limit is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="include_archived cannot be combined with pagination",
+            )
+        return _with_archived(
+            [EisenhowerTaskOut.model_validate(task) for task in q],
+            archived_tasks(db, current_user.id),
+            sort,
+            urgent,
+            important,
+            status,
+            due_from,
+            due_to,
+        )
+    if limit is None:
+        return q.all()
+
+    page = q.limit(limit).all()
+    if len(page) == limit:
+        last = page[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(getattr(last, sort), last.id)
+    return page
+
+
+def _with_archived(
+    tasks: List[EisenhowerTaskOut],
+    archived: List[EisenhowerTaskOut],
+    sort: str,
+    urgent: Optional[bool],
+    important: Optional[bool],
+    status: Optional[List[TaskStatus]],
+    due_from: Optional[datetime],
+    due_to: Optional[datetime],
+) -> List[EisenhowerTaskOut]:
+    """Te same filtry i porządek co zapytanie — na taskach z archiwum, w pamięci."""
+    archived = [
+        task
+        for task in archived
+        if (urgent is None or task.urgent == urgent)
+        and (important is None or task.important == important)
+        and (not status or task.status in status)
+        and (due_from is None or (task.due_date and task.due_date >= due_from))
+        and (due_to is None or (task.due_date and task.due_date < due_to))
+    ]
+    if not archived:
+        return tasks
+    return sorted(
+        tasks + archived,
+        key=lambda task: (
+            getattr(task, sort) is None,
+            getattr(task, sort) or "",
+            task.id,
+        ),
     )
 
 
@@ -35,11 +171,258 @@ def create_task(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    task = EisenhowerTask(**payload.model_dump(), user_id=current_user.id)
-    db.add(task)
+    # Nowy task na końcu swojego kwadrantu. Numer zmiany (blokada wiersza
+    # usera) przed odczytem max(rank) — równoległe create czeka i widzi
+    # już wstawiony task, zamiast dostać ten sam klucz
+    next_change_seq(db, current_user.id)
+    last = db.scalar(
+        select(func.max(EisenhowerTask.rank)).where(
+            EisenhowerTask.user_id == current_user.id,
+            EisenhowerTask.urgent.is_(payload.urgent),
+            EisenhowerTask.important.is_(payload.important),
+        )
+    )
+    task = insert_returning(
+        db,
+        EisenhowerTask,
+        {
+            **payload.model_dump(),
+            "rank": rank_between(last, None),
+            "user_id": current_user.id,
+        },
+    )
+    out = EisenhowerTaskOut.model_validate(task)
     db.commit()
-    db.refresh(task)
-    return task
+    return out
+
+
+@router.post("/reorder", response_model=List[EisenhowerTaskOut])
+def reorder_tasks(
+    payload: TaskReorderRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Drag & drop w macierzy: każde przeniesienie dostaje klucz między
+    sąsiadami (app.core.ranking), więc zapisuje tylko przenoszony wiersz —
+    jeden SELECT (z blokadą) i jeden UPDATE na całą paczkę. Zbyt długie
+    klucze przebudowuje się w tle, po wysłaniu odpowiedzi.
+    """
+    # Wiersz usera przed wierszami tasków — ta sama kolejność blokad co
+    # create i przebudowa kwadrantu
+    next_change_seq(db, current_user.id)
+    ids = set()
+    for move in payload.moves:
+        ids.update(i for i in (move.task_id, move.after_id, move.before_id) if i)
+    state = {
+        row.id: [row.urgent, row.important, row.rank]
+        for row in db.execute(
+            select(
+                EisenhowerTask.id,
+                EisenhowerTask.urgent,
+                EisenhowerTask.important,
+                EisenhowerTask.rank,
+            )
+            .where(
+                EisenhowerTask.id.in_(ids), EisenhowerTask.user_id == current_user.id
+            )
+            .with_for_update()
+        )
+    }
+    if len(state) != len(ids):
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    moved = {}
+    for move in payload.moves:
+        task = state[move.task_id]
+        urgent = task[0] if move.urgent is None else move.urgent
+        important = task[1] if move.important is None else move.important
+        neighbours = []
+        for neighbour_id in (move.after_id, move.before_id):
+            if neighbour_id is None:
+                neighbours.append(None)
+                continue
+            if neighbour_id == move.task_id:
+                raise HTTPException(
+                    status_code=400, detail="Task cannot be its own neighbour"
+                )
+            neighbour = state[neighbour_id]
+            if (neighbour[0], neighbour[1]) != (urgent, important):
+                raise HTTPException(
+                    status_code=400, detail="Neighbour task is in another quadrant"
+                )
+            neighbours.append(neighbour[2])
+        lower, upper = neighbours
+        if move.after_id is None and move.before_id is None:
+            # Upuszczony w pustym miejscu — na koniec kwadrantu
+            lower = db.scalar(
+                select(func.max(EisenhowerTask.rank)).where(
+                    EisenhowerTask.user_id == current_user.id,
+                    EisenhowerTask.urgent.is_(urgent),
+                    EisenhowerTask.important.is_(important),
+                    EisenhowerTask.id != move.task_id,
+                )
+            )
+            # ...z uwzględnieniem przeniesionych wcześniej w tej paczce
+            ranks = [
+                m[2]
+                for i, m in moved.items()
+                if i != move.task_id and (m[0], m[1]) == (urgent, important)
+            ]
+            if lower is not None:
+                ranks.append(lower)
+            lower = max(ranks, default=None)
+        try:
+            if (move.after_id and lower is None) or (move.before_id and upper is None):
+                raise ValueError("neighbour without rank")
+            rank = rank_between(lower, upper)
+        except ValueError:
+            # Klient widzi nieaktualną kolejność (równoległa zmiana) albo
+            # sąsiad bez klucza — przebudowa kwadrantu jeszcze w tym żądaniu
+            # (zadania w tle przepadają przy wyjątku), potem ponowne pobranie
+            db.rollback()
+            rebalance_quadrant(db, current_user.id, urgent, important)
+            db.commit()
+            raise HTTPException(
+                status_code=409, detail="Task order is out of date, reload the list"
+            )
+        state[move.task_id] = [urgent, important, rank]
+        moved[move.task_id] = state[move.task_id]
+        if len(rank) > REBALANCE_LENGTH:
+            background_tasks.add_task(
+                rebalance_later, current_user.id, urgent, important
+            )
+
+    tasks = db.scalars(
+        update(EisenhowerTask)
+        .where(
+            EisenhowerTask.id.in_(moved),
+            EisenhowerTask.user_id == current_user.id,
+        )
+        .values(
+            urgent=case({i: m[0] for i, m in moved.items()}, value=EisenhowerTask.id),
+            important=case(
+                {i: m[1] for i, m in moved.items()}, value=EisenhowerTask.id
+            ),
+            rank=case({i: m[2] for i, m in moved.items()}, value=EisenhowerTask.id),
+            **stamp(db, current_user.id),
+        )
+        .returning(EisenhowerTask)
+        .execution_options(populate_existing=True)
+    ).all()
+    order = {task_id: i for i, task_id in enumerate(moved)}
+    out = sorted(
+        (EisenhowerTaskOut.model_validate(task) for task in tasks),
+        key=lambda task: order[task.id],
+    )
+    db.commit()
+    return out
+
+
+@router.post("/auto-schedule", response_model=AutoScheduleOut, status_code=201)
+def auto_schedule_tasks(
+    payload: AutoScheduleRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Rozkłada otwarte taski po wolnych slotach horyzontu i tworzy podpięte
+    eventy: jedno zapytanie o zajętość, jedno o taski, jeden INSERT eventów
+    i jeden UPDATE linked_event_id — niezależnie od liczby tasków.
+    """
+    try:
+        zone = ZoneInfo(payload.timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    prefs = current_user.preferences or {}
+    hour_start = payload.hour_start
+    if hour_start is None:
+        hour_start = prefs.get("hour_start", 8)
+    hour_end = payload.hour_end
+    if hour_end is None:
+        hour_end = prefs.get("hour_end", 22)
+    if hour_end <= hour_start:
+        raise HTTPException(status_code=400, detail="hour_end must be after hour_start")
+
+    start = payload.start
+    if start is None:
+        now = datetime.now(timezone.utc)
+        start = now.replace(second=0, microsecond=0) + timedelta(
+            minutes=15 - now.minute % 15
+        )
+    elif start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    end = start + timedelta(days=payload.days)
+
+    query = db.query(EisenhowerTask).filter(
+        EisenhowerTask.user_id == current_user.id,
+        EisenhowerTask.status != TaskStatus.DONE,
+        EisenhowerTask.linked_event_id.is_(None),
+    )
+    if payload.task_ids is not None:
+        query = query.filter(EisenhowerTask.id.in_(payload.task_ids))
+    tasks = [
+        task
+        for task in rank_tasks(query)
+        if payload.include_eliminate
+        or task_quadrant(task.urgent, task.important) != "eliminate"
+    ]
+    if not tasks:
+        return AutoScheduleOut(scheduled=[], unscheduled=[])
+
+    free = free_intervals(
+        daily_windows(start, end, hour_start, hour_end, zone),
+        busy_intervals(db, current_user.id, start, end),
+    )
+    placed = place_tasks(
+        tasks,
+        free,
+        timedelta(minutes=payload.duration_minutes),
+        timedelta(minutes=payload.gap_minutes),
+    )
+
+    now = datetime.now(timezone.utc)
+    scheduled = [(task, slot) for task, slot in placed if slot is not None]
+    rows = insert_many_returning(
+        db,
+        Event,
+        [
+            {
+                "title": task.title,
+                "start_datetime": slot_start,
+                "end_datetime": slot_end,
+                "eisenhower_quadrant": task_quadrant(task.urgent, task.important),
+                "is_background": False,
+                "user_id": current_user.id,
+                "created_at": now,
+            }
+            for task, (slot_start, slot_end) in scheduled
+        ],
+    )
+    links = {task.id: row["id"] for (task, _), row in zip(scheduled, rows)}
+    if links:
+        db.execute(
+            update(EisenhowerTask)
+            .where(
+                EisenhowerTask.id.in_(links),
+                EisenhowerTask.user_id == current_user.id,
+            )
+            .values(
+                linked_event_id=case(links, value=EisenhowerTask.id),
+                **stamp(db, current_user.id),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    out = AutoScheduleOut(
+        scheduled=[
+            AutoScheduledTask(task_id=task.id, event=EventOut.model_validate(row))
+            for (task, _), row in zip(scheduled, rows)
+        ],
+        unscheduled=[task.id for task, slot in placed if slot is None],
+    )
+    db.commit()
+    return out
 
 
 @router.get("/{task_id}", response_model=EisenhowerTaskOut)
@@ -69,21 +452,18 @@ def patch_task(
     current_user: User = Depends(get_current_user),
 ):
     """Update task — used for drag & drop between quadrants."""
-    task = (
-        db.query(EisenhowerTask)
-        .filter(
-            EisenhowerTask.id == task_id,
-            EisenhowerTask.user_id == current_user.id,
-        )
-        .first()
+    task = update_returning(
+        db,
+        EisenhowerTask,
+        task_id,
+        current_user.id,
+        payload.model_dump(exclude_unset=True),
     )
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    for key, value in payload.model_dump(exclude_unset=True).items():
-        setattr(task, key, value)
+    out = EisenhowerTaskOut.model_validate(task)
     db.commit()
-    db.refresh(task)
-    return task
+    return out
 
 
 @router.put("/{task_id}", response_model=EisenhowerTaskOut)
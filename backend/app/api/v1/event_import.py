@@ -0,0 +1,181 @@
+import io
+import json
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
+
+from app.api.deps import get_current_user
+from app.core.event_import import csv_records, ics_records
+from app.core.sync import stamp
+from app.db.base import SessionLocal
+from app.db.writes import copy_rows, insert_many_returning
+from app.models.activity_template import ActivityTemplate
+from app.models.event import Event
+from app.models.event_series import EventSeries, EventSeriesException
+from app.models.user import User
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+MAX_IMPORT_BYTES = 100 * 1024 * 1024
+# Wierszy events na jeden COPY (i jedną linię postępu)
+COPY_CHUNK = 5000
+# Serii (VEVENT z RRULE) na jeden INSERT ... RETURNING
+SERIES_CHUNK = 500
+# Ile komunikatów o pominiętych rekordach trafia do podsumowania
+MAX_REPORTED_ERRORS = 20
+
+EVENT_COLUMNS = [
+    "title",
+    "start_datetime",
+    "end_datetime",
+    "description",
+    "location",
+    "activity_template_id",
+    "user_id",
+    "is_background",
+    "created_at",
+    "updated_at",
+    "change_seq",
+]
+
+
+def _detect_format(upload: UploadFile) -> str:
+    name = (upload.filename or "").lower()
+    content_type = (upload.content_type or "").lower()
+    if name.endswith(".ics") or content_type.startswith("text/calendar"):
+        return "ics"
+    if name.endswith(".csv") or content_type in ("text/csv", "application/csv"):
+        return "csv"
+    raise HTTPException(status_code=400, detail="Unsupported file type (.ics or .csv)")
+
+
+def _progress(status: str, counts: dict, position: int, total: int, **extra) -> str:
+    return (
+        json.dumps(
+            {
+                "status": status,
+                **counts,
+                "bytes_read": min(position, total),
+                "total_bytes": total,
+                **extra,
+            }
+        )
+        + "\n"
+    )
+
+
+def _flush_series(db, pending: list) -> None:
+    """Serie jednym INSERT ... RETURNING, potem ich EXDATE jako odwołane wystąpienia."""
+    rows = insert_many_returning(db, EventSeries, [values for values, _ in pending])
+    exceptions = [
+        {"series_id": row["id"], "original_start": exdate, "is_cancelled": True}
+        for row, (_, exdates) in zip(rows, pending)
+        for exdate in dict.fromkeys(exdates)
+    ]
+    if exceptions:
+        db.execute(insert(EventSeriesException.__table__), exceptions)
+
+
+def _run_import(user_id: int, fmt: str, zone: ZoneInfo, source, total: int):
+    """
+    Parsuje plik strumieniowo i ładuje eventy porcjami przez COPY — w pamięci
+    jest naraz tylko jedna porcja wierszy. Całość w jednej transakcji: błąd
+    = nic nie zostaje zapisane. Każda porcja to linia postępu NDJSON.
+    """
+    db = SessionLocal()
+    counts = {"imported": 0, "series": 0, "skipped": 0}
+    errors = []
+    try:
+        templates = {
+            template.name.lower(): template
+            for template in db.query(ActivityTemplate).filter(
+                ActivityTemplate.user_id == user_id
+            )
+        }
+        base = {
+            "user_id": user_id,
+            "is_background": False,
+            "created_at": datetime.now(timezone.utc),
+            **stamp(db, user_id),
+        }
+        text = io.TextIOWrapper(
+            source, encoding="utf-8-sig", errors="replace", newline=""
+        )
+        parse = ics_records if fmt == "ics" else csv_records
+
+        chunk, series = [], []
+        for kind, values, exdates, error in parse(text, zone, templates):
+            if kind == "event":
+                chunk.append({**values, **base})
+                if len(chunk) >= COPY_CHUNK:
+                    counts["imported"] += copy_rows(db, Event, EVENT_COLUMNS, chunk)
+                    chunk = []
+                    yield _progress("progress", counts, source.tell(), total)
+            elif kind == "series":
+                series.append(({**values, **base}, exdates))
+                if len(series) >= SERIES_CHUNK:
+                    _flush_series(db, series)
+                    counts["series"] += len(series)
+                    series = []
+            else:
+                counts["skipped"] += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(error)
+
+        counts["imported"] += copy_rows(db, Event, EVENT_COLUMNS, chunk)
+        if series:
+            _flush_series(db, series)
+            counts["series"] += len(series)
+        db.commit()
+        yield _progress("done", counts, total, total, errors=errors)
+    except ValueError as exc:
+        # Np. CSV bez kolumny start — nic nie zostaje zapisane
+        db.rollback()
+        yield _progress(
+            "error",
+            {"imported": 0, "series": 0, "skipped": counts["skipped"]},
+            total,
+            total,
+            detail=str(exc),
+        )
+    finally:
+        db.close()
+        source.close()
+
+
+@router.post("/events")
+def import_events(
+    file: UploadFile = File(...),
+    timezone_name: str = Query(
+        "UTC", alias="timezone", description="Zone for floating/all-day times"
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Import .ics / CSV. Odpowiedź to NDJSON z postępem (co COPY_CHUNK eventów)
+    i podsumowaniem na końcu. Szablony dopasowywane po nazwie
+    (CATEGORIES w .ics, kolumna template/category w CSV).
+    """
+    fmt = _detect_format(file)
+    try:
+        zone = ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    if file.size is not None and file.size > MAX_IMPORT_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    # UploadFile jest zamykany zanim odpowiedź strumieniowa się skończy —
+    # własna kopia na dysku (nie w pamięci) żyje do końca importu
+    source = tempfile.TemporaryFile()
+    shutil.copyfileobj(file.file, source, 1024 * 1024)
+    total = source.tell()
+    source.seek(0)
+    return StreamingResponse(
+        _run_import(current_user.id, fmt, zone, source, total),
+        media_type="application/x-ndjson",
+    )
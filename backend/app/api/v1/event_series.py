@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import AwareDatetime
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.api.deps import get_current_user
+from app.core.recurrence import expand_series, occurrence_exists
+from app.db.base import get_db
+from app.models.event_series import EventSeries, EventSeriesException
+from app.models.user import User
+from app.schemas.event import EventOut
+from app.schemas.event_series import EventOccurrenceUpdate, EventSeriesOut
+
+router = APIRouter(prefix="/event-series", tags=["event-series"])
+
+
+def _get_series(db: Session, series_id: int, user_id: int) -> EventSeries:
+    series = (
+        db.query(EventSeries)
+        .options(
+            joinedload(EventSeries.activity_template),
+            selectinload(EventSeries.exceptions),
+        )
+        .filter(EventSeries.id == series_id, EventSeries.user_id == user_id)
+        .first()
+    )
+    if not series:
+        raise HTTPException(status_code=404, detail="Series not found")
+    return series
+
+
+def _get_or_create_exception(
+    series: EventSeries, original_start: datetime
+) -> EventSeriesException:
+    if not occurrence_exists(series, original_start):
+        raise HTTPException(status_code=404, detail="Occurrence not found")
+    for ex in series.exceptions:
+        if ex.original_start == original_start:
+            return ex
+    ex = EventSeriesException(original_start=original_start, is_cancelled=False)
+    series.exceptions.append(ex)
+    return ex
+
+
+@router.get("", response_model=List[EventSeriesOut])
+def list_series(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return (
+        db.query(EventSeries)
+        .options(
+            joinedload(EventSeries.activity_template),
+            selectinload(EventSeries.exceptions),
+        )
+        .filter(EventSeries.user_id == current_user.id)
+        .order_by(EventSeries.start_datetime)
+        .all()
+    )
+
+
+@router.get("/{series_id}", response_model=EventSeriesOut)
+def get_series(
+    series_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return _get_series(db, series_id, current_user.id)
+
+
+@router.delete("/{series_id}", status_code=204)
+def delete_series(
+    series_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Usuwa całą serię — jeden wiersz (+ wyjątki kaskadowo)."""
+    series = (
+        db.query(EventSeries)
+        .filter(EventSeries.id == series_id, EventSeries.user_id == current_user.id)
+        .first()
+    )
+    if not series:
+        raise HTTPException(status_code=404, detail="Series not found")
+    db.delete(series)
+    db.commit()
+
+
+@router.put("/{series_id}/occurrences", response_model=EventOut)
+def update_occurrence(
+    series_id: int,
+    payload: EventOccurrenceUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Nadpisuje pola jednego wystąpienia (zapisywane jako wyjątek serii)."""
+    series = _get_series(db, series_id, current_user.id)
+    ex = _get_or_create_exception(series, payload.original_start)
+
+    for key, value in payload.model_dump(
+        exclude_unset=True, exclude={"original_start"}
+    ).items():
+        setattr(ex, key, value)
+    ex.is_cancelled = False
+
+    start = ex.start_datetime or ex.original_start
+    end = ex.end_datetime or start + (series.end_datetime - series.start_datetime)
+    if end <= start:
+        raise HTTPException(
+            status_code=400, detail="end_datetime must be after start_datetime"
+        )
+
+    db.commit()
+    occurrences = [
+        occ
+        for occ in expand_series(series, start, end)
+        if occ.occurrence_start == payload.original_start
+    ]
+    return occurrences[0]
+
+
+@router.delete("/{series_id}/occurrences", status_code=204)
+def delete_occurrence(
+    series_id: int,
+    original_start: AwareDatetime = Query(
+        ..., description="Start of the occurrence (with UTC offset)"
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Odwołuje jedno wystąpienie serii (wyjątek is_cancelled)."""
+    series = _get_series(db, series_id, current_user.id)
+    ex = _get_or_create_exception(series, original_start)
+    ex.is_cancelled = True
+    db.commit()
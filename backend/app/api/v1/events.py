@@ -1,20 +1,84 @@
-from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from datetime import date, datetime, time, timezone, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import (
+    Integer,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+    values as sa_values,
+)
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.api.deps import get_current_user
-from app.db.base import get_db
+from app.core.archive import archived_events
+from app.core.birthdays import birthdays_between
+from app.core.analytics import bucket_expr, bucket_start, day_bucket_expr
+from app.core.conflicts import sweep_conflicts
+from app.core.pagination import cursor_datetime, decode_cursor, encode_cursor
+from app.core.recurrence import (
+    expand_series,
+    interval_days_rule,
+    series_in_window,
+    series_until,
+)
+from app.core.sync import next_change_seq, record_deletes, stamp
+from app.db.base import SessionLocal, get_db
+from app.db.writes import insert_many_returning, insert_returning, update_returning
 from app.models.activity_template import ActivityTemplate
 from app.models.eisenhower_task import EisenhowerTask
 from app.models.event import Event
+from app.models.event_series import EventSeries
+from app.models.event_time_rollup import EventTimeRollup
 from app.models.user import User
-from app.schemas.event import EventCreate, EventUpdate, EventOut
+from app.schemas.activity_template import ActivityTemplateOut
+from app.schemas.event_batch import (
+    EventBatchRequest,
+    EventBatchResult,
+    event_batch_operation_adapter,
+)
+from app.schemas.event_summary import (
+    EventSummaryOut,
+    SummaryBucketOut,
+    TemplateBucketOut,
+    TimeSpentOut,
+)
+from app.schemas.event_range import EventRangeCopy, EventRangeShift, EventRangeSummary
+from app.schemas.event import (
+    MAX_REMINDER_MINUTES,
+    EventConflictOut,
+    EventCreate,
+    EventListNormalized,
+    EventOut,
+    EventSlimOut,
+    EventUpdate,
+    EventWithConflictsOut,
+)
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+# Listowanie bez week_start — rozmiar strony i paczki strumienia
+PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH = 500
+# /events/summary — najdłuższy zakres (ok. 5 lat)
+MAX_SUMMARY_DAYS = 5 * 366
+# copy-range / shift-range — najszerszy zakres źródłowy (kwartał); zakres
+# docelowy ma tę samą szerokość
+MAX_RANGE_DAYS = 93
+
 
 # ── Schema dla eventów cyklicznych ────────────────────────────────────────────
 class RecurringEventCreate(BaseModel):
@@ -27,45 +91,644 @@ class RecurringEventCreate(BaseModel):
     # Powtarzanie: interval_days = co ile dni generować wystąpienia
     interval_days: int  # np. 7 = co tydzień, 30 = co miesiąc, 365 = co rok
     occurrences: int  # ile wystąpień wygenerować (max 730)
+    # True = stary tryb: każde wystąpienie jako osobny wiersz events
+    # (np. gdy wystąpienia mają być linkowane z taskami). Domyślnie jeden
+    # wiersz event_series — wystąpienia bez id, adresowane przez
+    # (series_id, occurrence_start) w /event-series
+    materialize: bool = False
+    reminder_minutes: Optional[int] = Field(None, ge=0, le=MAX_REMINDER_MINUTES)
+
+
+def _get_template(
+    db: Session, template_id: Optional[int], user_id: int
+) -> Optional[ActivityTemplate]:
+    """Szablon usera (jeden SELECT) albo 404 — None gdy template_id nie podano."""
+    if template_id is None:
+        return None
+    template = db.get(ActivityTemplate, template_id)
+    if not template or template.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Template not found")
+    return template
+
+
+def _inherit_description(data: dict, template: Optional[ActivityTemplate]) -> dict:
+    """
+    Opis równy opisowi szablonu nie jest kopiowany do eventu — NULL oznacza
+    dziedziczenie (EventOut rozwiązuje go z activity_template przy odczycie).
+    """
+    if template is not None and data.get("description") == template.description:
+        data["description"] = None
+    return data
+
+
+def _event_out(event: Event, template: Optional[ActivityTemplate] = None) -> EventOut:
+    """
+    EventOut z obiektu po INSERT/UPDATE ... RETURNING. Znany już szablon jest
+    podpinany bez zapytania; w przeciwnym razie relacja ładuje się z identity
+    map (albo jednym SELECT-em po kluczu).
+    """
+    if template is not None:
+        set_committed_value(event, "activity_template", template)
+    return EventOut.model_validate(event)
+
+
+def _bulk_insert_events(
+    db: Session, rows: List[dict], templates: Dict[int, ActivityTemplate]
+) -> List[EventOut]:
+    """
+    Jeden INSERT ... VALUES (...), (...) RETURNING dla wszystkich wierszy
+    (insertmanyvalues) — odpowiedź budowana z RETURNING, bez refresh/re-query.
+    Wiersze muszą mieć te same klucze; `templates` = już załadowane szablony.
+    """
+    return [
+        EventOut.model_validate(
+            {**row, "activity_template": templates.get(row["activity_template_id"])}
+        )
+        for row in insert_many_returning(db, Event, rows)
+    ]
+
+
+def _bulk_update_events(
+    db: Session, user_id: int, keys: Tuple[str, ...], items: List[Tuple[int, dict]]
+) -> Dict[int, dict]:
+    """
+    Wiele eventów z tym samym zestawem zmienianych kolumn jednym
+    UPDATE ... FROM (VALUES ...) RETURNING. Zwraca id → wiersz po zmianie.
+    """
+    table = Event.__table__
+    v = sa_values(
+        column("id", Integer),
+        *[column(key, table.c[key].type) for key in keys],
+        name="v",
+    ).data([(event_id, *[data[key] for key in keys]) for event_id, data in items])
+    stmt = (
+        update(table)
+        .where(table.c.id == v.c.id, table.c.user_id == user_id)
+        # CAST — kolumna VALUES z samymi NULL-ami ma w PostgreSQL typ text
+        .values(
+            {
+                **{key: cast(v.c[key], table.c[key].type) for key in keys},
+                **stamp(db, user_id),
+            }
+        )
+        .returning(*table.c)
+    )
+    return {row["id"]: dict(row) for row in db.execute(stmt).mappings()}
+
+
+def _bulk_delete_events(db: Session, user_id: int, ids: List[int]) -> set:
+    """DELETE ... WHERE id IN (...) RETURNING id — zwraca faktycznie usunięte id."""
+    stamped = stamp(db, user_id)
+    # Odpięcie tasków (jak ORM przy db.delete(event)) — FK linked_event_id
+    tasks = EisenhowerTask.__table__
+    db.execute(
+        update(tasks)
+        .where(tasks.c.linked_event_id.in_(ids), tasks.c.user_id == user_id)
+        .values(linked_event_id=None, **stamped)
+    )
+    table = Event.__table__
+    deleted = set(
+        db.execute(
+            delete(table)
+            .where(table.c.id.in_(ids), table.c.user_id == user_id)
+            .returning(table.c.id)
+        ).scalars()
+    )
+    record_deletes(db, user_id, "events", deleted)
+    return deleted
+
+
+def _load_templates(
+    db: Session, user_id: int, ids: set, known: Dict[int, ActivityTemplate]
+) -> Dict[int, ActivityTemplate]:
+    """Dociąga brakujące szablony usera jednym zapytaniem IN."""
+    missing = {tid for tid in ids if tid is not None and tid not in known}
+    if missing:
+        for tpl in db.query(ActivityTemplate).filter(
+            ActivityTemplate.id.in_(missing), ActivityTemplate.user_id == user_id
+        ):
+            known[tpl.id] = tpl
+    return known
+
+
+def _inverted_updates(db: Session, user_id: int, items: Dict[int, dict]) -> set:
+    """
+    Id eventów, którym zmiana tylko początku albo tylko końca dałaby
+    end <= start (tstzrange w ix_events_user_period rzuca wtedy błąd).
+    Obie granice naraz sprawdza już EventUpdate; tu jeden SELECT ... FOR UPDATE
+    dla wszystkich zmian jednej granicy.
+    """
+    partial = {
+        event_id: data
+        for event_id, data in items.items()
+        if ("start_datetime" in data) != ("end_datetime" in data)
+    }
+    if not partial:
+        return set()
+    rows = db.execute(
+        select(Event.id, Event.start_datetime, Event.end_datetime)
+        .where(Event.id.in_(partial), Event.user_id == user_id)
+        .with_for_update()
+    )
+    inverted = set()
+    for event_id, start, end in rows:
+        data = partial[event_id]
+        start = data.get("start_datetime", start)
+        end = data.get("end_datetime", end)
+        if start is not None and end is not None and end <= start:
+            inverted.add(event_id)
+    return inverted
+
+
+def _apply_event_update(
+    db: Session, user_id: int, event_id: int, payload: EventUpdate
+) -> EventOut:
+    """UPDATE eventu (bez commitu) z obsługą opisu dziedziczonego z szablonu."""
+    update_data = payload.model_dump(exclude_unset=True)
+    if _inverted_updates(db, user_id, {event_id: update_data}):
+        raise HTTPException(
+            status_code=422, detail="end_datetime must be after start_datetime"
+        )
+    override = update_data.pop("description_override", None)
+    has_desc = "description" in update_data
+    new_desc = update_data.pop("description", None)
+
+    to_template = has_desc and not override
+    if override is False:
+        # Powrót do opisu z szablonu
+        update_data["description"] = None
+    elif has_desc and override:
+        update_data["description"] = new_desc
+    elif has_desc:
+        # Event bez szablonu trzyma opis sam; z szablonem — opis trafia do
+        # szablonu (jeden wiersz), a event dziedziczy go przez referencję
+        if "activity_template_id" in update_data:
+            templated = update_data["activity_template_id"] is not None
+            update_data["description"] = None if templated else new_desc
+        else:
+            update_data["description"] = case(
+                (Event.activity_template_id.is_(None), new_desc), else_=None
+            )
+
+    event = update_returning(db, Event, event_id, user_id, update_data)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    template = None
+    if to_template and event.activity_template_id:
+        template = update_returning(
+            db,
+            ActivityTemplate,
+            event.activity_template_id,
+            user_id,
+            {"description": new_desc},
+        )
+        if not template:
+            raise HTTPException(status_code=404, detail="Template not found")
+
+    return _event_out(event, template)
+
+
+def _range_filter(
+    user_id: int, start: datetime, end: datetime, template_id: Optional[int]
+) -> list:
+    """Eventy usera zaczynające się w [start, end) — ix_events_user_start."""
+    if end <= start:
+        raise HTTPException(status_code=400, detail="Range end must be after start")
+    if end - start > timedelta(days=MAX_RANGE_DAYS):
+        raise HTTPException(status_code=400, detail="Range too large")
+    table = Event.__table__
+    conditions = [
+        table.c.user_id == user_id,
+        table.c.start_datetime >= start,
+        table.c.start_datetime < end,
+    ]
+    if template_id is not None:
+        conditions.append(table.c.activity_template_id == template_id)
+    return conditions
+
+
+def _range_summary(
+    count: int, start: datetime, end: datetime, offset: timedelta
+) -> EventRangeSummary:
+    return EventRangeSummary(
+        count=count,
+        offset_minutes=int(offset.total_seconds() // 60),
+        target_start=start + offset,
+        target_end=end + offset,
+    )
+
+
+def _find_conflicts(
+    db: Session,
+    user_id: int,
+    candidates: List[Tuple[int, datetime, datetime]],
+    exclude_ids: frozenset = frozenset(),
+    exclude_series_id: Optional[int] = None,
+) -> Dict[int, List[EventConflictOut]]:
+    """
+    Kolizje kandydatów z eventami usera (bez is_background): jedno zapytanie
+    po ix_events_user_period na całe okno kandydatów + wystąpienia serii,
+    potem zamiatarka w pamięci. Seria cykliczna = wszystkie wystąpienia naraz.
+    """
+    if not candidates:
+        return {}
+    window_start = min(start for _, start, _ in candidates)
+    window_end = max(end for _, _, end in candidates)
+    query = db.query(
+        Event.id, Event.title, Event.start_datetime, Event.end_datetime
+    ).filter(
+        Event.user_id == user_id,
+        Event.overlaps(window_start, window_end),
+        Event.is_background.is_(False),
+    )
+    if exclude_ids:
+        query = query.filter(Event.id.notin_(exclude_ids))
+    existing = [EventConflictOut.model_validate(row) for row in query]
+    existing.extend(
+        EventConflictOut.model_validate(occurrence)
+        for occurrence in series_in_window(db, user_id, window_start, window_end)
+        if not occurrence.is_background and occurrence.series_id != exclude_series_id
+    )
+    return sweep_conflicts(candidates, existing)
+
 
+def _with_conflicts(
+    events: List[EventOut], conflicts: Dict[int, List[EventConflictOut]]
+) -> List[EventWithConflictsOut]:
+    """Dokleja listy kolizji (klucz = pozycja na liście) do wyniku zapisu."""
+    return [
+        EventWithConflictsOut(
+            **event.model_dump(exclude={"activity_template"}),
+            activity_template=event.activity_template,
+            conflicts=[] if event.is_background else conflicts.get(index, []),
+        )
+        for index, event in enumerate(events)
+    ]
+
+
+def _conflict_candidates(
+    events: List[EventOut],
+) -> List[Tuple[int, datetime, datetime]]:
+    return [
+        (index, event.start_datetime, event.end_datetime)
+        for index, event in enumerate(events)
+        if not event.is_background
+    ]
+
+
+def _ndjson_events(user_id: int):
+    """
+    Strumień NDJSON całej historii usera — kursor po stronie serwera (yield_per),
+    więc w pamięci jest naraz tylko jedna paczka wierszy. Własna sesja, bo
+    sesja z get_db jest zamykana zanim odpowiedź zostanie w całości wysłana.
+    """
+    db = SessionLocal()
+    try:
+        q = (
+            db.query(Event)
+            .options(joinedload(Event.activity_template))
+            .filter(Event.user_id == user_id)
+            .order_by(Event.start_datetime, Event.id)
+            .yield_per(STREAM_BATCH)
+        )
+        for ev in q:
+            yield EventOut.model_validate(ev).model_dump_json() + "\n"
+    finally:
+        db.close()
+
+
+def _normalized_response(
+    db: Session,
+    user_id: int,
+    events: List[Event],
+    occurrences: List[EventOut],
+    headers: Optional[dict] = None,
+) -> Response:
+    """
+    shape=normalized: eventy z samym activity_template_id + zdeduplikowana mapa
+    szablonów (jedno zapytanie IN). Serializacja wprost do JSON przez
+    pydantic-core, z pominięciem walidacji response_model.
+    """
+    slim = [EventSlimOut.model_validate(ev) for ev in events]
+    templates = {}
+    for occ in occurrences:
+        slim.append(EventSlimOut.model_validate(occ))
+        if occ.activity_template is not None:
+            templates[occ.activity_template.id] = occ.activity_template
+    if occurrences:
+        slim.sort(key=lambda ev: ev.start_datetime)
+
+    missing = {
+        ev.activity_template_id
+        for ev in slim
+        if ev.activity_template_id is not None
+        and ev.activity_template_id not in templates
+    }
+    if missing:
+        for tpl in db.query(ActivityTemplate).filter(
+            ActivityTemplate.id.in_(missing), ActivityTemplate.user_id == user_id
+        ):
+            templates[tpl.id] = ActivityTemplateOut.model_validate(tpl)
+
+    body = EventListNormalized(events=slim, templates=templates)
+    return Response(
+        content=body.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
 
-@router.get("", response_model=List[EventOut])
+
+def _template_buckets(per_template: Dict[Optional[int], list]) -> list:
+    """szablon → [liczba, minuty] → TemplateBucketOut, najwięcej minut najpierw."""
+    return [
+        TemplateBucketOut(
+            activity_template_id=template_id, count=count, minutes=round(minutes)
+        )
+        for template_id, (count, minutes) in sorted(
+            per_template.items(), key=lambda item: -item[1][1]
+        )
+    ]
+
+
+def _summary_buckets(totals: Dict[date, Dict[Optional[int], list]]) -> list:
+    """kubełek → szablon → [liczba, minuty] → posortowane SummaryBucketOut."""
+    buckets = []
+    for bucket_day in sorted(totals):
+        templates = _template_buckets(totals[bucket_day])
+        buckets.append(
+            SummaryBucketOut(
+                start=bucket_day,
+                count=sum(t.count for t in templates),
+                minutes=round(
+                    sum(minutes for _, minutes in totals[bucket_day].values())
+                ),
+                templates=templates,
+            )
+        )
+    return buckets
+
+
+@router.get(
+    "",
+    # shape=normalized → EventListNormalized; stream=true → NDJSON z EventOut
+    response_model=Union[List[EventOut], EventListNormalized],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
 def list_events(
+    response: Response,
     week_start: Optional[str] = Query(None, description="YYYY-MM-DD of week start"),
     days: Optional[int] = Query(
         None, description="Number of days to fetch (default 7)"
     ),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor from the previous page (without week_start)"
+    ),
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = Query(False, description="Stream full history as NDJSON"),
+    shape: str = Query(
+        "full",
+        pattern="^(full|normalized)$",
+        description="normalized = events + deduplicated templates map",
+    ),
+    include_archived: bool = Query(
+        False, description="Also read archived events (requires week_start)"
+    ),
+    include_birthdays: bool = Query(
+        False, description="Merge in contact birthdays (requires week_start)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = (
-        db.query(Event)
-        .options(joinedload(Event.activity_template))
-        .filter(Event.user_id == current_user.id)
+    normalized = shape == "normalized"
+    q = db.query(Event).filter(Event.user_id == current_user.id)
+    if not normalized:
+        q = q.options(joinedload(Event.activity_template))
+    if not week_start:
+        if include_archived:
+            raise HTTPException(
+                status_code=400, detail="include_archived requires week_start"
+            )
+        if include_birthdays:
+            raise HTTPException(
+                status_code=400, detail="include_birthdays requires week_start"
+            )
+        # Bez okna: cała historia — strumieniowo albo stronami keyset po
+        # (start_datetime, id). Wystąpienia serii są dostępne przez /event-series.
+        if stream:
+            return StreamingResponse(
+                _ndjson_events(current_user.id), media_type="application/x-ndjson"
+            )
+        if cursor:
+            after_start, after_id = decode_cursor(cursor, 2)
+            after_start = cursor_datetime(after_start)
+            if not isinstance(after_id, int):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            # start >= X jako warunek indeksu ix_events_user_start, id rozstrzyga remisy
+            q = q.filter(
+                Event.start_datetime >= after_start,
+                or_(Event.start_datetime > after_start, Event.id > after_id),
+            )
+        page = q.order_by(Event.start_datetime, Event.id).limit(limit).all()
+        headers = {}
+        if len(page) == limit:
+            last = page[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.start_datetime, last.id)
+        if normalized:
+            return _normalized_response(db, current_user.id, page, [], headers)
+        response.headers.update(headers)
+        return page
+
+    try:
+        start = datetime.fromisoformat(week_start).replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid week_start format")
+    num_days = max(1, min(days, 31)) if days else 7
+    end = start + timedelta(days=num_days)
+    # Nakładanie się przedziałów (nie tylko start w oknie) — łapie też eventy
+    # wielodniowe zaczęte przed oknem; obsługiwane przez ix_events_user_period
+    events = q.filter(Event.overlaps(start, end)).order_by(Event.start_datetime).all()
+
+    occurrences = series_in_window(db, current_user.id, start, end)
+    if include_archived:
+        # Zimne archiwum — tylko na wyraźne żądanie (app.core.archive)
+        occurrences += archived_events(db, current_user.id, start, end)
+    if include_birthdays:
+        occurrences += birthdays_between(db, current_user.id, start, end)
+    if normalized:
+        return _normalized_response(db, current_user.id, events, occurrences)
+    if not occurrences:
+        return events
+    return sorted(
+        [EventOut.model_validate(ev) for ev in events] + occurrences,
+        key=lambda ev: ev.start_datetime,
+    )
+
+
+@router.get("/summary", response_model=EventSummaryOut)
+def event_summary(
+    from_: date = Query(..., alias="from", description="First day (inclusive)"),
+    to: date = Query(..., description="Last day (exclusive)"),
+    bucket: str = Query("day", pattern="^(day|week|month)$"),
+    timezone_name: str = Query("UTC", alias="timezone"),
+    include_background: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Heatmapa miesiąca/roku: liczba eventów i minuty na kubełek i szablon.
+    Jedno zapytanie GROUP BY date_trunc(...) po ix_events_user_start —
+    odpowiedź rośnie z liczbą kubełków, nie eventów. Event liczy się
+    w kubełku swojego początku; wystąpienia serii są doliczane w pamięci.
+    """
+    if to <= from_:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if (to - from_).days > MAX_SUMMARY_DAYS:
+        raise HTTPException(status_code=400, detail="Range too large")
+    try:
+        zone = ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    start = datetime.combine(from_, time(0), tzinfo=zone)
+    end = datetime.combine(to, time(0), tzinfo=zone)
+
+    key = bucket_expr(bucket, zone.key, Event.start_datetime)
+    minutes = func.sum(
+        func.extract("epoch", Event.end_datetime - Event.start_datetime) / 60
+    )
+    q = db.query(key, Event.activity_template_id, func.count(), minutes).filter(
+        Event.user_id == current_user.id,
+        Event.start_datetime >= start,
+        Event.start_datetime < end,
+    )
+    if not include_background:
+        q = q.filter(Event.is_background.is_(False))
+
+    # kubełek → szablon → [liczba, minuty]
+    totals: Dict[date, Dict[Optional[int], list]] = {}
+    for bucket_day, template_id, count, total in q.group_by(
+        key, Event.activity_template_id
+    ):
+        totals.setdefault(bucket_day, {})[template_id] = [count, float(total or 0)]
+    for occurrence in series_in_window(db, current_user.id, start, end):
+        if occurrence.start_datetime < start or (
+            occurrence.is_background and not include_background
+        ):
+            continue
+        slot = totals.setdefault(
+            bucket_start(occurrence.start_datetime, bucket, zone), {}
+        ).setdefault(occurrence.activity_template_id, [0, 0.0])
+        slot[0] += 1
+        slot[1] += (
+            occurrence.end_datetime - occurrence.start_datetime
+        ).total_seconds() / 60
+
+    return EventSummaryOut(
+        bucket=bucket,
+        timezone=zone.key,
+        start=from_,
+        end=to,
+        buckets=_summary_buckets(totals),
     )
-    if week_start:
-        try:
-            start = datetime.fromisoformat(week_start).replace(tzinfo=timezone.utc)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid week_start format")
-        num_days = max(1, min(days, 31)) if days else 7
-        end = start + timedelta(days=num_days)
-        q = q.filter(Event.start_datetime >= start, Event.start_datetime < end)
-    return q.order_by(Event.start_datetime).all()
 
 
-@router.post("", response_model=EventOut, status_code=201)
+@router.get("/time-spent", response_model=TimeSpentOut)
+def time_spent(
+    from_: date = Query(..., alias="from", description="First UTC day (inclusive)"),
+    to: date = Query(..., description="Last UTC day (exclusive)"),
+    bucket: str = Query("day", pattern="^(day|week|month)$"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Czas per szablon z rollupu event_time_rollups (dni UTC, bez eventów
+    w tle) — koszt rośnie z liczbą dni i szablonów, nie eventów.
+    Wystąpienia serii są doliczane w pamięci, jak w /summary.
+    """
+    if to <= from_:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if (to - from_).days > MAX_SUMMARY_DAYS:
+        raise HTTPException(status_code=400, detail="Range too large")
+
+    key = day_bucket_expr(bucket, EventTimeRollup.day)
+    rows = (
+        db.query(
+            key,
+            EventTimeRollup.activity_template_id,
+            func.sum(EventTimeRollup.count),
+            func.sum(EventTimeRollup.seconds),
+        )
+        .filter(
+            EventTimeRollup.user_id == current_user.id,
+            EventTimeRollup.day >= from_,
+            EventTimeRollup.day < to,
+        )
+        .group_by(key, EventTimeRollup.activity_template_id)
+    )
+    totals: Dict[date, Dict[Optional[int], list]] = {}
+    for bucket_day, template_id, count, seconds in rows:
+        totals.setdefault(bucket_day, {})[template_id] = [
+            int(count),
+            int(seconds) / 60,
+        ]
+
+    start = datetime.combine(from_, time(0), tzinfo=timezone.utc)
+    end = datetime.combine(to, time(0), tzinfo=timezone.utc)
+    for occurrence in series_in_window(db, current_user.id, start, end):
+        if occurrence.start_datetime < start or occurrence.is_background:
+            continue
+        slot = totals.setdefault(
+            bucket_start(occurrence.start_datetime, bucket, timezone.utc), {}
+        ).setdefault(occurrence.activity_template_id, [0, 0.0])
+        slot[0] += 1
+        slot[1] += (
+            occurrence.end_datetime - occurrence.start_datetime
+        ).total_seconds() / 60
+
+    overall: Dict[Optional[int], list] = {}
+    for per_template in totals.values():
+        for template_id, (count, minutes) in per_template.items():
+            slot = overall.setdefault(template_id, [0, 0.0])
+            slot[0] += count
+            slot[1] += minutes
+    templates = _template_buckets(overall)
+    return TimeSpentOut(
+        bucket=bucket,
+        start=from_,
+        end=to,
+        count=sum(t.count for t in templates),
+        minutes=round(sum(minutes for _, minutes in overall.values())),
+        templates=templates,
+        buckets=_summary_buckets(totals),
+    )
+
+
+@router.post("", response_model=EventWithConflictsOut, status_code=201)
 def create_event(
     payload: EventCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    check_conflicts: bool = Query(False),
 ):
-    event = Event(**payload.model_dump(), user_id=current_user.id)
-    db.add(event)
+    template = _get_template(db, payload.activity_template_id, current_user.id)
+    event = insert_returning(
+        db,
+        Event,
+        {
+            **_inherit_description(payload.model_dump(), template),
+            "user_id": current_user.id,
+        },
+    )
+    out = _event_out(event, template)
+    if check_conflicts:
+        (out,) = _with_conflicts(
+            [out],
+            _find_conflicts(
+                db, current_user.id, _conflict_candidates([out]), frozenset({out.id})
+            ),
+        )
     db.commit()
-    db.refresh(event)
-    # Reload with relationship
-    return db.query(Event).options(joinedload(Event.activity_template)).get(event.id)
+    return out
 
 
 @router.get("/{event_id}", response_model=EventOut)
@@ -85,57 +748,24 @@ def get_event(
     return event
 
 
-@router.put("/{event_id}", response_model=EventOut)
+@router.put("/{event_id}", response_model=EventWithConflictsOut)
 def update_event(
     event_id: int,
     payload: EventUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    check_conflicts: bool = Query(False),
 ):
-    event = (
-        db.query(Event)
-        .filter(Event.id == event_id, Event.user_id == current_user.id)
-        .first()
-    )
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    update_data = payload.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(event, key, value)
-
-    # Dwukierunkowa synchronizacja opisu: event → szablon → pozostałe eventy
-    if "description" in update_data and event.activity_template_id:
-        new_desc = update_data["description"]
-        # Zaktualizuj szablon
-        (
-            db.query(ActivityTemplate)
-            .filter(
-                ActivityTemplate.id == event.activity_template_id,
-                ActivityTemplate.user_id == current_user.id,
-            )
-            .update(
-                {ActivityTemplate.description: new_desc},
-                synchronize_session="fetch",
-            )
+    out = _apply_event_update(db, current_user.id, event_id, payload)
+    if check_conflicts:
+        (out,) = _with_conflicts(
+            [out],
+            _find_conflicts(
+                db, current_user.id, _conflict_candidates([out]), frozenset({event_id})
+            ),
         )
-        # Zaktualizuj pozostałe eventy z tego szablonu
-        (
-            db.query(Event)
-            .filter(
-                Event.activity_template_id == event.activity_template_id,
-                Event.user_id == current_user.id,
-                Event.id != event_id,
-            )
-            .update(
-                {Event.description: new_desc},
-                synchronize_session="fetch",
-            )
-        )
-
     db.commit()
-    db.refresh(event)
-    return db.query(Event).options(joinedload(Event.activity_template)).get(event.id)
+    return out
 
 
 @router.delete("/{event_id}", status_code=204)
@@ -155,51 +785,324 @@ def delete_event(
     db.commit()
 
 
-@router.post("/recurring", response_model=List[EventOut], status_code=201)
+@router.post("/recurring", response_model=List[EventWithConflictsOut], status_code=201)
 def create_recurring_events(
     payload: RecurringEventCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    check_conflicts: bool = Query(False),
 ):
-    """Generuje serię powtarzających się wydarzeń (wiele wierszy w DB)."""
+    """
+    Tworzy serię powtarzających się wydarzeń.
+    Domyślnie jeden wiersz event_series (reguła RRULE) — wystąpienia są
+    rozwijane przy odczycie. materialize=True zapisuje każde wystąpienie osobno.
+    """
     if payload.interval_days < 1:
         raise HTTPException(status_code=400, detail="interval_days must be >= 1")
     occurrences = min(payload.occurrences, 730)
     if occurrences < 1:
         raise HTTPException(status_code=400, detail="occurrences must be >= 1")
+    if payload.end_datetime <= payload.start_datetime:
+        raise HTTPException(
+            status_code=400, detail="end_datetime must be after start_datetime"
+        )
 
-    duration = payload.end_datetime - payload.start_datetime
-    recurrence_label = f"INTERVAL_DAYS={payload.interval_days}"
+    template = _get_template(db, payload.activity_template_id, current_user.id)
+    description = _inherit_description({"description": payload.description}, template)[
+        "description"
+    ]
 
-    created = []
-    for i in range(occurrences):
-        delta = timedelta(days=payload.interval_days * i)
-        event = Event(
+    if not payload.materialize:
+        rule = interval_days_rule(payload.interval_days, occurrences)
+        series = EventSeries(
             title=payload.title,
-            start_datetime=payload.start_datetime + delta,
-            end_datetime=payload.end_datetime + delta,
-            description=payload.description,
+            start_datetime=payload.start_datetime,
+            end_datetime=payload.end_datetime,
+            rrule=rule,
+            until_datetime=series_until(
+                rule, payload.start_datetime, payload.end_datetime
+            ),
+            description=description,
             location=payload.location,
             activity_template_id=payload.activity_template_id,
-            recurrence_rule=recurrence_label,
+            reminder_minutes=payload.reminder_minutes,
             user_id=current_user.id,
         )
-        db.add(event)
-        created.append(event)
+        db.add(series)
+        db.flush()
+        created = expand_series(series, series.start_datetime, series.until_datetime)
+        if check_conflicts:
+            created = _with_conflicts(
+                created,
+                _find_conflicts(
+                    db,
+                    current_user.id,
+                    _conflict_candidates(created),
+                    exclude_series_id=series.id,
+                ),
+            )
+        db.commit()
+        return created
+
+    recurrence_label = f"INTERVAL_DAYS={payload.interval_days}"
+    now = datetime.now(timezone.utc)
 
+    rows = []
+    for i in range(occurrences):
+        delta = timedelta(days=payload.interval_days * i)
+        rows.append(
+            {
+                "title": payload.title,
+                "start_datetime": payload.start_datetime + delta,
+                "end_datetime": payload.end_datetime + delta,
+                "description": description,
+                "location": payload.location,
+                "activity_template_id": payload.activity_template_id,
+                "recurrence_rule": recurrence_label,
+                "reminder_minutes": payload.reminder_minutes,
+                "user_id": current_user.id,
+                "is_background": False,
+                "created_at": now,
+            }
+        )
+
+    created = _bulk_insert_events(db, rows, {template.id: template} if template else {})
+    if check_conflicts:
+        created = _with_conflicts(
+            created,
+            _find_conflicts(
+                db,
+                current_user.id,
+                _conflict_candidates(created),
+                frozenset(event.id for event in created),
+            ),
+        )
     db.commit()
-    for ev in created:
-        db.refresh(ev)
+    return created
 
-    ids = [ev.id for ev in created]
-    return (
-        db.query(Event)
-        .options(joinedload(Event.activity_template))
-        .filter(Event.id.in_(ids))
-        .order_by(Event.start_datetime)
-        .all()
+
+@router.post("/batch", response_model=List[EventBatchResult])
+def batch_events(
+    payload: EventBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Paczka operacji create/update/delete (multi-drag, multi-delete) w jednej
+    transakcji: jeden INSERT na wszystkie create, jeden UPDATE ... FROM VALUES
+    na każdą grupę update z tym samym zestawem pól, jeden DELETE na wszystkie
+    delete. Wynik per operacja; błędne operacje są pomijane, reszta zapisana.
+    """
+    user_id = current_user.id
+    results: List[Optional[EventBatchResult]] = [None] * len(payload.operations)
+
+    def fail(index: int, op: str, status: int, error: str, obj_id=None) -> None:
+        results[index] = EventBatchResult(
+            index=index, op=op, status=status, id=obj_id, error=error
+        )
+
+    creates, updates, deletes = [], [], []
+    for index, raw in enumerate(payload.operations):
+        try:
+            op = event_batch_operation_adapter.validate_python(raw)
+        except ValidationError as exc:
+            err = exc.errors(include_url=False)[0]
+            # Pierwszy element loc to tag unii ("create"/"update"/"delete")
+            loc = ".".join(str(part) for part in err["loc"][1:])
+            fail(index, str(raw.get("op")), 422, f"{loc}: {err['msg']}")
+            continue
+        {"create": creates, "update": updates, "delete": deletes}[op.op].append(
+            (index, op)
+        )
+
+    templates = _load_templates(
+        db,
+        user_id,
+        {op.data.activity_template_id for _, op in creates + updates},
+        {},
     )
 
+    # ── create ────────────────────────────────────────────────────────────────
+    rows, row_index = [], []
+    now = datetime.now(timezone.utc)
+    for index, op in creates:
+        tid = op.data.activity_template_id
+        if tid is not None and tid not in templates:
+            fail(index, "create", 404, "Template not found")
+            continue
+        data = _inherit_description(op.data.model_dump(), templates.get(tid))
+        rows.append({**data, "user_id": user_id, "created_at": now})
+        row_index.append(index)
+    for index, out in zip(row_index, _bulk_insert_events(db, rows, templates)):
+        results[index] = EventBatchResult(
+            index=index, op="create", status=201, id=out.id, event=out
+        )
+
+    # ── update ────────────────────────────────────────────────────────────────
+    grouped: List[Tuple[int, int, dict]] = []
+    seen = set()
+    for index, op in updates:
+        if op.id in seen:
+            fail(index, "update", 422, "Duplicate update for event", op.id)
+            continue
+        seen.add(op.id)
+        data = op.data.model_dump(exclude_unset=True)
+        tid = data.get("activity_template_id")
+        if tid is not None and tid not in templates:
+            fail(index, "update", 404, "Template not found", op.id)
+        elif "description" in data or "description_override" in data:
+            # Opis może trafić do szablonu — ścieżka pojedynczego update,
+            # w savepoincie: błąd po zapisie eventu (np. 404 szablonu) cofa
+            # całą operację. Numer zmiany bierzemy przed savepointem — jego
+            # UPDATE users nie może zostać cofnięty razem z operacją
+            next_change_seq(db, user_id)
+            try:
+                with db.begin_nested():
+                    out = _apply_event_update(db, user_id, op.id, op.data)
+            except HTTPException as exc:
+                fail(index, "update", exc.status_code, exc.detail, op.id)
+            else:
+                results[index] = EventBatchResult(
+                    index=index, op="update", status=200, id=op.id, event=out
+                )
+        else:
+            grouped.append((index, op.id, data))
+
+    inverted = _inverted_updates(
+        db, user_id, {event_id: data for _, event_id, data in grouped}
+    )
+    groups: Dict[Tuple[str, ...], List[Tuple[int, int, dict]]] = {}
+    for index, event_id, data in grouped:
+        if event_id in inverted:
+            fail(
+                index,
+                "update",
+                422,
+                "end_datetime must be after start_datetime",
+                event_id,
+            )
+        else:
+            groups.setdefault(tuple(sorted(data)), []).append((index, event_id, data))
+
+    for keys, items in groups.items():
+        updated = _bulk_update_events(
+            db, user_id, keys, [(event_id, data) for _, event_id, data in items]
+        )
+        _load_templates(
+            db,
+            user_id,
+            {row["activity_template_id"] for row in updated.values()},
+            templates,
+        )
+        for index, event_id, _ in items:
+            row = updated.get(event_id)
+            if row is None:
+                fail(index, "update", 404, "Event not found", event_id)
+                continue
+            out = EventOut.model_validate(
+                {**row, "activity_template": templates.get(row["activity_template_id"])}
+            )
+            results[index] = EventBatchResult(
+                index=index, op="update", status=200, id=event_id, event=out
+            )
+
+    # ── delete ────────────────────────────────────────────────────────────────
+    if deletes:
+        deleted = _bulk_delete_events(db, user_id, [op.id for _, op in deletes])
+        for index, op in deletes:
+            if op.id in deleted:
+                results[index] = EventBatchResult(
+                    index=index, op="delete", status=204, id=op.id
+                )
+            else:
+                fail(index, "delete", 404, "Event not found", op.id)
+
+    db.commit()
+    return results
+
+
+@router.post("/copy-range", response_model=EventRangeSummary, status_code=201)
+def copy_event_range(
+    payload: EventRangeCopy,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    „Kopiuj tydzień": INSERT ... SELECT z przesunięciem o interval — eventy
+    nie przechodzą przez aplikację. Serie cykliczne nie są kopiowane.
+    """
+    offset = payload.target_start - payload.source_start
+    table = Event.__table__
+    stamped = stamp(db, current_user.id)
+    copied = [
+        "title",
+        "description",
+        "location",
+        "activity_template_id",
+        "user_id",
+        "is_background",
+        "color",
+        "icon",
+        "eisenhower_quadrant",
+        "reminder_minutes",
+    ]
+    source = select(
+        *[table.c[name] for name in copied],
+        (table.c.start_datetime + offset).label("start_datetime"),
+        (table.c.end_datetime + offset).label("end_datetime"),
+        literal(stamped["updated_at"], table.c.created_at.type).label("created_at"),
+        literal(stamped["updated_at"], table.c.updated_at.type).label("updated_at"),
+        literal(stamped["change_seq"], table.c.change_seq.type).label("change_seq"),
+    ).where(
+        *_range_filter(
+            current_user.id,
+            payload.source_start,
+            payload.source_end,
+            payload.activity_template_id,
+        )
+    )
+    result = db.execute(
+        insert(table).from_select(
+            copied
+            + ["start_datetime", "end_datetime", "created_at", "updated_at"]
+            + ["change_seq"],
+            source,
+        )
+    )
+    db.commit()
+    return _range_summary(
+        result.rowcount, payload.source_start, payload.source_end, offset
+    )
+
+
+@router.post("/shift-range", response_model=EventRangeSummary)
+def shift_event_range(
+    payload: EventRangeShift,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Przesuwa eventy z zakresu jednym UPDATE ... SET start = start + interval."""
+    offset = payload.target_start - payload.start
+    table = Event.__table__
+    result = db.execute(
+        update(table)
+        .where(
+            *_range_filter(
+                current_user.id,
+                payload.start,
+                payload.end,
+                payload.activity_template_id,
+            )
+        )
+        .values(
+            start_datetime=table.c.start_datetime + offset,
+            end_datetime=table.c.end_datetime + offset,
+            **stamp(db, current_user.id),
+        )
+    )
+    db.commit()
+    return _range_summary(result.rowcount, payload.start, payload.end, offset)
+
 
 @router.post("/from-task/{task_id}", response_model=EventOut, status_code=201)
 def create_event_from_task(
@@ -219,13 +1122,12 @@ def create_event_from_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    event = Event(**payload.model_dump(), user_id=current_user.id)
-    if not event.title:
-        event.title = task.title
-    db.add(event)
-    db.flush()
+    template = _get_template(db, payload.activity_template_id, current_user.id)
+    values = _inherit_description(payload.model_dump(), template)
+    values["title"] = values["title"] or task.title
+    event = insert_returning(db, Event, {**values, "user_id": current_user.id})
 
     task.linked_event_id = event.id
+    out = _event_out(event, template)
     db.commit()
-    db.refresh(event)
-    return db.query(Event).options(joinedload(Event.activity_template)).get(event.id)
+    return out
@@ -0,0 +1,143 @@
+from datetime import datetime, time, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Float, cast, func
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.core.forecast import (
+    day_loads,
+    local_epoch,
+    local_minutes,
+    occupancy,
+    task_load,
+    week_starts,
+    work_window,
+)
+from app.core.recurrence import series_in_window
+from app.db.base import get_db
+from app.models.eisenhower_task import EisenhowerTask, TaskStatus
+from app.models.event import Event
+from app.models.user import User
+from app.schemas.forecast import DayLoadOut, OverloadForecastOut, WeekLoadOut
+
+router = APIRouter(prefix="/forecast", tags=["forecast"])
+
+
+def _local_epoch(zone: str, column):
+    """Czas lokalny jako epoch w sekundach — rasteryzacja bez konwersji w Pythonie."""
+    return cast(func.extract("epoch", func.timezone(zone, column)), Float)
+
+
+@router.get("/overload", response_model=OverloadForecastOut)
+def overload_forecast(
+    weeks: int = Query(4, ge=1, le=53),
+    timezone_name: str = Query("UTC", alias="timezone"),
+    hour_start: Optional[int] = Query(None, ge=0, le=23),
+    hour_end: Optional[int] = Query(None, ge=1, le=24),
+    task_minutes: int = Query(30, ge=0, le=480, description="Effort per open task"),
+    threshold: float = Query(0.85, gt=0, le=2),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Przeciążone dni w najbliższych `weeks` tygodniach (od dziś). Zajętość
+    eventów (bez tła, z wystąpieniami serii) i otwarte taski z terminem
+    (niepodpięte do eventu; przeterminowane obciążają dziś) względem okna
+    hour_start–hour_end z ustawień. Dwa zapytania, reszta w NumPy.
+    """
+    try:
+        zone = ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    prefs = current_user.preferences or {}
+    if hour_start is None:
+        hour_start = prefs.get("hour_start", 8)
+    if hour_end is None:
+        hour_end = prefs.get("hour_end", 22)
+    if hour_end <= hour_start:
+        raise HTTPException(status_code=400, detail="hour_end must be after hour_start")
+
+    days = weeks * 7
+    origin = datetime.now(zone).date()
+    start = datetime.combine(origin, time(0), tzinfo=zone)
+    end = datetime.combine(origin + timedelta(days=days), time(0), tzinfo=zone)
+
+    rows = db.query(
+        _local_epoch(zone.key, Event.start_datetime),
+        _local_epoch(zone.key, Event.end_datetime),
+    ).filter(
+        Event.user_id == current_user.id,
+        Event.overlaps(start, end),
+        Event.is_background.is_(False),
+    )
+    spans = [tuple(row) for row in rows]
+    spans.extend(
+        (
+            local_epoch(occurrence.start_datetime, zone),
+            local_epoch(occurrence.end_datetime, zone),
+        )
+        for occurrence in series_in_window(db, current_user.id, start, end)
+        if not occurrence.is_background
+    )
+    starts = local_minutes(origin, (span[0] for span in spans))
+    ends = local_minutes(origin, (span[1] for span in spans))
+
+    due = db.query(_local_epoch(zone.key, EisenhowerTask.due_date)).filter(
+        EisenhowerTask.user_id == current_user.id,
+        EisenhowerTask.status != TaskStatus.DONE,
+        EisenhowerTask.linked_event_id.is_(None),
+        EisenhowerTask.due_date < end,
+    )
+    tasks_per_day = task_load(local_minutes(origin, (row[0] for row in due)), days)
+
+    inside, outside, scores, capacity = day_loads(
+        occupancy(starts, ends, days),
+        work_window(hour_start, hour_end),
+        tasks_per_day,
+        task_minutes,
+    )
+    overloaded = scores >= threshold
+
+    boundaries = week_starts(origin, days, (prefs.get("first_day_of_week", 1) - 1) % 7)
+    week_events = np.add.reduceat(inside, boundaries)
+    week_tasks = np.add.reduceat(tasks_per_day, boundaries) * task_minutes
+    week_days = np.diff(boundaries + [days])
+    week_overloaded = np.add.reduceat(overloaded.astype(np.int64), boundaries)
+
+    return OverloadForecastOut(
+        timezone=zone.key,
+        hour_start=hour_start,
+        hour_end=hour_end,
+        threshold=threshold,
+        days=[
+            DayLoadOut(
+                date=origin + timedelta(days=i),
+                event_minutes=int(inside[i]),
+                outside_minutes=int(outside[i]),
+                task_count=int(tasks_per_day[i]),
+                task_minutes=int(tasks_per_day[i]) * task_minutes,
+                capacity_minutes=capacity,
+                score=round(float(scores[i]), 3),
+                overloaded=bool(overloaded[i]),
+            )
+            for i in range(days)
+        ],
+        weeks=[
+            WeekLoadOut(
+                start=origin + timedelta(days=first),
+                event_minutes=int(week_events[i]),
+                task_minutes=int(week_tasks[i]),
+                capacity_minutes=int(week_days[i]) * capacity,
+                score=round(
+                    float((week_events[i] + week_tasks[i]) / (week_days[i] * capacity)),
+                    3,
+                ),
+                overloaded_days=int(week_overloaded[i]),
+            )
+            for i, first in enumerate(boundaries)
+        ],
+    )
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from typing import AsyncIterator, Dict, Optional, Set
+
+import psycopg2
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.reminder_sinks import NOTIFY_CHANNEL
+from app.core.security import (
+    STREAM_TOKEN_EXPIRE_SECONDS,
+    create_stream_token,
+    decode_token,
+)
+from app.db.base import get_db
+from app.models.user import User
+from app.schemas.reminder import ReminderStreamTokenOut
+
+router = APIRouter(prefix="/reminders", tags=["reminders"])
+
+# Komentarz SSE co tyle sekund — proxy nie zamyka bezczynnego połączenia
+HEARTBEAT_SECONDS = 15
+
+
+def _listen_connection():
+    """Osobne połączenie (nie z puli) — żyje tak długo jak słuchacz."""
+    conn = psycopg2.connect(settings.DATABASE_URL)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+    return conn
+
+
+class ReminderListener:
+    """
+    Jedno połączenie LISTEN na proces API, niezależnie od liczby strumieni.
+    Gniazdo obserwuje pętla asyncio (add_reader) — bez wątku na klienta;
+    powiadomienia trafiają do kolejek strumieni danego usera. Połączenie
+    powstaje przy pierwszym strumieniu i jest zamykane po ostatnim.
+    """
+
+    def __init__(self) -> None:
+        self._conn = None
+        self._lock = asyncio.Lock()
+        # user_id → kolejki otwartych strumieni (None = koniec strumienia)
+        self._queues: Dict[int, Set[asyncio.Queue]] = {}
+
+    async def subscribe(self, user_id: int) -> asyncio.Queue:
+        async with self._lock:
+            if self._conn is None:
+                loop = asyncio.get_running_loop()
+                self._conn = await loop.run_in_executor(None, _listen_connection)
+                loop.add_reader(self._conn.fileno(), self._dispatch)
+            queue: asyncio.Queue = asyncio.Queue()
+            self._queues.setdefault(user_id, set()).add(queue)
+            return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        queues = self._queues.get(user_id, set())
+        queues.discard(queue)
+        if not queues:
+            self._queues.pop(user_id, None)
+        if not self._queues:
+            self._close()
+
+    def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            asyncio.get_running_loop().remove_reader(conn.fileno())
+            conn.close()
+
+    def _dispatch(self) -> None:
+        try:
+            self._conn.poll()
+        except psycopg2.Error:
+            # Zerwane połączenie — strumienie się kończą, EventSource łączy
+            # się ponownie i otwiera nowe
+            self._close()
+            for queues in self._queues.values():
+                for queue in queues:
+                    queue.put_nowait(None)
+            return
+        while self._conn.notifies:
+            note = self._conn.notifies.pop(0)
+            user_id = json.loads(note.payload).get("user_id")
+            for queue in self._queues.get(user_id, ()):
+                queue.put_nowait(note.payload)
+
+
+listener = ReminderListener()
+
+
+async def _reminder_events(user_id: int) -> AsyncIterator[str]:
+    """Przypomnienia usera jako zdarzenia SSE, z heartbeatem."""
+    queue = await listener.subscribe(user_id)
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                payload: Optional[str] = await asyncio.wait_for(
+                    queue.get(), HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if payload is None:
+                return
+            yield f"event: reminder\ndata: {payload}\n\n"
+    finally:
+        listener.unsubscribe(user_id, queue)
+
+
+@router.post("/stream-token", response_model=ReminderStreamTokenOut)
+def reminder_stream_token(current_user: User = Depends(get_current_user)):
+    """
+    EventSource nie wysyła nagłówka Authorization — klient pobiera tu
+    krótkotrwały token i otwiera EventSource("/api/v1/reminders/stream?token=…").
+    Token sprawdzany jest tylko przy nawiązaniu połączenia; po zerwaniu
+    (błąd EventSource) klient pobiera nowy.
+    """
+    return ReminderStreamTokenOut(
+        token=create_stream_token(current_user.id),
+        expires_in=STREAM_TOKEN_EXPIRE_SECONDS,
+    )
+
+
+def _stream_user(
+    token: str = Query(..., description="Token z POST /reminders/stream-token"),
+    db: Session = Depends(get_db),
+) -> int:
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "stream":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired stream token",
+        )
+    user_id = int(payload.get("sub", 0))
+    if not db.get(User, user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+    return user_id
+
+
+@router.get("/stream")
+def reminder_stream(user_id: int = Depends(_stream_user)):
+    """Server-Sent Events z przypomnieniami (kanał "sse" workera przypomnień)."""
+    return StreamingResponse(
+        _reminder_events(user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
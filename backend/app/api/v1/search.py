@@ -0,0 +1,46 @@
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.core.search import SEARCH_TARGETS, prefix_query, search_branch
+from app.db.base import get_db
+from app.models.user import User
+from app.schemas.search import SearchResultOut
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+SearchType = Literal["event", "series", "task", "template", "contact"]
+
+
+@router.get("", response_model=List[SearchResultOut])
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[List[SearchType]] = Query(None, alias="type"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Szukanie w eventach, seriach, taskach, szablonach i kontaktach — jedno
+    zapytanie UNION ALL; każda gałąź bierze najlepsze `limit` dopasowań
+    z indeksu GIN, całość sortowana wg rankingu (tytuł > opis > reszta).
+    Słowa łączone AND, każde jako prefiks.
+    """
+    tsquery = prefix_query(q)
+    if tsquery is None:
+        return []
+    kinds = list(dict.fromkeys(types)) if types else list(SEARCH_TARGETS)
+    branches = union_all(
+        *[search_branch(kind, current_user.id, tsquery, limit) for kind in kinds]
+    ).subquery()
+    rows = db.execute(
+        select(branches)
+        .order_by(
+            branches.c.rank.desc(), branches.c.at.desc().nulls_last(), branches.c.id
+        )
+        .limit(limit)
+    )
+    return [SearchResultOut(**row) for row in rows.mappings()]
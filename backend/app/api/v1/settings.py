@@ -42,12 +42,8 @@ def update_settings(
     prefs = dict(current_user.preferences or {})
     prefs.update(settings.model_dump(exclude_none=True))
     current_user.preferences = prefs
-    db.add(current_user)
     db.commit()
-    db.refresh(current_user)
+    # Odpowiedź z lokalnego `prefs` — bez refresh po commicie
     return UserSettings(
-        **{
-            k: current_user.preferences.get(k, v)
-            for k, v in settings.model_dump().items()
-        }
+        **{k: prefs.get(k, v) for k, v in settings.model_dump().items()}
     )
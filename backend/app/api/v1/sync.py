@@ -0,0 +1,79 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.api.deps import get_current_user
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.sync import SYNCED_MODELS
+from app.db.base import get_db
+from app.models.event import Event
+from app.models.event_series import EventSeries
+from app.models.sync_tombstone import SyncTombstone
+from app.models.user import User
+from app.schemas.sync import SyncOut
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+_LOAD_OPTIONS = {
+    "events": [joinedload(Event.activity_template)],
+    "event_series": [
+        joinedload(EventSeries.activity_template),
+        selectinload(EventSeries.exceptions),
+    ],
+}
+
+
+@router.get("", response_model=SyncOut)
+def sync(
+    since: Optional[str] = Query(None, description="Cursor from previous /sync"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Delta sync: wiersze utworzone/zmienione/usunięte od kursora.
+    Każda tabela to jeden skan indeksu (user_id, change_seq).
+    """
+    after = 0
+    if since:
+        (after,) = decode_cursor(since, 1)
+        if not isinstance(after, int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Górna granica czytana PRZED wierszami — wszystko <= upto jest już
+    # zacommitowane; nowsze zmiany trafią do następnego wywołania
+    upto = db.execute(
+        select(User.change_seq).where(User.id == current_user.id)
+    ).scalar_one()
+
+    data = {"cursor": encode_cursor(upto), "full": not since, "deleted": {}}
+    if upto <= after:
+        return SyncOut(**data)
+
+    for key, model in SYNCED_MODELS.items():
+        rows = (
+            db.query(model)
+            .options(*_LOAD_OPTIONS.get(key, []))
+            .filter(
+                model.user_id == current_user.id,
+                model.change_seq > after,
+                model.change_seq <= upto,
+            )
+            .order_by(model.change_seq, model.id)
+            .all()
+        )
+        data[key] = rows
+
+    if since:
+        tombstones = db.execute(
+            select(SyncTombstone.entity, SyncTombstone.entity_id).where(
+                SyncTombstone.user_id == current_user.id,
+                SyncTombstone.change_seq > after,
+                SyncTombstone.change_seq <= upto,
+            )
+        )
+        for entity, entity_id in tombstones:
+            data["deleted"].setdefault(entity, []).append(entity_id)
+
+    return SyncOut(**data)
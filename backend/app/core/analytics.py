@@ -0,0 +1,32 @@
+"""
+Agregaty czasu w kubełkach dzień/tydzień/miesiąc — w SQL (date_trunc w strefie
+usera) i identycznie w Pythonie dla wirtualnych wystąpień serii.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Literal
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Date, DateTime, cast, func
+
+Bucket = Literal["day", "week", "month"]
+
+
+def bucket_expr(bucket: Bucket, zone: str, column):
+    """date_trunc(bucket, column w czasie lokalnym) jako DATE — tydzień od poniedziałku."""
+    return cast(func.date_trunc(bucket, func.timezone(zone, column)), Date)
+
+
+def bucket_start(value: datetime, bucket: Bucket, zone: ZoneInfo) -> date:
+    """Odpowiednik bucket_expr() dla pojedynczej wartości."""
+    day = value.astimezone(zone).date()
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def day_bucket_expr(bucket: Bucket, column):
+    """Jak bucket_expr(), ale dla kolumny DATE (dni rollupu są już w UTC)."""
+    return cast(func.date_trunc(bucket, cast(column, DateTime)), Date)
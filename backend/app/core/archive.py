@@ -0,0 +1,171 @@
+"""
+Archiwum zimnych danych: zrobione taski i stare eventy przenoszone z gorących
+tabel do archive_chunks (JSONB na usera i miesiąc, kompresja TOAST lz4).
+Gorące tabele i ich indeksy obejmują wtedy tylko bieżące dane.
+
+Przeniesienie paczki to jedna instrukcja (DELETE ... RETURNING → INSERT
+zgrupowany po miesiącach), więc wiersz jest zawsze w dokładnie jednym
+miejscu. Przeniesione wiersze dostają tombstone /sync jak usunięte (jeden
+numer zmiany usera na paczkę) — klienci czytają je dalej przez
+include_archived. Rollup czasu (event_time_rollups) nie traci archiwalnych
+dni: trigger DELETE pomija instrukcje z app.archiving = on (migracja 0023).
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.sync import stamp
+from app.models.activity_template import ActivityTemplate
+from app.models.archive_chunk import ArchiveChunk
+from app.schemas.activity_template import ActivityTemplateOut
+from app.schemas.eisenhower_task import EisenhowerTaskOut
+from app.schemas.event import EventOut
+
+ARCHIVE_BATCH = 5000
+
+# Kolumny utrzymywane przez bazę (generowane / z triggera) — nie archiwizowane
+_DERIVED = "- 'search_vector' - 'remind_at'"
+
+_PENDING = """
+SELECT EXISTS (SELECT 1 FROM {table} WHERE user_id = :user_id AND {condition})
+"""
+
+_MOVE = """
+WITH picked AS (
+    SELECT id FROM {table}
+    WHERE user_id = :user_id AND {condition}
+    ORDER BY {order}, id
+    LIMIT :batch
+    FOR UPDATE SKIP LOCKED
+), moved AS (
+    DELETE FROM {table} USING picked WHERE {table}.id = picked.id
+    RETURNING {table}.*
+), tombstones AS (
+    INSERT INTO sync_tombstones (user_id, entity, entity_id, change_seq, deleted_at)
+    SELECT :user_id, '{table}', id, :change_seq, :now FROM moved
+)
+INSERT INTO archive_chunks
+    (user_id, entity, period_start, period_end, row_count, rows, archived_at)
+SELECT :user_id, '{table}', min({start}), max({end}), count(*),
+       jsonb_agg(to_jsonb(moved) {derived} ORDER BY {order}, id), :now
+FROM moved
+GROUP BY date_trunc('month', {start} AT TIME ZONE 'UTC')
+RETURNING row_count
+"""
+
+
+def _statements(**params) -> Tuple[str, str]:
+    """(czy jest co przenieść, przeniesienie paczki) dla jednej tabeli."""
+    return _PENDING.format(**params), _MOVE.format(**params, derived=_DERIVED)
+
+
+# Eventy podpięte pod task (linked_event_id) zostają — FK z eisenhower_tasks
+_EVENTS = _statements(
+    table="events",
+    condition=(
+        "start_datetime < :cutoff AND end_datetime < :cutoff "
+        "AND NOT EXISTS (SELECT 1 FROM eisenhower_tasks t "
+        "WHERE t.user_id = :user_id AND t.linked_event_id = events.id)"
+    ),
+    order="start_datetime",
+    start="start_datetime",
+    end="end_datetime",
+)
+
+# Cykliczne — dopiero gdy rollover utworzył następcę
+_TASKS = _statements(
+    table="eisenhower_tasks",
+    condition=(
+        "status = 'done' AND created_at < :cutoff "
+        "AND COALESCE(updated_at, created_at) < :cutoff "
+        "AND (recurrence_days IS NULL OR rolled_forward_at IS NOT NULL)"
+    ),
+    order="created_at",
+    start="created_at",
+    end="created_at",
+)
+
+
+def _move(
+    db: Session,
+    statements: Tuple[str, str],
+    user_id: int,
+    cutoff: datetime,
+    now: datetime,
+) -> int:
+    pending, move = statements
+    params = {"user_id": user_id, "cutoff": cutoff}
+    if not db.execute(text(pending), params).scalar():
+        return 0
+    # Numer zmiany przed przeniesieniem: wiersz users blokowany przed
+    # wierszami tabeli, jak w stamp() przy zapisach API
+    change_seq = stamp(db, user_id)["change_seq"]
+    db.execute(text("SELECT set_config('app.archiving', 'on', true)"))
+    result = db.execute(
+        text(move),
+        {**params, "batch": ARCHIVE_BATCH, "now": now, "change_seq": change_seq},
+    )
+    return sum(row.row_count for row in result)
+
+
+def archive_events(db: Session, user_id: int, cutoff: datetime, now: datetime) -> int:
+    """Jedna paczka eventów usera zakończonych przed `cutoff`; zwraca liczbę."""
+    return _move(db, _EVENTS, user_id, cutoff, now)
+
+
+def archive_tasks(db: Session, user_id: int, cutoff: datetime, now: datetime) -> int:
+    """Jedna paczka zrobionych tasków usera sprzed `cutoff`; zwraca liczbę."""
+    return _move(db, _TASKS, user_id, cutoff, now)
+
+
+def _chunk_rows(
+    db: Session,
+    user_id: int,
+    entity: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[dict]:
+    q = select(ArchiveChunk.rows).where(
+        ArchiveChunk.user_id == user_id, ArchiveChunk.entity == entity
+    )
+    if end is not None:
+        q = q.where(ArchiveChunk.period_start < end)
+    if start is not None:
+        q = q.where(ArchiveChunk.period_end > start)
+    return [row for rows in db.scalars(q) for row in rows]
+
+
+def archived_events(
+    db: Session, user_id: int, start: datetime, end: datetime
+) -> List[EventOut]:
+    """Zarchiwizowane eventy nachodzące na [start, end) — z szablonami (jedno IN)."""
+    rows = _chunk_rows(db, user_id, "events", start, end)
+    template_ids = {row["activity_template_id"] for row in rows} - {None}
+    templates = {}
+    if template_ids:
+        templates = {
+            template.id: ActivityTemplateOut.model_validate(template)
+            for template in db.scalars(
+                select(ActivityTemplate).where(
+                    ActivityTemplate.id.in_(template_ids),
+                    ActivityTemplate.user_id == user_id,
+                )
+            )
+        }
+    events = [
+        EventOut.model_validate(
+            {**row, "activity_template": templates.get(row["activity_template_id"])}
+        )
+        for row in rows
+    ]
+    return [ev for ev in events if ev.start_datetime < end and ev.end_datetime > start]
+
+
+def archived_tasks(db: Session, user_id: int) -> List[EisenhowerTaskOut]:
+    return [
+        EisenhowerTaskOut.model_validate(row)
+        for row in _chunk_rows(db, user_id, "eisenhower_tasks")
+    ]
@@ -0,0 +1,84 @@
+"""
+Wirtualne urodziny kontaktów w widokach kalendarza — jak wystąpienia serii:
+nie są zapisywane w events, tylko generowane dla okna. Kontakty z rocznicą
+w oknie wybiera zakres po ix_contacts_user_birthday (miesiąc*100 + dzień);
+okno przez przełom roku to dwa zakresy, okno od roku wzwyż — wszystkie.
+Urodziny 29 lutego w latach nieprzestępnych wypadają 28 lutego.
+"""
+
+import calendar
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import List, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.models.contact import Contact, birthday_key
+from app.schemas.event import EventOut
+
+BIRTHDAY_ICON = "🎂"
+
+
+def _key(day: date) -> int:
+    return day.month * 100 + day.day
+
+
+def key_ranges(first: date, last: date) -> List[Tuple[int, int]]:
+    """Zakresy kluczy (włącznie) pokrywające dni [first, last]; [] = wszystkie."""
+    if (last - first).days >= 365:
+        return []
+    ranges = []
+    for year in range(first.year, last.year + 1):
+        low = _key(max(first, date(year, 1, 1)))
+        high = _key(min(last, date(year, 12, 31)))
+        # 28 lutego roku nieprzestępnego obejmuje też urodziny 29 lutego
+        if high == 228 and not calendar.isleap(year):
+            high = 229
+        ranges.append((low, high))
+    return ranges
+
+
+def anniversary(birthday: date, year: int) -> date:
+    if birthday.month == 2 and birthday.day == 29 and not calendar.isleap(year):
+        return date(year, 2, 28)
+    return birthday.replace(year=year)
+
+
+def birthdays_between(
+    db: Session,
+    user_id: int,
+    start: datetime,
+    end: datetime,
+    zone: tzinfo = timezone.utc,
+) -> List[EventOut]:
+    """Całodniowe (w strefie `zone`) urodziny nachodzące na [start, end)."""
+    first = start.astimezone(zone).date()
+    last = (end - timedelta(microseconds=1)).astimezone(zone).date()
+    q = select(Contact).where(Contact.user_id == user_id, Contact.birthday.isnot(None))
+    ranges = key_ranges(first, last)
+    if ranges:
+        q = q.where(or_(*(birthday_key().between(low, high) for low, high in ranges)))
+
+    birthdays = []
+    for contact in db.scalars(q):
+        for year in range(first.year, last.year + 1):
+            day = anniversary(contact.birthday, year)
+            if not first <= day <= last or day < contact.birthday:
+                continue
+            day_start = datetime.combine(day, time(0), tzinfo=zone)
+            birthdays.append(
+                EventOut(
+                    title=f"{BIRTHDAY_ICON} {contact.name}",
+                    start_datetime=day_start,
+                    end_datetime=datetime.combine(
+                        day + timedelta(days=1), time(0), tzinfo=zone
+                    ),
+                    icon=BIRTHDAY_ICON,
+                    # Nie koliduje z niczym i nie liczy się do zajętości
+                    is_background=True,
+                    contact_id=contact.id,
+                    user_id=user_id,
+                    created_at=contact.created_at,
+                )
+            )
+    return birthdays
@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     # CORS — lista originów oddzielona przecinkami
     ALLOWED_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
 
+    # Przypomnienia (python -m app.workers.reminders) — kanały: log, webhook, sse
+    REMINDER_SINKS: str = "log"
+    REMINDER_LOG_PATH: str = "reminders.log"
+    REMINDER_WEBHOOK_URL: str = ""
+
+    # Archiwum (python -m app.workers.archive) — zrobione taski starsze niż
+    # N dni i eventy starsze niż N lat trafiają do archive_chunks
+    ARCHIVE_TASKS_AFTER_DAYS: int = 90
+    ARCHIVE_EVENTS_AFTER_YEARS: int = 2
+
     @property
     def allowed_origins_list(self) -> List[str]:
         return [o.strip() for o in self.ALLOWED_ORIGINS.split(",") if o.strip()]
@@ -0,0 +1,51 @@
+"""
+Wykrywanie kolizji eventów zamiatarką (sweep-line).
+Kandydaci (nowe/przesunięte przedziały) i istniejące eventy idą przez jedną
+posortowaną listę końców przedziałów — O((n + m) log(n + m) + k) zamiast n·m.
+"""
+
+from datetime import datetime
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Interval = Tuple[Hashable, datetime, datetime]
+
+# Przy tej samej chwili końce przed początkami — przedziały [start, end)
+# stykające się brzegami nie kolidują
+_END, _START = 0, 1
+
+
+def sweep_conflicts(
+    candidates: Iterable[Interval], existing: Sequence[T]
+) -> Dict[Hashable, List[T]]:
+    """
+    Dla każdego kandydata (klucz, start, end) lista istniejących obiektów
+    (z polami start_datetime/end_datetime), z którymi się nakłada.
+    """
+    points = []
+    for key, start, end in candidates:
+        points.append((start, _START, 0, key))
+        points.append((end, _END, 0, key))
+    for index, item in enumerate(existing):
+        points.append((item.start_datetime, _START, 1, index))
+        points.append((item.end_datetime, _END, 1, index))
+    points.sort(key=lambda p: (p[0], p[1]))
+
+    conflicts: Dict[Hashable, List[T]] = {}
+    open_candidates: Dict[Hashable, None] = {}
+    open_existing: Dict[int, None] = {}
+    for _, kind, side, ref in points:
+        if kind == _END:
+            (open_existing if side else open_candidates).pop(ref, None)
+        elif side:
+            for key in open_candidates:
+                conflicts.setdefault(key, []).append(existing[ref])
+            open_existing[ref] = None
+        else:
+            if open_existing:
+                conflicts.setdefault(ref, []).extend(
+                    existing[index] for index in open_existing
+                )
+            open_candidates[ref] = None
+    return conflicts
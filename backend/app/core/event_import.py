@@ -0,0 +1,196 @@
+"""
+Import eventów z plików .ics / CSV — parsowanie strumieniowe, rekord po
+rekordzie, bez wczytywania całego pliku. Rekordy to słowniki kolumn events
+(albo event_series dla VEVENT-ów z RRULE), gotowe do COPY / INSERT.
+"""
+
+import csv
+from datetime import datetime, time, timedelta, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+from app.core.ical import (
+    iter_vevents,
+    parse_duration,
+    parse_value_datetime,
+    unescape_text,
+)
+from app.core.recurrence import series_until
+from app.models.activity_template import ActivityTemplate
+
+# Event bez DTEND/DURATION (albo z końcem przed początkiem)
+DEFAULT_DURATION = timedelta(minutes=30)
+TITLE_MAX = 200
+LOCATION_MAX = 200
+
+# Nagłówek CSV (małymi literami) → pole eventu
+CSV_COLUMNS = {
+    "title": "title",
+    "subject": "title",
+    "summary": "title",
+    "start": "start",
+    "start_datetime": "start",
+    "end": "end",
+    "end_datetime": "end",
+    "description": "description",
+    "location": "location",
+    "template": "template",
+    "activity_template": "template",
+    "category": "template",
+    "categories": "template",
+}
+
+# (rodzaj, wartości, daty odwołanych wystąpień, błąd)
+# rodzaj: "event" | "series" | "skip"
+Record = Tuple[str, Optional[dict], List[datetime], Optional[str]]
+
+
+def _as_datetime(value, zone: tzinfo) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time(0), tzinfo=zone)
+
+
+def _event_values(
+    title: Optional[str],
+    start: datetime,
+    end: Optional[datetime],
+    description: Optional[str],
+    location: Optional[str],
+    template: Optional[ActivityTemplate],
+) -> dict:
+    if end is None or end <= start:
+        end = start + DEFAULT_DURATION
+    description = description or None
+    # Opis równy opisowi szablonu = dziedziczenie (NULL), jak przy create_event
+    if template is not None and description == template.description:
+        description = None
+    return {
+        "title": (title or "(untitled)")[:TITLE_MAX],
+        "start_datetime": start,
+        "end_datetime": end,
+        "description": description,
+        "location": (location or None) and location[:LOCATION_MAX],
+        "activity_template_id": template.id if template is not None else None,
+    }
+
+
+def ics_records(
+    lines: Iterable[str], zone: tzinfo, templates: Dict[str, ActivityTemplate]
+) -> Iterator[Record]:
+    """
+    VEVENT → event; VEVENT z RRULE → seria (EXDATE = odwołane wystąpienia).
+    Pomijane: STATUS:CANCELLED, zmienione wystąpienia (RECURRENCE-ID)
+    i reguły odrzucone przez check_rule (np. FREQ=MINUTELY, COUNT > 730).
+    `templates` = nazwa szablonu (lower) → szablon; dopasowanie po CATEGORIES.
+    """
+    for props in iter_vevents(lines):
+
+        def text(name: str) -> Optional[str]:
+            return unescape_text(props[name][0][1]) if name in props else None
+
+        try:
+            if "RECURRENCE-ID" in props:
+                yield "skip", None, [], "Modified occurrence (RECURRENCE-ID)"
+                continue
+            if (text("STATUS") or "").upper() == "CANCELLED":
+                yield "skip", None, [], "Cancelled event"
+                continue
+            if "DTSTART" not in props:
+                yield "skip", None, [], "Missing DTSTART"
+                continue
+
+            params, value = props["DTSTART"][0]
+            raw_start = parse_value_datetime(value, params, zone)
+            start = _as_datetime(raw_start, zone)
+            end = None
+            if "DTEND" in props:
+                params, value = props["DTEND"][0]
+                end = _as_datetime(parse_value_datetime(value, params, zone), zone)
+            elif "DURATION" in props:
+                end = start + parse_duration(props["DURATION"][0][1])
+            elif not isinstance(raw_start, datetime):
+                end = start + timedelta(days=1)
+
+            template = None
+            if "CATEGORIES" in props:
+                # CATEGORIES:Praca,Sport — pierwsza kategoria ze znanym szablonem
+                for name in props["CATEGORIES"][0][1].split(","):
+                    template = templates.get(unescape_text(name).strip().lower())
+                    if template is not None:
+                        break
+
+            values = _event_values(
+                text("SUMMARY"),
+                start,
+                end,
+                text("DESCRIPTION"),
+                text("LOCATION"),
+                template,
+            )
+            if "RRULE" not in props:
+                yield "event", values, [], None
+                continue
+
+            rule = props["RRULE"][0][1].strip()
+            values["rrule"] = rule
+            values["until_datetime"] = series_until(
+                rule, values["start_datetime"], values["end_datetime"]
+            )
+            exdates = []
+            for params, value in props.get("EXDATE", []):
+                for item in value.split(","):
+                    exdates.append(
+                        _as_datetime(parse_value_datetime(item, params, zone), zone)
+                    )
+            yield "series", values, exdates, None
+        except (ValueError, TypeError, KeyError, OverflowError) as exc:
+            yield "skip", None, [], f"{text('SUMMARY') or 'VEVENT'}: {exc}"
+
+
+def _parse_csv_datetime(value: str, zone: tzinfo) -> datetime:
+    parsed = date_parser.parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=zone)
+    return parsed
+
+
+def csv_records(
+    lines: Iterable[str], zone: tzinfo, templates: Dict[str, ActivityTemplate]
+) -> Iterator[Record]:
+    """
+    CSV z nagłówkiem: title/subject, start, end, description, location,
+    template/category (wielkość liter w nagłówku bez znaczenia).
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    fields = [CSV_COLUMNS.get(name.strip().lower()) for name in header]
+    if "start" not in fields:
+        raise ValueError("CSV header must contain a start column")
+
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        data = {
+            field: cell.strip()
+            for field, cell in zip(fields, row)
+            if field is not None and cell.strip()
+        }
+        try:
+            if "start" not in data:
+                raise ValueError("missing start")
+            start = _parse_csv_datetime(data["start"], zone)
+            end = _parse_csv_datetime(data["end"], zone) if "end" in data else None
+            yield "event", _event_values(
+                data.get("title"),
+                start,
+                end,
+                data.get("description"),
+                data.get("location"),
+                templates.get(data.get("template", "").lower()),
+            ), [], None
+        except (ValueError, OverflowError) as exc:
+            yield "skip", None, [], f"Line {reader.line_num}: {exc}"
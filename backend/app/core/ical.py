@@ -0,0 +1,233 @@
+"""
+iCalendar (RFC 5545) — tylko to, czego potrzebują feed .ics i import:
+VEVENT z czasem UTC albo całodniowy, RRULE/EXDATE/RECURRENCE-ID dla serii.
+"""
+
+import re
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+CRLF = "\r\n"
+PRODID = "-//ADHD Calendar//Feed//PL"
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Zawija linię do 75 oktetów (kontynuacja zaczyna się spacją)."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + CRLF
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Nie tniemy w środku znaku UTF-8
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74
+    return (CRLF + " ").join(parts) + CRLF
+
+
+def format_datetime(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def format_date(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def calendar_header(name: str) -> str:
+    return "".join(
+        fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape_text(name)}",
+        )
+    )
+
+
+CALENDAR_FOOTER = "END:VCALENDAR" + CRLF
+
+
+def vevent(
+    uid: str,
+    stamp: datetime,
+    summary: str,
+    start,
+    end=None,
+    description: Optional[str] = None,
+    location: Optional[str] = None,
+    rrule: Optional[str] = None,
+    exdates: Iterable[datetime] = (),
+    recurrence_id: Optional[datetime] = None,
+    transparent: bool = False,
+) -> str:
+    """
+    Jeden VEVENT. `start`/`end` typu date = wydarzenie całodniowe,
+    datetime = czas UTC.
+    """
+    lines = ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTAMP:{format_datetime(stamp)}"]
+    if isinstance(start, datetime):
+        lines.append(f"DTSTART:{format_datetime(start)}")
+        if end is not None:
+            lines.append(f"DTEND:{format_datetime(end)}")
+    else:
+        lines.append(f"DTSTART;VALUE=DATE:{format_date(start)}")
+        if end is not None:
+            lines.append(f"DTEND;VALUE=DATE:{format_date(end)}")
+    if recurrence_id is not None:
+        lines.append(f"RECURRENCE-ID:{format_datetime(recurrence_id)}")
+    if rrule:
+        lines.append(f"RRULE:{rrule}")
+    for exdate in exdates:
+        lines.append(f"EXDATE:{format_datetime(exdate)}")
+    lines.append(f"SUMMARY:{escape_text(summary)}")
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if location:
+        lines.append(f"LOCATION:{escape_text(location)}")
+    if transparent:
+        lines.append("TRANSP:TRANSPARENT")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+
+# ── Odczyt (import) ───────────────────────────────────────────────────────────
+
+
+def unescape_text(value: str) -> str:
+    if "\\" not in value:
+        return value
+    out = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            nxt = next(chars, "")
+            out.append("\n" if nxt in ("n", "N") else nxt)
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Skleja linie kontynuacji (zaczynające się spacją/tabem) — strumieniowo."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_property(line: str) -> Tuple[str, Dict[str, str], str]:
+    """'DTSTART;TZID=Europe/Warsaw:20261019T090000' → (nazwa, parametry, wartość)."""
+    head, sep, value = line.partition(":")
+    if ";" not in head:
+        return head.upper(), {}, value
+    # Dwukropek może wystąpić w cudzysłowie parametru (np. TZID="a:b")
+    while head.count('"') % 2 and sep:
+        extra, sep, value = value.partition(":")
+        head = f"{head}:{extra}"
+    name, *params = head.split(";")
+    parsed = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parsed[key.upper()] = param_value.strip('"')
+    return name.upper(), parsed, value
+
+
+def iter_vevents(lines: Iterable[str]) -> Iterator[Dict[str, list]]:
+    """
+    Kolejne VEVENT-y jako {NAZWA: [(parametry, wartość), ...]} — bez wczytywania
+    całego pliku. Zagnieżdżone komponenty (VALARM) są pomijane.
+    """
+    component = None
+    depth = 0
+    for line in unfold_lines(lines):
+        name, params, value = parse_property(line)
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and component is None:
+                component, depth = {}, 0
+            elif component is not None:
+                depth += 1
+        elif name == "END" and component is not None:
+            if depth:
+                depth -= 1
+            elif value.upper() == "VEVENT":
+                yield component
+                component = None
+        elif component is not None and not depth:
+            component.setdefault(name, []).append((params, value))
+
+
+@lru_cache(maxsize=64)
+def _zone(tzid: str) -> Optional[tzinfo]:
+    try:
+        return ZoneInfo(tzid.lstrip("/"))
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def parse_value_datetime(
+    value: str, params: Dict[str, str], default_zone: tzinfo
+) -> Union[date, datetime]:
+    """DATE → date; DATE-TIME w UTC (Z), z TZID albo „pływający” (default_zone)."""
+    value = value.strip()
+    # Cięcie po pozycjach zamiast strptime — to najgorętsza ścieżka importu
+    if params.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+        if len(value) != 8 or not value.isdigit():
+            raise ValueError(f"Invalid DATE: {value}")
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    if len(value) not in (15, 16) or value[8] != "T" or not value[9:15].isdigit():
+        raise ValueError(f"Invalid DATE-TIME: {value}")
+    zone = default_zone
+    if value.endswith("Z"):
+        zone = timezone.utc
+    elif "TZID" in params:
+        zone = _zone(params["TZID"]) or default_zone
+    return datetime(
+        int(value[:4]),
+        int(value[4:6]),
+        int(value[6:8]),
+        int(value[9:11]),
+        int(value[11:13]),
+        int(value[13:15]),
+        tzinfo=zone,
+    )
+
+
+_DURATION = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+def parse_duration(value: str) -> timedelta:
+    match = _DURATION.match(value.strip().upper())
+    if not match:
+        raise ValueError(f"Invalid DURATION: {value}")
+    parts = {k: int(v) for k, v in match.groupdict().items() if v and k != "sign"}
+    delta = timedelta(**parts)
+    return -delta if match.group("sign") == "-" else delta
@@ -0,0 +1,38 @@
+"""
+Nieprzezroczyste kursory do paginacji keyset.
+Kursor = base64url(JSON listy wartości klucza sortowania ostatniego wiersza).
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+from fastapi import HTTPException
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Zwraca `size` wartości z kursora; HTTP 400 gdy kursor jest uszkodzony."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def cursor_datetime(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
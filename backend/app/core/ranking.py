@@ -0,0 +1,64 @@
+"""
+Kolejność tasków jako klucze leksykograficzne (fractional indexing):
+klucz to ułamek 0.xyz w systemie base-62, porównywany jak napis (kolumna
+z COLLATE "C"). Między dowolne dwa klucze da się wstawić trzeci, więc
+przeciągnięcie zapisuje jeden wiersz. Klucze wydłużają się przy wielu
+wstawieniach w to samo miejsce — wtedy spread_ranks() rozkłada je od nowa.
+"""
+
+from typing import List, Optional
+
+# Kolejność znaków = kolejność bajtów (cyfry < wielkie < małe litery)
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+_INDEX = {char: i for i, char in enumerate(DIGITS)}
+
+# Dłuższy klucz = przebudowa kolejności kwadrantu w tle
+REBALANCE_LENGTH = 24
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Klucz ściśle między `before` a `after` (None = początek / koniec listy).
+    Klucze nie kończą się zerem — wtedy porządek napisów = porządek ułamków.
+    """
+    before = before or ""
+    if after is not None and before >= after:
+        raise ValueError(f"{before!r} is not before {after!r}")
+    if after is not None:
+        # Wspólny prefiks (brakujące cyfry `before` to zera)
+        n = 0
+        while (before[n] if n < len(before) else "0") == after[n]:
+            n += 1
+        if n:
+            return after[:n] + rank_between(before[n:], after[n:])
+    low = _INDEX[before[0]] if before else 0
+    high = _INDEX[after[0]] if after is not None else BASE
+    if high - low > 1:
+        # Dopisywanie na koniec / początek: krok o jedną cyfrę, nie połowa
+        # przedziału — klucz rośnie o znak co ~60 dopisań zamiast co kilka
+        if after is None and before:
+            return DIGITS[low + 1]
+        if after is not None and not before:
+            return DIGITS[high - 1]
+        return DIGITS[(low + high) // 2]
+    # Sąsiednie cyfry: pierwsza cyfra `after` wystarczy, jeśli after jest dłuższy
+    if after is not None and len(after) > 1:
+        return after[:1]
+    return DIGITS[low] + rank_between(before[1:], None)
+
+
+def spread_ranks(count: int) -> List[str]:
+    """`count` kluczy rozłożonych równo — najkrótsze możliwe przy tej liczbie."""
+    width = 1
+    while BASE**width <= count:
+        width += 1
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * BASE**width // (count + 1)
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
@@ -0,0 +1,170 @@
+"""
+Rozwijanie serii cyklicznych (EventSeries) w wirtualne wystąpienia.
+Reguły w formacie RRULE (RFC 5545), parsowane przez python-dateutil.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from dateutil.rrule import rrule, rrulestr
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.models.event_series import EventSeries, EventSeriesException
+from app.schemas.event import EventOut
+
+# Limit wystąpień serii z COUNT — jak occurrences w POST /events/recurring
+MAX_COUNT = 730
+# HOURLY/MINUTELY/SECONDLY nie są przyjmowane
+FREQUENCIES = {"DAILY", "WEEKLY", "MONTHLY", "YEARLY"}
+
+
+def interval_days_rule(interval_days: int, occurrences: int) -> str:
+    """Reguła odpowiadająca staremu INTERVAL_DAYS=n × occurrences."""
+    return f"FREQ=DAILY;INTERVAL={interval_days};COUNT={occurrences}"
+
+
+def parse_rule(rule: str, dtstart: datetime) -> rrule:
+    """Parsuje RRULE względem DTSTART; ValueError dla niepoprawnej reguły."""
+    parsed = rrulestr(rule, dtstart=dtstart)
+    if not isinstance(parsed, rrule):
+        raise ValueError("Only a single RRULE is supported")
+    return parsed
+
+
+def check_rule(rule: str, dtstart: datetime) -> rrule:
+    """
+    parse_rule dla zapisu nowej serii: częstotliwość co najmniej dzienna
+    (seria bez końca jest rozwijana od DTSTART przy każdym odczycie)
+    i COUNT ≤ MAX_COUNT. ValueError dla reguły spoza tych granic.
+    """
+    parsed = parse_rule(rule, dtstart)
+    parts = dict(
+        part.split("=", 1)
+        for part in rule.upper().removeprefix("RRULE:").split(";")
+        if "=" in part
+    )
+    if parts.get("FREQ") not in FREQUENCIES:
+        raise ValueError(f"Unsupported RRULE frequency: {parts.get('FREQ')}")
+    if int(parts.get("COUNT", 0)) > MAX_COUNT:
+        raise ValueError(f"RRULE COUNT must be <= {MAX_COUNT}")
+    return parsed
+
+
+def is_bounded(rule: str) -> bool:
+    upper = rule.upper()
+    return "COUNT=" in upper or "UNTIL=" in upper
+
+
+def series_until(rule: str, start: datetime, end: datetime) -> Optional[datetime]:
+    """
+    Koniec ostatniego wystąpienia — None dla serii bez COUNT/UNTIL.
+    Sprawdza regułę (check_rule) także dla serii bez końca.
+    """
+    parsed = check_rule(rule, start)
+    if not is_bounded(rule):
+        return None
+    occurrences = list(parsed)
+    if not occurrences:
+        return start
+    return occurrences[-1] + (end - start)
+
+
+def _occurrence(
+    series: EventSeries,
+    original_start: datetime,
+    start: datetime,
+    end: datetime,
+    exception: Optional[EventSeriesException] = None,
+) -> EventOut:
+    title = series.title
+    description = series.description
+    location = series.location
+    if exception is not None:
+        title = exception.title or title
+        if exception.description is not None:
+            description = exception.description
+        if exception.location is not None:
+            location = exception.location
+    return EventOut(
+        id=None,
+        series_id=series.id,
+        occurrence_start=original_start,
+        title=title,
+        start_datetime=start,
+        end_datetime=end,
+        description=description,
+        location=location,
+        recurrence_rule=series.rrule,
+        activity_template_id=series.activity_template_id,
+        is_background=series.is_background,
+        color=series.color,
+        icon=series.icon,
+        eisenhower_quadrant=series.eisenhower_quadrant,
+        reminder_minutes=series.reminder_minutes,
+        user_id=series.user_id,
+        created_at=series.created_at,
+        activity_template=series.activity_template,
+    )
+
+
+def expand_series(
+    series: EventSeries, start: datetime, end: datetime
+) -> List[EventOut]:
+    """
+    Wystąpienia serii nachodzące na okno [start, end), z naniesionymi wyjątkami.
+    Koszt: O(wystąpień do końca okna) w pamięci, zero zapytań poza załadowaniem
+    series.exceptions / series.activity_template.
+    """
+    duration = series.end_datetime - series.start_datetime
+    rule = parse_rule(series.rrule, series.start_datetime)
+    exceptions = {ex.original_start: ex for ex in series.exceptions}
+
+    result = []
+    # start - duration < occ < end  ⇔  [occ, occ + duration) nachodzi na okno
+    for occ in rule.between(start - duration, end):
+        if occ not in exceptions:
+            result.append(_occurrence(series, occ, occ, occ + duration))
+
+    # Wyjątki mogą przesunąć wystąpienie do okna (albo poza nie)
+    for ex in exceptions.values():
+        if ex.is_cancelled:
+            continue
+        occ_start = ex.start_datetime or ex.original_start
+        occ_end = ex.end_datetime or occ_start + duration
+        if occ_start < end and occ_end > start:
+            result.append(
+                _occurrence(series, ex.original_start, occ_start, occ_end, ex)
+            )
+
+    result.sort(key=lambda ev: ev.start_datetime)
+    return result
+
+
+def occurrence_exists(series: EventSeries, original_start: datetime) -> bool:
+    return original_start in parse_rule(series.rrule, series.start_datetime)
+
+
+def series_in_window(
+    db: Session, user_id: int, start: datetime, end: datetime
+) -> List[EventOut]:
+    """Wirtualne wystąpienia serii usera nachodzące na okno [start, end)."""
+    series_list = (
+        db.query(EventSeries)
+        .options(
+            joinedload(EventSeries.activity_template),
+            selectinload(EventSeries.exceptions),
+        )
+        .filter(
+            EventSeries.user_id == user_id,
+            EventSeries.start_datetime < end,
+            or_(
+                EventSeries.until_datetime.is_(None),
+                EventSeries.until_datetime > start,
+            ),
+        )
+    )
+    occurrences = []
+    for series in series_list:
+        occurrences.extend(expand_series(series, start, end))
+    return occurrences
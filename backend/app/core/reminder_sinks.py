@@ -0,0 +1,82 @@
+"""
+Kanały dostarczania przypomnień — wybierane w REMINDER_SINKS (po przecinku):
+
+    log      dopisuje linie JSON do REMINDER_LOG_PATH
+    webhook  POST z listą przypomnień (JSON) na REMINDER_WEBHOOK_URL
+    sse      pg_notify('reminders') — odbiera GET /api/v1/reminders/stream
+"""
+
+import json
+import sys
+import urllib.error
+import urllib.request
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.reminders import Reminder
+
+# Kanał LISTEN/NOTIFY między workerem a procesami API
+NOTIFY_CHANNEL = "reminders"
+WEBHOOK_TIMEOUT = 5
+
+
+class ReminderSink:
+    def send(self, db: Session, reminders: List[Reminder]) -> None:
+        raise NotImplementedError
+
+
+class LogSink(ReminderSink):
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def send(self, db: Session, reminders: List[Reminder]) -> None:
+        with open(self.path, "a", encoding="utf-8") as log:
+            for reminder in reminders:
+                log.write(json.dumps(reminder.payload(), ensure_ascii=False) + "\n")
+
+
+class WebhookSink(ReminderSink):
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+    def send(self, db: Session, reminders: List[Reminder]) -> None:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps([r.payload() for r in reminders]).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            urllib.request.urlopen(request, timeout=WEBHOOK_TIMEOUT).close()
+        except (urllib.error.URLError, OSError) as exc:
+            # Webhook niedostępny nie zatrzymuje pozostałych kanałów
+            print(f"Reminder webhook failed: {exc}", file=sys.stderr)
+
+
+class NotifySink(ReminderSink):
+    """NOTIFY w transakcji workera — dociera do słuchaczy po commicie."""
+
+    def send(self, db: Session, reminders: List[Reminder]) -> None:
+        for reminder in reminders:
+            db.execute(
+                select(func.pg_notify(NOTIFY_CHANNEL, json.dumps(reminder.payload())))
+            )
+
+
+def build_sinks(names: str) -> List[ReminderSink]:
+    sinks = []
+    for name in (part.strip() for part in names.split(",")):
+        if name == "log":
+            sinks.append(LogSink(settings.REMINDER_LOG_PATH))
+        elif name == "webhook":
+            if not settings.REMINDER_WEBHOOK_URL:
+                raise ValueError("REMINDER_WEBHOOK_URL is not set")
+            sinks.append(WebhookSink(settings.REMINDER_WEBHOOK_URL))
+        elif name == "sse":
+            sinks.append(NotifySink())
+        elif name:
+            raise ValueError(f"Unknown reminder sink: {name}")
+    return sinks
@@ -0,0 +1,350 @@
+"""
+Przypomnienia: kolejka (kopiec po czasie wysłania) ładowana przyrostowo.
+remind_at eventów i tasków liczy trigger w bazie (migracja 0018), z
+częściowymi indeksami — worker czyta tylko kolejne okno czasu i wiersze
+zmienione od ostatniego przebiegu, nigdy całej tabeli. Wystąpienia serii
+są rozwijane w pamięci dla okna, tylko dla serii z next_remind_at w oknie
+(migracja 0026). Przed wysłaniem przypomnienie jest sprawdzane z bazą
+(przesunięty/usunięty event, zrobiony task).
+"""
+
+import heapq
+import itertools
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Integer,
+    bindparam,
+    column,
+    literal_column,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.recurrence import expand_series, occurrence_exists, parse_rule
+from app.models.eisenhower_task import EisenhowerTask
+from app.models.event import Event
+from app.models.event_series import EventSeries
+
+
+class Reminder(NamedTuple):
+    at: datetime
+    # event | occurrence | task
+    kind: str
+    # events.id / event_series.id / eisenhower_tasks.id
+    entity_id: int
+    # Tylko dla wystąpień serii — original_start
+    occurrence_start: Optional[datetime]
+    user_id: int
+    title: str
+    # Początek eventu albo due_date taska
+    starts_at: datetime
+
+    @property
+    def key(self) -> tuple:
+        return self.kind, self.entity_id, self.occurrence_start
+
+    def payload(self) -> dict:
+        return {
+            "type": self.kind,
+            "id": self.entity_id,
+            "occurrence_start": (
+                self.occurrence_start.isoformat() if self.occurrence_start else None
+            ),
+            "user_id": self.user_id,
+            "title": self.title,
+            "starts_at": self.starts_at.isoformat(),
+            "remind_at": self.at.isoformat(),
+        }
+
+
+def _remind_at(model):
+    """Kolumna utrzymywana przez trigger — niemapowana w ORM."""
+    return literal_column(f"{model.__tablename__}.remind_at", DateTime(timezone=True))
+
+
+# event_series.next_remind_at — pisana tylko przez workera, poza modelem ORM
+_series_next = table(
+    "event_series",
+    column("id", Integer),
+    column("change_seq", BigInteger),
+    column("next_remind_at", DateTime(timezone=True)),
+)
+
+
+class ReminderQueue:
+    """
+    Kopiec (czas wysłania, kolejność, przypomnienie). Przypomnienie o tym
+    samym kluczu dodane ponownie z innym czasem zastępuje poprzednie —
+    stary wpis zostaje w kopcu, ale jest pomijany przy zdejmowaniu.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, int, Reminder]] = []
+        self._order = itertools.count()
+        # klucz → aktualny czas wysłania
+        self._pending: Dict[tuple, datetime] = {}
+        # klucz → czas już wysłanego przypomnienia (bez dubli po edycji)
+        self._sent: Dict[tuple, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(self, reminder: Reminder) -> None:
+        key = reminder.key
+        if self._pending.get(key) == reminder.at or self._sent.get(key) == reminder.at:
+            return
+        self._pending[key] = reminder.at
+        heapq.heappush(self._heap, (reminder.at, next(self._order), reminder))
+
+    def next_at(self) -> Optional[datetime]:
+        while (
+            self._heap and self._pending.get(self._heap[0][2].key) != self._heap[0][0]
+        ):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[Reminder]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            at, _, reminder = heapq.heappop(self._heap)
+            if self._pending.get(reminder.key) != at:
+                continue
+            del self._pending[reminder.key]
+            self._sent[reminder.key] = at
+            due.append(reminder)
+        return due
+
+    def forget_sent(self, before: datetime) -> None:
+        """Pamięć wysłanych tylko na okres, w którym mogą wrócić ze zmian."""
+        self._sent = {key: at for key, at in self._sent.items() if at >= before}
+
+
+def _event_reminders(rows: Iterable) -> List[Reminder]:
+    return [
+        Reminder(
+            row.remind_at, "event", row.id, None, row.user_id, row.title, row.start
+        )
+        for row in rows
+    ]
+
+
+def _task_reminders(rows: Iterable) -> List[Reminder]:
+    return [
+        Reminder(row.remind_at, "task", row.id, None, row.user_id, row.title, row.start)
+        for row in rows
+    ]
+
+
+def _event_query():
+    return select(
+        Event.id,
+        Event.user_id,
+        Event.title,
+        Event.start_datetime.label("start"),
+        _remind_at(Event).label("remind_at"),
+    )
+
+
+def _task_query():
+    return select(
+        EisenhowerTask.id,
+        EisenhowerTask.user_id,
+        EisenhowerTask.title,
+        EisenhowerTask.due_date.label("start"),
+        _remind_at(EisenhowerTask).label("remind_at"),
+    )
+
+
+def _occurrence_reminders(
+    series_list: Iterable[EventSeries], start: datetime, end: datetime
+) -> List[Reminder]:
+    """Wystąpienia, których przypomnienie wypada w [start, end)."""
+    reminders = []
+    for series in series_list:
+        offset = timedelta(minutes=series.reminder_minutes)
+        for occurrence in expand_series(series, start + offset, end + offset):
+            at = occurrence.start_datetime - offset
+            if start <= at < end:
+                reminders.append(
+                    Reminder(
+                        at,
+                        "occurrence",
+                        series.id,
+                        occurrence.occurrence_start,
+                        series.user_id,
+                        occurrence.title,
+                        occurrence.start_datetime,
+                    )
+                )
+    return reminders
+
+
+def _series_query():
+    return (
+        select(EventSeries)
+        .options(selectinload(EventSeries.exceptions))
+        .where(EventSeries.reminder_minutes.isnot(None))
+    )
+
+
+def _next_reminder(series: EventSeries, after: datetime) -> Optional[datetime]:
+    """Pierwsze przypomnienie wystąpienia serii od `after` (None = już żadnego)."""
+    offset = timedelta(minutes=series.reminder_minutes)
+    exceptions = {ex.original_start: ex for ex in series.exceptions}
+    candidates = [
+        (ex.start_datetime or ex.original_start) - offset
+        for ex in exceptions.values()
+        if not ex.is_cancelled
+        and (ex.start_datetime or ex.original_start) - offset >= after
+    ]
+    rule = parse_rule(series.rrule, series.start_datetime)
+    for occ in rule.xafter(after + offset, inc=True):
+        if occ not in exceptions:
+            candidates.append(occ - offset)
+            break
+    return min(candidates, default=None)
+
+
+def _advance_series(db: Session, series_list: List[EventSeries], after: datetime):
+    """
+    next_remind_at = następne przypomnienie od `after`. Tylko gdy seria się
+    nie zmieniła od odczytu (change_seq) — inaczej trigger już ją cofnął.
+    """
+    if not series_list:
+        return
+    db.execute(
+        update(_series_next)
+        .where(
+            _series_next.c.id == bindparam("series_id"),
+            _series_next.c.change_seq == bindparam("seen_seq"),
+        )
+        .values(next_remind_at=bindparam("next_at")),
+        [
+            {
+                "series_id": series.id,
+                "seen_seq": series.change_seq,
+                "next_at": _next_reminder(series, after),
+            }
+            for series in series_list
+        ],
+    )
+
+
+def reminders_between(db: Session, start: datetime, end: datetime) -> List[Reminder]:
+    """
+    Przypomnienia z remind_at w [start, end) — zakresy po indeksach remind_at.
+    Serie: tylko te z next_remind_at < end, przesuwane potem za `end` (zapis
+    bez commitu — kolejne wywołania muszą iść rosnącymi oknami).
+    """
+    reminders = _event_reminders(
+        db.execute(
+            _event_query().where(_remind_at(Event) >= start, _remind_at(Event) < end)
+        )
+    )
+    reminders += _task_reminders(
+        db.execute(
+            _task_query().where(
+                _remind_at(EisenhowerTask) >= start,
+                _remind_at(EisenhowerTask) < end,
+            )
+        )
+    )
+    series_list = db.scalars(
+        _series_query().where(
+            literal_column("event_series.next_remind_at", DateTime(timezone=True)) < end
+        )
+    ).all()
+    reminders += _occurrence_reminders(series_list, start, end)
+    _advance_series(db, series_list, end)
+    return reminders
+
+
+def reminders_changed(
+    db: Session, since: datetime, start: datetime, end: datetime
+) -> List[Reminder]:
+    """
+    Przypomnienia w [start, end) z wierszy zmienionych od `since` (nowe albo
+    przesunięte już po załadowaniu ich okna) — po indeksach na updated_at.
+    """
+    reminders = _event_reminders(
+        db.execute(
+            _event_query().where(
+                _remind_at(Event).isnot(None),
+                Event.updated_at >= since,
+                _remind_at(Event) >= start,
+                _remind_at(Event) < end,
+            )
+        )
+    )
+    reminders += _task_reminders(
+        db.execute(
+            _task_query().where(
+                _remind_at(EisenhowerTask).isnot(None),
+                EisenhowerTask.updated_at >= since,
+                _remind_at(EisenhowerTask) >= start,
+                _remind_at(EisenhowerTask) < end,
+            )
+        )
+    )
+    series_list = db.scalars(_series_query().where(EventSeries.updated_at >= since))
+    return reminders + _occurrence_reminders(series_list, start, end)
+
+
+def _occurrence_valid(series: Optional[EventSeries], reminder: Reminder) -> bool:
+    """
+    Wystąpienie nadal w regule pod tym samym original_start, nie odwołane,
+    a jego (ew. przesunięty wyjątkiem) początek minus reminder_minutes to
+    wciąż czas z kolejki.
+    """
+    if series is None or series.reminder_minutes is None:
+        return False
+    if not occurrence_exists(series, reminder.occurrence_start):
+        return False
+    starts_at = reminder.occurrence_start
+    for exception in series.exceptions:
+        if exception.original_start == reminder.occurrence_start:
+            if exception.is_cancelled:
+                return False
+            starts_at = exception.start_datetime or starts_at
+    return starts_at - timedelta(minutes=series.reminder_minutes) == reminder.at
+
+
+def still_valid(db: Session, reminders: List[Reminder]) -> List[Reminder]:
+    """
+    Odsiewa przypomnienia nieaktualne w chwili wysłania: event przesunięty
+    lub usunięty, task zrobiony (remind_at = NULL), wystąpienie serii
+    odwołane, przesunięte lub usunięte razem z serią. Jedno zapytanie na
+    rodzaj (serie z wyjątkami — selectinload).
+    """
+    current = {}
+    for kind, model in (("event", Event), ("task", EisenhowerTask)):
+        ids = {r.entity_id for r in reminders if r.kind == kind}
+        if not ids:
+            continue
+        for entity_id, value in db.execute(
+            select(model.id, _remind_at(model)).where(model.id.in_(ids))
+        ):
+            current[kind, entity_id] = value
+    series_ids = {r.entity_id for r in reminders if r.kind == "occurrence"}
+    series = {}
+    if series_ids:
+        series = {
+            item.id: item
+            for item in db.query(EventSeries)
+            .options(selectinload(EventSeries.exceptions))
+            .filter(EventSeries.id.in_(series_ids))
+        }
+    valid = []
+    for reminder in reminders:
+        if reminder.kind == "occurrence":
+            if _occurrence_valid(series.get(reminder.entity_id), reminder):
+                valid.append(reminder)
+        elif current.get((reminder.kind, reminder.entity_id)) == reminder.at:
+            valid.append(reminder)
+    return valid
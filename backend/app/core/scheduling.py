@@ -0,0 +1,148 @@
+"""
+Automatyczne planowanie tasków Eisenhowera w wolnych slotach kalendarza.
+Zajętość = scalone przedziały eventów (zamiatanie po posortowanych
+początkach), wolne sloty = okna dzienne minus zajętość, przydział zachłanny
+(first-fit) po taskach posortowanych wg kwadrantu i due_date.
+Całość O((n + m) log(n + m)) dla n eventów i m tasków.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple, TypeVar
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.orm import Session
+
+from app.core.recurrence import series_in_window
+from app.models.eisenhower_task import EisenhowerTask
+from app.models.event import Event
+
+T = TypeVar("T")
+
+Span = Tuple[datetime, datetime]
+
+# Kolejność jak w macierzy: Zrób teraz, Zaplanuj, Deleguj, Eliminuj
+QUADRANT_ORDER = ("do_first", "schedule", "delegate", "eliminate")
+
+
+def task_quadrant(urgent: bool, important: bool) -> str:
+    if urgent and important:
+        return "do_first"
+    if important:
+        return "schedule"
+    if urgent:
+        return "delegate"
+    return "eliminate"
+
+
+def rank_tasks(tasks: Iterable[EisenhowerTask]) -> List[EisenhowerTask]:
+    """Kwadrant, potem najbliższy due_date (bez terminu na końcu), potem wiek."""
+    return sorted(
+        tasks,
+        key=lambda task: (
+            QUADRANT_ORDER.index(task_quadrant(task.urgent, task.important)),
+            task.due_date is None,
+            task.due_date or datetime.min,
+            task.created_at or datetime.min,
+            task.id,
+        ),
+    )
+
+
+def merge_intervals(spans: Iterable[Span]) -> List[Span]:
+    """Sortuje i skleja nachodzące/stykające się przedziały."""
+    merged: List[Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def daily_windows(
+    start: datetime, end: datetime, hour_start: int, hour_end: int, zone: ZoneInfo
+) -> List[Span]:
+    """Okna [hour_start, hour_end) czasu lokalnego `zone` przycięte do [start, end)."""
+    windows = []
+    day: date = start.astimezone(zone).date()
+    last: date = end.astimezone(zone).date()
+    while day <= last:
+        window_start = datetime.combine(day, time(hour_start), tzinfo=zone)
+        window_end = datetime.combine(day, time(0), tzinfo=zone) + timedelta(
+            hours=hour_end
+        )
+        window_start = max(window_start.astimezone(timezone.utc), start)
+        window_end = min(window_end.astimezone(timezone.utc), end)
+        if window_start < window_end:
+            windows.append((window_start, window_end))
+        day += timedelta(days=1)
+    return windows
+
+
+def free_intervals(windows: Sequence[Span], busy: Sequence[Span]) -> List[Span]:
+    """
+    Okna minus scalona zajętość — dwa wskaźniki po posortowanych listach.
+    `busy` musi pochodzić z merge_intervals().
+    """
+    free = []
+    index = 0
+    for window_start, window_end in windows:
+        cursor = window_start
+        while index < len(busy) and busy[index][1] <= cursor:
+            index += 1
+        scan = index
+        while scan < len(busy) and busy[scan][0] < window_end:
+            busy_start, busy_end = busy[scan]
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            scan += 1
+        if cursor < window_end:
+            free.append((cursor, window_end))
+    return free
+
+
+def place_tasks(
+    tasks: Sequence[T], free: Sequence[Span], duration: timedelta, gap: timedelta
+) -> List[Tuple[T, Optional[Span]]]:
+    """
+    First-fit w kolejności `tasks` — wszystkie bloki mają ten sam czas, więc
+    slot za krótki dla jednego taska jest za krótki dla każdego i wskaźnik
+    slotów tylko rośnie. None = brak miejsca w horyzoncie.
+    """
+    placed = []
+    index = 0
+    cursor = free[0][0] if free else None
+    for task in tasks:
+        slot = None
+        while index < len(free):
+            slot_start = max(cursor, free[index][0])
+            if slot_start + duration <= free[index][1]:
+                slot = (slot_start, slot_start + duration)
+                cursor = slot_start + duration + gap
+                break
+            index += 1
+        placed.append((task, slot))
+    return placed
+
+
+def busy_intervals(
+    db: Session, user_id: int, start: datetime, end: datetime
+) -> List[Span]:
+    """
+    Zajęte przedziały usera w [start, end): eventy (bez is_background) jednym
+    zapytaniem po indeksie okresu + wystąpienia serii — scalone.
+    """
+    rows = db.query(Event.start_datetime, Event.end_datetime).filter(
+        Event.user_id == user_id,
+        Event.overlaps(start, end),
+        Event.is_background.is_(False),
+    )
+    spans = [(row.start_datetime, row.end_datetime) for row in rows]
+    spans.extend(
+        (occurrence.start_datetime, occurrence.end_datetime)
+        for occurrence in series_in_window(db, user_id, start, end)
+        if not occurrence.is_background
+    )
+    return merge_intervals(spans)
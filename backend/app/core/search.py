@@ -0,0 +1,74 @@
+"""
+Wyszukiwanie pełnotekstowe po kolumnach search_vector (tsvector generowany
+w bazie, migracja 0017; HTML z opisów usunięty przed indeksowaniem).
+Kolumny nie są mapowane w ORM — tu są wyrażeniami po nazwie.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import DateTime, cast, func, literal, literal_column, null, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.models.activity_template import ActivityTemplate
+from app.models.contact import Contact
+from app.models.eisenhower_task import EisenhowerTask
+from app.models.event import Event
+from app.models.event_series import EventSeries
+
+SEARCH_CONFIG = "simple"
+# Więcej słów nie zawęża sensownie wyników, a wydłuża zapytanie
+MAX_TERMS = 8
+# ts_rank_cd: ranking / (1 + log(długość dokumentu)) — długie opisy nie wygrywają
+RANK_NORMALIZATION = 1
+
+_TERM = re.compile(r"\w+")
+
+# typ wyniku → (model, kolumna tytułu, kolumna daty albo None)
+SEARCH_TARGETS: Dict[str, Tuple] = {
+    "event": (Event, Event.title, Event.start_datetime),
+    "series": (EventSeries, EventSeries.title, EventSeries.start_datetime),
+    "task": (EisenhowerTask, EisenhowerTask.title, EisenhowerTask.due_date),
+    "template": (ActivityTemplate, ActivityTemplate.name, None),
+    "contact": (Contact, Contact.name, None),
+}
+
+
+def prefix_query(text: str) -> Optional[str]:
+    """
+    'spotk pra' → 'spotk:* & pra:*' — wyszukiwanie w trakcie pisania.
+    Tylko znaki słów, więc wynik jest bezpieczny dla to_tsquery().
+    """
+    terms = _TERM.findall(text.lower())[:MAX_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_vector(model):
+    return literal_column(f"{model.__tablename__}.search_vector", TSVECTOR)
+
+
+def search_branch(kind: str, user_id: int, tsquery: str, limit: int):
+    """
+    SELECT jednego typu: dopasowania usera po indeksie GIN (user_id,
+    search_vector), najlepsze `limit` wg rankingu.
+    """
+    model, title, when = SEARCH_TARGETS[kind]
+    query = func.to_tsquery(SEARCH_CONFIG, tsquery)
+    vector = search_vector(model)
+    rank = func.ts_rank_cd(vector, query, RANK_NORMALIZATION)
+    return (
+        select(
+            literal(kind).label("type"),
+            model.id.label("id"),
+            title.label("title"),
+            (when if when is not None else cast(null(), DateTime(timezone=True))).label(
+                "at"
+            ),
+            rank.label("rank"),
+        )
+        .where(model.user_id == user_id, vector.op("@@")(query))
+        .order_by(rank.desc())
+        .limit(limit)
+    )
@@ -11,6 +11,8 @@ from app.core.config import settings
 # Długość access tokena: krótka (15 min) — odświeżany przez refresh token
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 30
+# Token strumienia SSE (w URL) — ważny tylko na nawiązanie połączenia
+STREAM_TOKEN_EXPIRE_SECONDS = 60
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -51,6 +53,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def create_stream_token(user_id: int) -> str:
+    """Token w query stringu GET /reminders/stream — nie działa jako Bearer."""
+    expire = datetime.now(timezone.utc) + timedelta(seconds=STREAM_TOKEN_EXPIRE_SECONDS)
+    to_encode = {"sub": str(user_id), "exp": expire, "type": "stream"}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
 def create_refresh_token_str() -> str:
     """Generuje losowy, kryptograficznie bezpieczny refresh token."""
     return secrets.token_urlsafe(64)
@@ -0,0 +1,139 @@
+"""
+Numeracja zmian na potrzeby /sync (delta sync).
+
+Każda transakcja zapisująca dane usera dostaje jeden numer z
+users.change_seq (UPDATE ... RETURNING). Blokada wiersza usera trzyma się do
+commitu, więc numery jednego usera są nadawane w kolejności commitów —
+kursor `since` nigdy nie przeskoczy wiersza z transakcji, która jeszcze trwa.
+
+Zapisy przez ORM są stemplowane automatycznie (before_flush); instrukcje
+zbiorcze (insert()/update() poza ORM) muszą ustawić change_seq/updated_at
+same — przez next_change_seq().
+"""
+
+from datetime import datetime, timezone
+
+from typing import Iterable
+
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.models.activity_template import ActivityTemplate
+from app.models.contact import Contact
+from app.models.eisenhower_task import EisenhowerTask
+from app.models.event import Event
+from app.models.event_series import EventSeries, EventSeriesException
+from app.models.sync_tombstone import SyncTombstone
+from app.models.user import User
+
+# Klucz odpowiedzi /sync → model
+SYNCED_MODELS = {
+    "events": Event,
+    "event_series": EventSeries,
+    "eisenhower_tasks": EisenhowerTask,
+    "activity_templates": ActivityTemplate,
+    "contacts": Contact,
+}
+_SYNCED_TYPES = tuple(SYNCED_MODELS.values())
+
+
+def next_change_seq(db: Session, user_id: int) -> int:
+    """Numer zmiany bieżącej transakcji dla usera (jeden UPDATE na transakcję)."""
+    cache = db.info.setdefault("change_seq", {})
+    if user_id not in cache:
+        users = User.__table__
+        cache[user_id] = (
+            db.connection()
+            .execute(
+                update(users)
+                .where(users.c.id == user_id)
+                .values(
+                    change_seq=users.c.change_seq + 1,
+                    changed_at=datetime.now(timezone.utc),
+                )
+                .returning(users.c.change_seq)
+            )
+            .scalar_one()
+        )
+    return cache[user_id]
+
+
+def stamp(db: Session, user_id: int) -> dict:
+    """Wartości change_seq/updated_at do dołożenia w insert()/update() zbiorczym."""
+    return {
+        "change_seq": next_change_seq(db, user_id),
+        "updated_at": datetime.now(timezone.utc),
+    }
+
+
+def record_deletes(db: Session, user_id: int, entity: str, ids: Iterable[int]) -> None:
+    """Tombstone'y dla wierszy usuniętych instrukcją delete() poza ORM."""
+    ids = list(ids)
+    if not ids:
+        return
+    stamped = stamp(db, user_id)
+    db.execute(
+        insert(SyncTombstone.__table__),
+        [
+            {
+                "user_id": user_id,
+                "entity": entity,
+                "entity_id": entity_id,
+                "change_seq": stamped["change_seq"],
+                "deleted_at": stamped["updated_at"],
+            }
+            for entity_id in ids
+        ],
+    )
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _stamp_changes(session: Session, flush_context, instances) -> None:
+    deleted_users = {obj.id for obj in session.deleted if isinstance(obj, User)}
+    now = datetime.now(timezone.utc)
+
+    touched = [
+        obj
+        for obj in session.new
+        if isinstance(obj, _SYNCED_TYPES + (EventSeriesException,))
+    ] + [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, _SYNCED_TYPES + (EventSeriesException,))
+        and session.is_modified(obj)
+    ]
+    for obj in touched:
+        # Zmiana wyjątku = zmiana serii (klient dostaje serię z wyjątkami)
+        if isinstance(obj, EventSeriesException):
+            obj = obj.series
+            if obj is None:
+                continue
+        if obj.user_id in deleted_users:
+            continue
+        obj.change_seq = next_change_seq(session, obj.user_id)
+        obj.updated_at = now
+
+    for obj in list(session.deleted):
+        if isinstance(obj, EventSeriesException):
+            if obj.series is not None and obj.series not in session.deleted:
+                obj.series.change_seq = next_change_seq(session, obj.series.user_id)
+                obj.series.updated_at = now
+            continue
+        if not isinstance(obj, _SYNCED_TYPES) or obj.user_id in deleted_users:
+            continue
+        session.add(
+            SyncTombstone(
+                user_id=obj.user_id,
+                entity=obj.__tablename__,
+                entity_id=obj.id,
+                change_seq=next_change_seq(session, obj.user_id),
+                deleted_at=now,
+            )
+        )
+
+
+@event.listens_for(SessionLocal, "after_commit")
+@event.listens_for(SessionLocal, "after_rollback")
+def _reset_change_seq(session: Session) -> None:
+    session.info.pop("change_seq", None)
@@ -0,0 +1,85 @@
+"""
+Przebudowa kluczy kolejności tasków (eisenhower_tasks.rank): równe odstępy
+i najkrótsze klucze w kwadrancie, z zachowaniem obecnego porządku. Uruchamiana
+w tle, gdy przeciągnięcie wyprodukuje za długi klucz, albo ręcznie:
+
+    python -m app.db.ranks [--user-id ID]
+"""
+
+import argparse
+
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+
+from app.core.ranking import spread_ranks
+from app.core.sync import stamp
+from app.db.base import SessionLocal
+from app.models.eisenhower_task import EisenhowerTask
+
+
+def rebalance_quadrant(db: Session, user_id: int, urgent: bool, important: bool) -> int:
+    """Nowe klucze dla kwadrantu usera (taski bez klucza na końcu); zwraca liczbę."""
+    # Wiersz usera (numer zmiany) blokowany przed taskami — jak w reorder
+    stamped = stamp(db, user_id)
+    ids = db.scalars(
+        select(EisenhowerTask.id)
+        .where(
+            EisenhowerTask.user_id == user_id,
+            EisenhowerTask.urgent.is_(urgent),
+            EisenhowerTask.important.is_(important),
+        )
+        .order_by(
+            EisenhowerTask.rank.asc().nulls_last(),
+            EisenhowerTask.created_at,
+            EisenhowerTask.id,
+        )
+        # Równoległe przeciągnięcie w tym kwadrancie czeka na koniec przebudowy
+        .with_for_update()
+    ).all()
+    if not ids:
+        return 0
+    db.execute(
+        update(EisenhowerTask)
+        .where(EisenhowerTask.id.in_(ids))
+        .values(
+            rank=case(dict(zip(ids, spread_ranks(len(ids)))), value=EisenhowerTask.id),
+            **stamped,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return len(ids)
+
+
+def rebalance_later(user_id: int, urgent: bool, important: bool) -> None:
+    """Wersja dla BackgroundTasks — po wysłaniu odpowiedzi, we własnej sesji."""
+    db = SessionLocal()
+    try:
+        rebalance_quadrant(db, user_id, urgent, important)
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebalance Eisenhower task ranks")
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        quadrants = select(
+            EisenhowerTask.user_id, EisenhowerTask.urgent, EisenhowerTask.important
+        ).distinct()
+        if args.user_id is not None:
+            quadrants = quadrants.where(EisenhowerTask.user_id == args.user_id)
+        total = 0
+        for user_id, urgent, important in db.execute(quadrants).all():
+            total += rebalance_quadrant(db, user_id, urgent, important)
+            db.commit()
+        print(f"Rebalanced {total} task ranks.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
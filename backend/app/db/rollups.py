@@ -0,0 +1,122 @@
+"""
+Przebudowa event_time_rollups z tabeli events — na co dzień tabelę
+utrzymują triggery (migracja 0016); to narzędzie na wypadek rozjazdu,
+np. po ręcznych poprawkach z wyłączonymi triggerami. Liczone z events
+i z zarchiwizowanych eventów (archive_chunks).
+
+    python -m app.db.rollups [--user-id ID]
+"""
+
+import argparse
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Integer,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    true,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.models.archive_chunk import ArchiveChunk
+from app.models.event import Event
+from app.models.event_time_rollup import EventTimeRollup
+
+
+def rebuild_rollups(db: Session, user_id: Optional[int] = None) -> int:
+    """Przelicza rollup (wszystkich albo jednego usera) od zera; zwraca liczbę wierszy."""
+    # Blokada zapisów do events na czas przebudowy — inaczej trigger
+    # równoległej transakcji dodałby deltę do wierszy, które zaraz znikną
+    db.execute(text("LOCK TABLE events IN SHARE MODE"))
+
+    cleared = delete(EventTimeRollup)
+    if user_id is not None:
+        cleared = cleared.where(EventTimeRollup.user_id == user_id)
+    db.execute(cleared)
+
+    # Eventy z gorącej tabeli i z archiwum (archiwizacja nie zmienia rollupu)
+    archived = (
+        func.jsonb_to_recordset(ArchiveChunk.rows)
+        .table_valued(
+            column("start_datetime", DateTime(timezone=True)),
+            column("end_datetime", DateTime(timezone=True)),
+            column("activity_template_id", Integer),
+            column("is_background", Boolean),
+        )
+        .render_derived(name="archived", with_types=True)
+    )
+    hot = select(
+        Event.user_id,
+        Event.start_datetime,
+        Event.end_datetime,
+        Event.activity_template_id,
+        Event.is_background,
+    )
+    cold = (
+        select(
+            ArchiveChunk.user_id,
+            archived.c.start_datetime,
+            archived.c.end_datetime,
+            archived.c.activity_template_id,
+            archived.c.is_background,
+        )
+        .select_from(ArchiveChunk)
+        .join(archived, true())
+        .where(ArchiveChunk.entity == "events")
+    )
+    if user_id is not None:
+        hot = hot.where(Event.user_id == user_id)
+        cold = cold.where(ArchiveChunk.user_id == user_id)
+    events = union_all(hot, cold).subquery("all_events")
+
+    # Te same wyrażenia co w triggerach: dzień UTC, sekundy zaokrąglane per event
+    day = cast(func.timezone("UTC", events.c.start_datetime), Date)
+    seconds = func.sum(
+        cast(
+            func.extract("epoch", events.c.end_datetime - events.c.start_datetime),
+            BigInteger,
+        )
+    )
+    source = (
+        select(
+            events.c.user_id, day, events.c.activity_template_id, seconds, func.count()
+        )
+        .where(events.c.is_background.is_(False))
+        .group_by(events.c.user_id, day, events.c.activity_template_id)
+    )
+
+    result = db.execute(
+        insert(EventTimeRollup).from_select(
+            ["user_id", "day", "activity_template_id", "seconds", "count"], source
+        )
+    )
+    return result.rowcount
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild event_time_rollups")
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rows = rebuild_rollups(db, args.user_id)
+        db.commit()
+        print(f"Rebuilt {rows} rollup rows.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
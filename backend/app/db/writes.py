@@ -0,0 +1,98 @@
+"""
+Zapisy jednym round tripem: INSERT/UPDATE ... RETURNING prosto do identity
+map sesji — zamiast commit → refresh → ponowne zapytanie z joinedload.
+
+Odpowiedź należy zbudować (schemat *Out) PRZED commitem: commit wygasza
+atrybuty obiektów i ich odczyt oznaczałby kolejne SELECT-y.
+
+Instrukcje nie przechodzą przez flush, więc change_seq/updated_at (delta
+sync) są dokładane tutaj, przez app.core.sync.stamp().
+"""
+
+import csv
+import io
+from typing import Iterable, List, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.core.sync import stamp
+from app.db.base import Base
+
+M = TypeVar("M", bound=Base)
+
+_COPY_NULL = "\\N"
+
+
+def insert_returning(db: Session, model: Type[M], values: dict) -> M:
+    """INSERT ... RETURNING * → obiekt ORM (domyślne wartości kolumn stosowane)."""
+    stmt = (
+        insert(model).values(**values, **stamp(db, values["user_id"])).returning(model)
+    )
+    return db.scalars(stmt).one()
+
+
+def insert_many_returning(db: Session, model: Type[Base], rows: List[dict]) -> list:
+    """
+    Wiele wierszy jednym INSERT ... VALUES (...), (...) RETURNING
+    (insertmanyvalues) → mapowania kolumn w kolejności `rows`. Wiersze muszą
+    mieć te same klucze i tego samego usera.
+    """
+    if not rows:
+        return []
+    table = model.__table__
+    stamped = stamp(db, rows[0]["user_id"])
+    result = db.execute(
+        insert(table).returning(*table.c, sort_by_parameter_order=True),
+        [{**row, **stamped} for row in rows],
+    )
+    return list(result.mappings())
+
+
+def update_returning(
+    db: Session, model: Type[M], obj_id: int, user_id: int, values: dict
+) -> Optional[M]:
+    """
+    UPDATE ... WHERE id AND user_id RETURNING * → obiekt ORM albo None,
+    gdy wiersz nie istnieje / należy do innego usera (caller zwraca 404).
+    """
+    stmt = (
+        update(model)
+        .where(model.id == obj_id, model.user_id == user_id)
+        .values(**values, **stamp(db, user_id))
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    return db.scalars(stmt).one_or_none()
+
+
+def copy_rows(
+    db: Session, model: Type[Base], columns: Sequence[str], rows: Iterable[dict]
+) -> int:
+    """
+    COPY <tabela> (kolumny) FROM STDIN — najszybsze ładowanie masowe
+    w PostgreSQL, w transakcji sesji. Bez RETURNING i bez stemplowania:
+    change_seq/updated_at muszą już być w `rows`. Zwraca liczbę wierszy.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        # None → \N (NULL w COPY poniżej); pusty napis zostaje pustym napisem
+        writer.writerow(
+            [_COPY_NULL if row[name] is None else row[name] for name in columns]
+        )
+        count += 1
+    if not count:
+        return 0
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+    return count
@@ -6,6 +6,7 @@ from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 
 from app.api.v1 import api_router
+from app.core import sync  # noqa: F401 — rejestruje stemplowanie zmian (before_flush)
 from app.core.config import settings
 
 # ── Rate limiter — klucz: IP klienta ─────────────────────────────────────────
@@ -29,6 +30,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(api_router)
@@ -1,19 +1,28 @@
 from app.models.user import User
 from app.models.activity_template import ActivityTemplate
 from app.models.event import Event
+from app.models.event_series import EventSeries, EventSeriesException
 from app.models.eisenhower_task import EisenhowerTask
 from app.models.contact import Contact
 from app.models.invite_token import InviteToken
 from app.models.refresh_token import RefreshToken
 from app.models.audit_log import AuditLog
+from app.models.sync_tombstone import SyncTombstone
+from app.models.event_time_rollup import EventTimeRollup
+from app.models.archive_chunk import ArchiveChunk
 
 __all__ = [
     "User",
     "ActivityTemplate",
     "Event",
+    "EventSeries",
+    "EventSeriesException",
     "EisenhowerTask",
     "Contact",
     "InviteToken",
     "RefreshToken",
     "AuditLog",
+    "SyncTombstone",
+    "EventTimeRollup",
+    "ArchiveChunk",
 ]
@@ -1,7 +1,16 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, Integer, ForeignKey, DateTime, Text, Boolean
+from sqlalchemy import (
+    String,
+    Integer,
+    ForeignKey,
+    DateTime,
+    Text,
+    Boolean,
+    BigInteger,
+    Index,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -9,6 +18,9 @@ from app.db.base import Base
 
 class ActivityTemplate(Base):
     __tablename__ = "activity_templates"
+    __table_args__ = (
+        Index("ix_activity_templates_user_change_seq", "user_id", "change_seq"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -21,6 +33,11 @@ class ActivityTemplate(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Numer zmiany z users.change_seq — podstawa /sync?since=
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
 
     user: Mapped["User"] = relationship(back_populates="activity_templates")
     events: Mapped[list["Event"]] = relationship(back_populates="activity_template")
@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ArchiveChunk(Base):
+    """
+    Zimne archiwum: paczka przeniesionych wierszy events / eisenhower_tasks
+    jednego usera z jednego miesiąca, jako tablica JSONB (TOAST, lz4).
+    Wypełnia app.workers.archive; czytane tylko przy ?include_archived=true.
+    """
+
+    __tablename__ = "archive_chunks"
+    __table_args__ = (
+        Index("ix_archive_chunks_user_period", "user_id", "entity", "period_start"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    # Nazwa tabeli źródłowej: events | eisenhower_tasks
+    entity: Mapped[str] = mapped_column(String(32), nullable=False)
+    # Zakres czasu wierszy w paczce (eventy: start–koniec, taski: created_at)
+    period_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    period_end: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    rows: Mapped[list] = mapped_column(JSONB, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
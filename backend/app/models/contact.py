@@ -1,7 +1,16 @@
 from datetime import datetime, timezone, date
 from typing import Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Date
+from sqlalchemy import (
+    String,
+    DateTime,
+    ForeignKey,
+    Text,
+    Date,
+    BigInteger,
+    Index,
+    extract,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -9,6 +18,7 @@ from app.db.base import Base
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (Index("ix_contacts_user_change_seq", "user_id", "change_seq"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -20,5 +30,27 @@ class Contact(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Numer zmiany z users.change_seq — podstawa /sync?since=
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
 
     user: Mapped["User"] = relationship(back_populates="contacts")
+
+
+def birthday_key(column=Contact.birthday):
+    """
+    Miesiąc*100 + dzień (np. 1231) — rocznica bez roku. Musi zgadzać się
+    1:1 z wyrażeniem indeksu ix_contacts_user_birthday.
+    """
+    return extract("month", column) * 100 + extract("day", column)
+
+
+# Urodziny w oknie dat = zakres (albo dwa — przełom roku) po tym indeksie
+Index(
+    "ix_contacts_user_birthday",
+    Contact.user_id,
+    birthday_key(),
+    postgresql_where=Contact.birthday.isnot(None),
+)
@@ -2,7 +2,18 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, Boolean, ForeignKey, DateTime, Text, Date, Integer
+from sqlalchemy import (
+    String,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Text,
+    Date,
+    Integer,
+    BigInteger,
+    Index,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -16,6 +27,51 @@ class TaskStatus(str, Enum):
 
 class EisenhowerTask(Base):
     __tablename__ = "eisenhower_tasks"
+    __table_args__ = (
+        Index("ix_eisenhower_tasks_user_change_seq", "user_id", "change_seq"),
+        Index("ix_eisenhower_tasks_user_created", "user_id", "created_at", "id"),
+        # Częściowe indeksy otwartych tasków — macierz nie skanuje historii "done"
+        Index(
+            "ix_eisenhower_tasks_open_created",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status <> 'done'"),
+        ),
+        Index(
+            "ix_eisenhower_tasks_open_due",
+            "user_id",
+            "due_date",
+            "id",
+            postgresql_where=text("status <> 'done'"),
+        ),
+        # Zrobione cykliczne bez następcy — jedyne wiersze, które czyta rollover
+        Index(
+            "ix_eisenhower_tasks_rollover",
+            "id",
+            postgresql_where=text(
+                "status = 'done' AND recurrence_days IS NOT NULL "
+                "AND rolled_forward_at IS NULL"
+            ),
+        ),
+        # Zaplanowane taski — zakresy due_date joba app.workers.task_promotion
+        Index(
+            "ix_eisenhower_tasks_promotion",
+            "due_date",
+            postgresql_where=text(
+                "due_date IS NOT NULL AND target_quadrant IS NOT NULL "
+                "AND status <> 'done'"
+            ),
+        ),
+        # Kolejność w kwadrancie + ostatni klucz przy dopisywaniu na koniec
+        Index(
+            "ix_eisenhower_tasks_quadrant_rank",
+            "user_id",
+            "urgent",
+            "important",
+            "rank",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -31,10 +87,27 @@ class EisenhowerTask(Base):
     )
     target_quadrant: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     recurrence_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Kiedy job app.workers.task_rollover utworzył następcę (zrobiony cykliczny)
+    rolled_forward_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Pozycja w kwadrancie — klucz leksykograficzny (app.core.ranking);
+    # COLLATE "C", żeby porządek był bajtowy niezależnie od locale bazy
+    rank: Mapped[Optional[str]] = mapped_column(
+        String(64, collation="C"), nullable=True
+    )
+    # Przypomnienie N minut przed due_date (NULL = bez przypomnienia);
+    # remind_at liczy trigger w bazie (migracja 0018)
+    reminder_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Numer zmiany z users.change_seq — podstawa /sync?since=
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
 
     user: Mapped["User"] = relationship(back_populates="eisenhower_tasks")
     linked_event: Mapped[Optional["Event"]] = relationship(
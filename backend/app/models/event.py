@@ -1,7 +1,18 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import (
+    BigInteger,
+    String,
+    DateTime,
+    ForeignKey,
+    Text,
+    Boolean,
+    Index,
+    Integer,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -9,6 +20,10 @@ from app.db.base import Base
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_user_start", "user_id", "start_datetime"),
+        Index("ix_events_user_change_seq", "user_id", "change_seq"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -31,9 +46,17 @@ class Event(Base):
     eisenhower_quadrant: Mapped[Optional[str]] = mapped_column(
         String(20), nullable=True
     )
+    # Przypomnienie N minut przed początkiem (NULL = bez przypomnienia);
+    # remind_at liczy trigger w bazie (migracja 0018)
+    reminder_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Numer zmiany z users.change_seq — podstawa /sync?since=
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
 
     user: Mapped["User"] = relationship(back_populates="events")
     activity_template: Mapped[Optional["ActivityTemplate"]] = relationship(
@@ -42,3 +65,29 @@ class Event(Base):
     eisenhower_task: Mapped[Optional["EisenhowerTask"]] = relationship(
         back_populates="linked_event"
     )
+
+    @classmethod
+    def period(cls, start=None, end=None):
+        """
+        Przedział [start, end) jako tstzrange — bez argumentów zwraca okres eventu.
+        Musi zgadzać się 1:1 z wyrażeniem indeksu ix_events_user_period.
+        """
+        return func.tstzrange(
+            cls.start_datetime if start is None else start,
+            cls.end_datetime if end is None else end,
+            literal_column("'[)'"),
+        )
+
+    @classmethod
+    def overlaps(cls, start: datetime, end: datetime):
+        """Warunek: event nachodzi na okno [start, end) — także wielodniowe eventy."""
+        return cls.period().op("&&")(cls.period(start, end))
+
+
+# GiST (btree_gist) po (user_id, okres) — zapytanie o okno to jeden index range scan
+Index(
+    "ix_events_user_period",
+    Event.user_id,
+    Event.period(),
+    postgresql_using="gist",
+)
@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    String,
+    DateTime,
+    ForeignKey,
+    Text,
+    Boolean,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class EventSeries(Base):
+    """
+    Seria cykliczna zapisana raz — reguła RRULE + pierwsze wystąpienie.
+    Wystąpienia są rozwijane przy odczycie, tylko dla żądanego okna.
+    """
+
+    __tablename__ = "event_series"
+    __table_args__ = (
+        Index("ix_event_series_user_change_seq", "user_id", "change_seq"),
+        Index("ix_event_series_user_start", "user_id", "start_datetime"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    # Pierwsze wystąpienie (DTSTART) — długość serii = end - start
+    start_datetime: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    end_datetime: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    # Reguła w formacie RFC 5545, np. "FREQ=DAILY;INTERVAL=7;COUNT=52"
+    rrule: Mapped[str] = mapped_column(String(500), nullable=False)
+    # Koniec ostatniego wystąpienia (NULL = seria bez końca) — zawęża zapytania o okno
+    until_datetime: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    location: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    activity_template_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("activity_templates.id", ondelete="SET NULL"), nullable=True
+    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    is_background: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    color: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    icon: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    eisenhower_quadrant: Mapped[Optional[str]] = mapped_column(
+        String(20), nullable=True
+    )
+    # Przypomnienie N minut przed każdym wystąpieniem (NULL = bez przypomnienia)
+    reminder_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Numer zmiany z users.change_seq — podstawa /sync?since=
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    user: Mapped["User"] = relationship(back_populates="event_series")
+    activity_template: Mapped[Optional["ActivityTemplate"]] = relationship()
+    exceptions: Mapped[list["EventSeriesException"]] = relationship(
+        back_populates="series", cascade="all, delete-orphan"
+    )
+
+
+class EventSeriesException(Base):
+    """
+    Wyjątek dla pojedynczego wystąpienia serii: odwołanie albo nadpisanie pól.
+    Identyfikowany przez oryginalny start wystąpienia (RECURRENCE-ID).
+    """
+
+    __tablename__ = "event_series_exceptions"
+    __table_args__ = (
+        UniqueConstraint(
+            "series_id", "original_start", name="uq_event_series_exceptions_occ"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    series_id: Mapped[int] = mapped_column(
+        ForeignKey("event_series.id", ondelete="CASCADE"), nullable=False
+    )
+    original_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    is_cancelled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Nadpisania — NULL = wartość z serii
+    title: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    start_datetime: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    end_datetime: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    location: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+
+    series: Mapped["EventSeries"] = relationship(back_populates="exceptions")
@@ -0,0 +1,40 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Index, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class EventTimeRollup(Base):
+    """
+    Czas i liczba eventów na (user, dzień UTC, szablon). Utrzymywana
+    przyrostowo przez triggery na events (migracja 0016) — obejmuje każdą
+    ścieżkę zapisu, także COPY i INSERT ... SELECT. Eventy w tle pomijane.
+    Przebudowa: python -m app.db.rollups
+    """
+
+    __tablename__ = "event_time_rollups"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    # Bez FK — spójność z events utrzymują triggery, nie ograniczenia
+    activity_template_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Sekundy, nie minuty — dokładne sumy przy dodawaniu/odejmowaniu
+    seconds: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+# Klucz upsertu z triggerów — NULL (brak szablonu) jako 0, żeby eventy bez
+# szablonu też miały jeden wiersz na dzień
+Index(
+    "uq_event_time_rollups_key",
+    EventTimeRollup.user_id,
+    EventTimeRollup.day,
+    func.coalesce(EventTimeRollup.activity_template_id, 0),
+    unique=True,
+)
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SyncTombstone(Base):
+    """
+    Ślad po usuniętym wierszu — /sync zwraca go klientom, którzy widzieli
+    ten wiersz wcześniej. Same wiersze są usuwane fizycznie, więc tabele
+    i indeksy na ścieżkach odczytu nie puchną od martwych danych.
+    """
+
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_change_seq", "user_id", "change_seq"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    # Nazwa tabeli usuniętego wiersza, np. "events"
+    entity: Mapped[str] = mapped_column(String(40), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
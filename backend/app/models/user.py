@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, DateTime, JSON
+from sqlalchemy import String, DateTime, JSON, BigInteger
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -20,6 +20,16 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+    # Licznik zmian danych usera — zwiększany raz na transakcję (app.core.sync)
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Czas ostatniej zmiany (razem z change_seq) — Last-Modified feedu .ics
+    changed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Sekret w URL-u subskrypcji .ics (None = feed wyłączony)
+    feed_token: Mapped[Optional[str]] = mapped_column(
+        String(64), unique=True, nullable=True
+    )
 
     activity_templates: Mapped[list["ActivityTemplate"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
@@ -27,6 +37,9 @@ class User(Base):
     events: Mapped[list["Event"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
     )
+    event_series: Mapped[list["EventSeries"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
     eisenhower_tasks: Mapped[list["EisenhowerTask"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
     )
@@ -30,5 +30,6 @@ class ActivityTemplateOut(ActivityTemplateBase):
     id: int
     user_id: int
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
@@ -0,0 +1,15 @@
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.eisenhower_task import EisenhowerTaskOut
+from app.schemas.event import EventOut
+
+
+class AgendaDayOut(BaseModel):
+    date: date
+    # Eventy, wystąpienia serii i urodziny nachodzące na dzień — po początku
+    events: List[EventOut]
+    # Otwarte taski z due_date tego dnia
+    tasks: List[EisenhowerTaskOut]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class CalendarFeedOut(BaseModel):
+    token: str
+    # Ścieżka subskrypcji (.ics) — klient dokleja origin API
+    path: str
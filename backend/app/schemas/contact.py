@@ -28,5 +28,6 @@ class ContactOut(ContactBase):
     id: int
     user_id: int
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
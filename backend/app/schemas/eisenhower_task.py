@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.schemas.event import MAX_REMINDER_MINUTES, EventOut
 
 
 class TaskStatus(str, Enum):
@@ -21,6 +23,8 @@ class EisenhowerTaskBase(BaseModel):
     due_date: Optional[datetime] = None
     target_quadrant: Optional[str] = None
     recurrence_days: Optional[int] = None
+    # Minuty przed due_date; None = bez przypomnienia
+    reminder_minutes: Optional[int] = Field(None, ge=0, le=MAX_REMINDER_MINUTES)
 
 
 class EisenhowerTaskCreate(EisenhowerTaskBase):
@@ -37,11 +41,56 @@ class EisenhowerTaskUpdate(BaseModel):
     due_date: Optional[datetime] = None
     target_quadrant: Optional[str] = None
     recurrence_days: Optional[int] = None
+    reminder_minutes: Optional[int] = Field(None, ge=0, le=MAX_REMINDER_MINUTES)
 
 
 class EisenhowerTaskOut(EisenhowerTaskBase):
     id: int
     user_id: int
+    rank: Optional[str] = None
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
+
+
+class TaskMove(BaseModel):
+    task_id: int
+    # Kwadrant docelowy — brak = bez zmiany
+    urgent: Optional[bool] = None
+    important: Optional[bool] = None
+    # Sąsiedzi po upuszczeniu: task bezpośrednio nad / pod przenoszonym
+    # (brak = początek / koniec kwadrantu)
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
+
+
+class TaskReorderRequest(BaseModel):
+    # Kolejno stosowane przeniesienia (np. kilka zaznaczonych tasków naraz)
+    moves: List[TaskMove] = Field(..., min_length=1, max_length=200)
+
+
+class AutoScheduleRequest(BaseModel):
+    # Domyślnie: od teraz (zaokrąglone w górę do 15 min)
+    start: Optional[datetime] = None
+    days: int = Field(7, ge=1, le=62)
+    duration_minutes: int = Field(30, ge=5, le=480)
+    gap_minutes: int = Field(0, ge=0, le=240)
+    # Okno dzienne — domyślnie hour_start/hour_end z ustawień usera
+    hour_start: Optional[int] = Field(None, ge=0, le=23)
+    hour_end: Optional[int] = Field(None, ge=1, le=24)
+    timezone: str = "UTC"
+    # Brak = wszystkie otwarte, niepodpięte taski (poza kwadrantem Eliminuj)
+    task_ids: Optional[List[int]] = None
+    include_eliminate: bool = False
+
+
+class AutoScheduledTask(BaseModel):
+    task_id: int
+    event: EventOut
+
+
+class AutoScheduleOut(BaseModel):
+    scheduled: List[AutoScheduledTask]
+    # Taski, dla których zabrakło miejsca w horyzoncie
+    unscheduled: List[int]
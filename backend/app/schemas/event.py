@@ -1,10 +1,13 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.schemas.activity_template import ActivityTemplateOut
 
+# Najdłuższe wyprzedzenie przypomnienia — tydzień
+MAX_REMINDER_MINUTES = 7 * 24 * 60
+
 
 class EventBase(BaseModel):
     title: str
@@ -18,6 +21,8 @@ class EventBase(BaseModel):
     color: Optional[str] = None
     icon: Optional[str] = None
     eisenhower_quadrant: Optional[str] = None
+    # Minuty przed początkiem (max tydzień); None = bez przypomnienia
+    reminder_minutes: Optional[int] = Field(None, ge=0, le=MAX_REMINDER_MINUTES)
 
     @field_validator("end_datetime")
     @classmethod
@@ -43,12 +48,83 @@ class EventUpdate(BaseModel):
     color: Optional[str] = None
     icon: Optional[str] = None
     eisenhower_quadrant: Optional[str] = None
+    reminder_minutes: Optional[int] = Field(None, ge=0, le=MAX_REMINDER_MINUTES)
+    # True = description zapisywany na evencie (nadpisanie), False = wróć do
+    # opisu szablonu; brak pola = opis eventu z szablonem trafia do szablonu
+    description_override: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def end_after_start(self):
+        # Zmiana tylko jednej granicy — sprawdzana z wierszem w bazie
+        # (_inverted_updates w app.api.v1.events)
+        start, end = self.start_datetime, self.end_datetime
+        if start is not None and end is not None and end <= start:
+            raise ValueError("end_datetime must be after start_datetime")
+        return self
 
 
 class EventOut(EventBase):
-    id: int
+    # id=None dla wirtualnych wystąpień serii — identyfikuje je para
+    # (series_id, occurrence_start)
+    id: Optional[int] = None
+    series_id: Optional[int] = None
+    occurrence_start: Optional[datetime] = None
+    # Wirtualne urodziny kontaktu (id=None) — app.core.birthdays
+    contact_id: Optional[int] = None
     user_id: int
     created_at: datetime
+    updated_at: Optional[datetime] = None
     activity_template: Optional[ActivityTemplateOut] = None
+    # True = opis pochodzi z szablonu (event nie ma własnego nadpisania)
+    description_inherited: bool = False
+
+    model_config = {"from_attributes": True}
+
+    @model_validator(mode="after")
+    def inherit_template_description(self):
+        if self.description is None and self.activity_template is not None:
+            self.description = self.activity_template.description
+            self.description_inherited = self.description is not None
+        return self
+
+
+class EventSlimOut(EventBase):
+    """
+    Event bez osadzonego szablonu (shape=normalized) — szablony są w osobnej
+    mapie. description=None przy activity_template_id = opis z szablonu.
+    """
+
+    id: Optional[int] = None
+    series_id: Optional[int] = None
+    occurrence_start: Optional[datetime] = None
+    contact_id: Optional[int] = None
+    user_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
+
+
+class EventListNormalized(BaseModel):
+    events: List[EventSlimOut]
+    # activity_template_id → szablon, każdy dokładnie raz
+    templates: Dict[int, ActivityTemplateOut]
+
+
+class EventConflictOut(BaseModel):
+    """Event (albo wystąpienie serii) nachodzący na zapisywany przedział."""
+
+    id: Optional[int] = None
+    series_id: Optional[int] = None
+    occurrence_start: Optional[datetime] = None
+    title: str
+    start_datetime: datetime
+    end_datetime: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class EventWithConflictsOut(EventOut):
+    # None = nie sprawdzano (check_conflicts=false); eventy is_background
+    # nie kolidują z niczym
+    conflicts: Optional[List[EventConflictOut]] = None
@@ -0,0 +1,46 @@
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.schemas.event import EventCreate, EventOut, EventUpdate
+
+MAX_BATCH_OPERATIONS = 500
+
+
+class EventBatchCreate(BaseModel):
+    op: Literal["create"]
+    data: EventCreate
+
+
+class EventBatchUpdate(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: EventUpdate
+
+
+class EventBatchDelete(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+EventBatchOperation = Annotated[
+    Union[EventBatchCreate, EventBatchUpdate, EventBatchDelete],
+    Field(discriminator="op"),
+]
+
+# Jeden adapter (schemat zbudowany raz) dla każdej operacji w paczce —
+# błędna operacja dostaje własny wynik 422 zamiast odrzucać całe żądanie
+event_batch_operation_adapter = TypeAdapter(EventBatchOperation)
+
+
+class EventBatchRequest(BaseModel):
+    operations: List[Dict[str, Any]] = Field(..., max_length=MAX_BATCH_OPERATIONS)
+
+
+class EventBatchResult(BaseModel):
+    index: int
+    op: str
+    status: int  # 201 / 200 / 204 albo kod błędu (404, 422)
+    id: Optional[int] = None
+    event: Optional[EventOut] = None
+    error: Optional[str] = None
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class EventRangeCopy(BaseModel):
+    # Eventy zaczynające się w [source_start, source_end)
+    source_start: datetime
+    source_end: datetime
+    # Nowy początek zakresu — przesunięcie = target_start - source_start
+    target_start: datetime
+    activity_template_id: Optional[int] = None
+
+
+class EventRangeShift(BaseModel):
+    start: datetime
+    end: datetime
+    target_start: datetime
+    activity_template_id: Optional[int] = None
+
+
+class EventRangeSummary(BaseModel):
+    count: int
+    offset_minutes: int
+    target_start: datetime
+    target_end: datetime
@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import AwareDatetime, BaseModel
+
+from app.schemas.activity_template import ActivityTemplateOut
+
+
+class EventSeriesExceptionOut(BaseModel):
+    original_start: datetime
+    is_cancelled: bool
+    title: Optional[str] = None
+    start_datetime: Optional[datetime] = None
+    end_datetime: Optional[datetime] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+
+class EventSeriesOut(BaseModel):
+    id: int
+    title: str
+    start_datetime: datetime
+    end_datetime: datetime
+    rrule: str
+    until_datetime: Optional[datetime] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    activity_template_id: Optional[int] = None
+    is_background: bool = False
+    color: Optional[str] = None
+    icon: Optional[str] = None
+    eisenhower_quadrant: Optional[str] = None
+    reminder_minutes: Optional[int] = None
+    user_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    activity_template: Optional[ActivityTemplateOut] = None
+    exceptions: List[EventSeriesExceptionOut] = []
+
+    model_config = {"from_attributes": True}
+
+
+class EventOccurrenceUpdate(BaseModel):
+    """Nadpisanie pojedynczego wystąpienia — wskazanego przez original_start."""
+
+    # Ze strefą — porównywany z wystąpieniami reguły (DTSTART ze strefą)
+    original_start: AwareDatetime
+    title: Optional[str] = None
+    start_datetime: Optional[AwareDatetime] = None
+    end_datetime: Optional[AwareDatetime] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
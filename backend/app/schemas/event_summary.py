@@ -0,0 +1,37 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class TemplateBucketOut(BaseModel):
+    activity_template_id: Optional[int] = None
+    count: int
+    minutes: int
+
+
+class SummaryBucketOut(BaseModel):
+    start: date
+    count: int
+    minutes: int
+    # Rozbicie kubełka na szablony (None = eventy bez szablonu)
+    templates: List[TemplateBucketOut]
+
+
+class EventSummaryOut(BaseModel):
+    bucket: str
+    timezone: str
+    start: date
+    end: date
+    buckets: List[SummaryBucketOut]
+
+
+class TimeSpentOut(BaseModel):
+    bucket: str
+    start: date
+    end: date
+    count: int
+    minutes: int
+    # Suma za cały zakres per szablon — "ile czasu na Naukę w tym miesiącu"
+    templates: List[TemplateBucketOut]
+    buckets: List[SummaryBucketOut]
@@ -0,0 +1,36 @@
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel
+
+
+class DayLoadOut(BaseModel):
+    date: date
+    # Minuty eventów w oknie hour_start–hour_end (nachodzące liczone raz)
+    event_minutes: int
+    # Minuty eventów poza oknem — nie wchodzą do wyniku
+    outside_minutes: int
+    task_count: int
+    task_minutes: int
+    capacity_minutes: int
+    # (event_minutes + task_minutes) / capacity_minutes
+    score: float
+    overloaded: bool
+
+
+class WeekLoadOut(BaseModel):
+    start: date
+    event_minutes: int
+    task_minutes: int
+    capacity_minutes: int
+    score: float
+    overloaded_days: int
+
+
+class OverloadForecastOut(BaseModel):
+    timezone: str
+    hour_start: int
+    hour_end: int
+    threshold: float
+    days: List[DayLoadOut]
+    weeks: List[WeekLoadOut]
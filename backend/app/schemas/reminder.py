@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class ReminderStreamTokenOut(BaseModel):
+    # Krótkotrwały token do GET /reminders/stream?token=... (EventSource
+    # nie wysyła nagłówka Authorization)
+    token: str
+    expires_in: int
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class SearchResultOut(BaseModel):
+    # event | series | task | template | contact
+    type: str
+    id: int
+    title: str
+    # Początek eventu/serii albo termin taska
+    at: Optional[datetime] = None
+    rank: float
@@ -0,0 +1,23 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from app.schemas.activity_template import ActivityTemplateOut
+from app.schemas.contact import ContactOut
+from app.schemas.eisenhower_task import EisenhowerTaskOut
+from app.schemas.event import EventOut
+from app.schemas.event_series import EventSeriesOut
+
+
+class SyncOut(BaseModel):
+    """Zmiany od kursora `since` — albo pełny stan, gdy since nie podano."""
+
+    cursor: str
+    full: bool
+    events: List[EventOut] = []
+    event_series: List[EventSeriesOut] = []
+    eisenhower_tasks: List[EisenhowerTaskOut] = []
+    activity_templates: List[ActivityTemplateOut] = []
+    contacts: List[ContactOut] = []
+    # Tabela → id usuniętych wierszy
+    deleted: Dict[str, List[int]] = {}
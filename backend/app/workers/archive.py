@@ -0,0 +1,83 @@
+"""
+Archiwizacja zimnych danych — osobny proces:
+
+    python -m app.workers.archive [--once]
+
+Co INTERVAL przenosi do archive_chunks zrobione taski starsze niż
+ARCHIVE_TASKS_AFTER_DAYS i eventy starsze niż ARCHIVE_EVENTS_AFTER_YEARS.
+User po userze, paczkami po ARCHIVE_BATCH — zakresy po istniejących
+indeksach (user_id, start_datetime) / (user_id, created_at), każda paczka
+we własnej transakcji. Błąd u jednego usera nie zatrzymuje przebiegu.
+"""
+
+import argparse
+import sys
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.archive import ARCHIVE_BATCH, archive_events, archive_tasks
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.user import User
+
+INTERVAL = 6 * 60 * 60
+
+
+def run_once(db: Session, now: datetime) -> dict:
+    """Jeden pełny przebieg; zwraca liczby przeniesionych wierszy."""
+    cutoffs = {
+        "events": (
+            archive_events,
+            now - timedelta(days=365 * settings.ARCHIVE_EVENTS_AFTER_YEARS),
+        ),
+        "eisenhower_tasks": (
+            archive_tasks,
+            now - timedelta(days=settings.ARCHIVE_TASKS_AFTER_DAYS),
+        ),
+    }
+    moved = dict.fromkeys(cutoffs, 0)
+    for user_id in db.scalars(select(User.id)).all():
+        try:
+            for entity, (archive, cutoff) in cutoffs.items():
+                while True:
+                    count = archive(db, user_id, cutoff, now)
+                    db.commit()
+                    moved[entity] += count
+                    if count < ARCHIVE_BATCH:
+                        break
+        except Exception:
+            # Zatwierdzone paczki zostają; reszta usera w kolejnym przebiegu
+            db.rollback()
+            print(f"Archiving failed for user {user_id}:", file=sys.stderr)
+            traceback.print_exc()
+    return moved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive old events and done tasks")
+    parser.add_argument("--once", action="store_true", help="single pass (cron)")
+    args = parser.parse_args()
+
+    print("Archive worker started.")
+    while True:
+        db = SessionLocal()
+        try:
+            moved = run_once(db, datetime.now(timezone.utc))
+        finally:
+            db.close()
+        if any(moved.values()):
+            print(
+                f"Archived {moved['events']} events, "
+                f"{moved['eisenhower_tasks']} tasks."
+            )
+        if args.once:
+            return
+        time.sleep(INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Worker przypomnień — osobny proces (API działa w kilku workerach uvicorn,
+więc kolejka w procesie API wysyłałaby przypomnienia wielokrotnie):
+
+    python -m app.workers.reminders
+
+Co TICK dokłada do kolejki kolejny plaster czasu (do teraz + LOAD_AHEAD)
+i przypomnienia z wierszy zmienionych od poprzedniego przebiegu; między
+przebiegami śpi do najbliższego przypomnienia.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from app.core.config import settings
+from app.core.reminder_sinks import ReminderSink, build_sinks
+from app.core.reminders import (
+    ReminderQueue,
+    reminders_between,
+    reminders_changed,
+    still_valid,
+)
+from app.db.base import SessionLocal
+
+TICK = timedelta(seconds=30)
+# Jak daleko w przód ładować — krótko, bo zmiany i tak są doczytywane
+LOAD_AHEAD = timedelta(minutes=10)
+# Przypomnienia spóźnione o tyle (restart, zmiana tuż przed czasem) wciąż idą
+GRACE = timedelta(minutes=5)
+
+
+class ReminderWorker:
+    def __init__(self, sinks: List[ReminderSink], now: datetime) -> None:
+        self.sinks = sinks
+        self.queue = ReminderQueue()
+        self.loaded_until = now - GRACE
+        self.checked_at = now
+
+    def load(self, db, now: datetime) -> None:
+        horizon = now + LOAD_AHEAD
+        # Zmiany w już załadowanym zakresie, potem nowy plaster
+        for reminder in reminders_changed(
+            db, self.checked_at - TICK, now - GRACE, self.loaded_until
+        ):
+            self.queue.push(reminder)
+        for reminder in reminders_between(db, self.loaded_until, horizon):
+            self.queue.push(reminder)
+        self.loaded_until = horizon
+        self.checked_at = now
+        self.queue.forget_sent(now - GRACE - LOAD_AHEAD)
+        # next_remind_at serii przesunięte przez reminders_between
+        db.commit()
+
+    def deliver(self, db, now: datetime) -> int:
+        due = self.queue.pop_due(now)
+        if not due:
+            return 0
+        due = still_valid(db, due)
+        for sink in self.sinks:
+            sink.send(db, due)
+        db.commit()
+        return len(due)
+
+
+def main() -> None:
+    worker = ReminderWorker(
+        build_sinks(settings.REMINDER_SINKS), datetime.now(timezone.utc)
+    )
+    next_load = datetime.now(timezone.utc)
+    print(f"Reminder worker started (sinks: {settings.REMINDER_SINKS}).")
+    while True:
+        now = datetime.now(timezone.utc)
+        db = SessionLocal()
+        try:
+            if now >= next_load:
+                worker.load(db, now)
+                next_load = now + TICK
+            worker.deliver(db, now)
+        finally:
+            db.close()
+        wake = min(next_load, worker.queue.next_at() or next_load)
+        time.sleep(max(0.0, (wake - datetime.now(timezone.utc)).total_seconds()))
+
+
+if __name__ == "__main__":
+    main()
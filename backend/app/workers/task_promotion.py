@@ -0,0 +1,133 @@
+"""
+Promocja zaplanowanych tasków (due_date + target_quadrant) — osobny proces:
+
+    python -m app.workers.task_promotion [--once]
+
+Te same reguły co w macierzy we froncie: na bufor przed terminem task
+trafia do kwadrantu bufora (ważność docelowa, bez pilności), po terminie
+do target_quadrant (due_date i target_quadrant czyszczone). Jeden UPDATE
+na próg dla wszystkich userów, po częściowym indeksie na due_date — czyta
+tylko taski z terminem w zasięgu progu. Zmienione wiersze dostają numer
+zmiany usera, więc klienci widzą je w zwykłym /sync?since=.
+"""
+
+import argparse
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, distinct, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.models.eisenhower_task import EisenhowerTask, TaskStatus
+from app.models.user import User
+
+INTERVAL = 60
+
+# (maks. długość planu w dniach, bufor w dniach) — bufferDays() we froncie
+BUFFER_TIERS: List[Tuple[Optional[int], int]] = [
+    (5, 1),
+    (10, 2),
+    (20, 3),
+    (60, 7),
+    (None, 14),
+]
+
+
+def _promote(db: Session, now: datetime, condition, values: dict) -> int:
+    """UPDATE pasujących tasków + jeden numer zmiany na usera (jedna instrukcja)."""
+    tasks = EisenhowerTask.__table__
+    users = User.__table__
+    bumped = (
+        update(users)
+        .where(users.c.id.in_(select(distinct(tasks.c.user_id)).where(condition)))
+        .values(change_seq=users.c.change_seq + 1, changed_at=now)
+        .returning(users.c.id, users.c.change_seq)
+        .cte("bumped")
+    )
+    result = db.execute(
+        update(tasks)
+        .where(tasks.c.user_id == bumped.c.id, condition)
+        .values(**values, change_seq=bumped.c.change_seq, updated_at=now)
+    )
+    return result.rowcount
+
+
+def promote_tasks(db: Session, now: datetime) -> int:
+    """Wszystkie progi; zwraca liczbę przeniesionych tasków."""
+    tasks = EisenhowerTask.__table__
+    target = tasks.c.target_quadrant
+    target_urgent = target.in_(("do_first", "delegate"))
+    target_important = target.in_(("do_first", "schedule"))
+    # Dosłownie predykat ix_eisenhower_tasks_promotion
+    scheduled = and_(
+        tasks.c.due_date.isnot(None),
+        target.isnot(None),
+        tasks.c.status != TaskStatus.DONE.value,
+    )
+
+    promoted = 0
+    previous = None
+    for max_days, buffer_days in BUFFER_TIERS:
+        plan = tasks.c.due_date - tasks.c.created_at
+        tier = [
+            scheduled,
+            tasks.c.due_date > now,
+            tasks.c.due_date <= now + timedelta(days=buffer_days),
+            # Już w kwadrancie bufora — bez zapisu
+            or_(tasks.c.urgent, tasks.c.important != target_important),
+        ]
+        if previous is not None:
+            tier.append(plan > timedelta(days=previous))
+        if max_days is not None:
+            tier.append(plan <= timedelta(days=max_days))
+        promoted += _promote(
+            db, now, and_(*tier), {"urgent": False, "important": target_important}
+        )
+        previous = max_days
+
+    promoted += _promote(
+        db,
+        now,
+        and_(scheduled, tasks.c.due_date <= now),
+        {
+            "urgent": target_urgent,
+            "important": target_important,
+            "due_date": None,
+            "target_quadrant": None,
+        },
+    )
+    return promoted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Promote scheduled Eisenhower tasks")
+    parser.add_argument("--once", action="store_true", help="single pass (cron)")
+    args = parser.parse_args()
+
+    print("Task promotion worker started.")
+    while True:
+        db = SessionLocal()
+        try:
+            promoted = promote_tasks(db, datetime.now(timezone.utc))
+            db.commit()
+        except Exception:
+            # Nic z przebiegu nie zostaje zapisane; ponowna próba za INTERVAL
+            db.rollback()
+            if args.once:
+                raise
+            traceback.print_exc()
+            promoted = 0
+        finally:
+            db.close()
+        if promoted:
+            print(f"Promoted {promoted} tasks.")
+        if args.once:
+            return
+        time.sleep(INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
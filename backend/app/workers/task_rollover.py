@@ -0,0 +1,214 @@
+"""
+Kolejne wystąpienia tasków cyklicznych — osobny proces:
+
+    python -m app.workers.task_rollover [--once]
+
+Zrobiony task z recurrence_days dostaje następcę (todo, due_date +
+recurrence_days, w poczekalni z target_quadrant — jak przy odhaczeniu
+w macierzy). Jedna instrukcja na paczkę BATCH tasków wszystkich userów:
+oznaczenie źródeł (rolled_forward_at), numer zmiany usera (delta sync)
+i INSERT ... SELECT następców. Oznaczone źródła nie wracają — ponowny
+przebieg niczego nie dubluje, a SKIP LOCKED pozwala na kilka procesów.
+Wiersze users są blokowane przed taskami, jak w stamp() i promocji.
+"""
+
+import argparse
+import time
+import traceback
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    and_,
+    case,
+    cast,
+    false,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from app.core.ranking import BASE, DIGITS
+from app.db.base import SessionLocal
+from app.models.eisenhower_task import EisenhowerTask, TaskStatus
+from app.models.user import User
+
+BATCH = 500
+INTERVAL = 60
+
+
+def roll_forward(db: Session, batch: int = BATCH) -> int:
+    """Jedna paczka następców; zwraca ich liczbę (0 = nic do zrobienia)."""
+    tasks = EisenhowerTask.__table__
+    users = User.__table__
+    now = datetime.now(timezone.utc)
+    pending_rollover = and_(
+        tasks.c.status == TaskStatus.DONE.value,
+        tasks.c.recurrence_days.isnot(None),
+        tasks.c.rolled_forward_at.is_(None),
+    )
+
+    # Najpierw users (po id) — ta sama kolejność blokad co w zapisach API
+    candidates = (
+        select(tasks.c.user_id)
+        .where(pending_rollover)
+        .order_by(tasks.c.id)
+        .limit(batch)
+        .subquery()
+    )
+    user_ids = db.scalars(
+        select(users.c.id)
+        .where(users.c.id.in_(select(candidates.c.user_id)))
+        .order_by(users.c.id)
+        .with_for_update()
+    ).all()
+    if not user_ids:
+        return 0
+
+    due = (
+        select(tasks.c.id)
+        .where(pending_rollover, tasks.c.user_id.in_(user_ids))
+        .order_by(tasks.c.id)
+        .limit(batch)
+        .with_for_update(skip_locked=True)
+        .cte("due")
+    )
+    marked = (
+        update(tasks)
+        .where(tasks.c.id.in_(select(due.c.id)))
+        .values(rolled_forward_at=now)
+        .returning(
+            tasks.c.id,
+            tasks.c.user_id,
+            tasks.c.title,
+            tasks.c.description,
+            tasks.c.urgent,
+            tasks.c.important,
+            tasks.c.target_quadrant,
+            tasks.c.recurrence_days,
+            tasks.c.reminder_minutes,
+            # Bez due_date liczymy od ukończenia (ostatniej zmiany)
+            func.coalesce(tasks.c.due_date, tasks.c.updated_at, literal(now)).label(
+                "base_date"
+            ),
+        )
+        .cte("marked")
+    )
+    # Jeden numer zmiany na usera na paczkę — jak stamp() w zapisach API
+    bumped = (
+        update(users)
+        .where(users.c.id.in_(select(marked.c.user_id)))
+        .values(change_seq=users.c.change_seq + 1, changed_at=now)
+        .returning(users.c.id, users.c.change_seq)
+        .cte("bumped")
+    )
+
+    # Następcy trafiają na koniec poczekalni: ostatni klucz + 2 cyfry base-62
+    # numeru w paczce (rtrim zer jak w app.core.ranking)
+    pending = tasks.alias("pending")
+    last_rank = (
+        select(func.max(pending.c.rank))
+        .where(
+            pending.c.user_id == marked.c.user_id,
+            pending.c.urgent.is_(False),
+            pending.c.important.is_(False),
+        )
+        .scalar_subquery()
+    )
+    n = func.row_number().over(partition_by=marked.c.user_id, order_by=marked.c.id)
+    rank = func.rtrim(
+        func.coalesce(last_rank, "")
+        + func.substr(DIGITS, cast(n // BASE + 1, Integer), 1)
+        + func.substr(DIGITS, cast(n % BASE + 1, Integer), 1),
+        "0",
+    )
+    quadrant = case(
+        (and_(marked.c.urgent, marked.c.important), "do_first"),
+        (marked.c.important, "schedule"),
+        (marked.c.urgent, "delegate"),
+        else_="eliminate",
+    )
+    successors = select(
+        marked.c.title,
+        marked.c.description,
+        false(),
+        false(),
+        literal(TaskStatus.TODO.value),
+        marked.c.base_date + func.make_interval(0, 0, 0, marked.c.recurrence_days),
+        func.coalesce(marked.c.target_quadrant, quadrant),
+        marked.c.recurrence_days,
+        marked.c.reminder_minutes,
+        rank,
+        marked.c.user_id,
+        cast(literal(now), DateTime(timezone=True)),
+        cast(literal(now), DateTime(timezone=True)),
+        bumped.c.change_seq,
+    ).join_from(marked, bumped, bumped.c.id == marked.c.user_id)
+
+    result = db.execute(
+        insert(tasks).from_select(
+            [
+                "title",
+                "description",
+                "urgent",
+                "important",
+                "status",
+                "due_date",
+                "target_quadrant",
+                "recurrence_days",
+                "reminder_minutes",
+                "rank",
+                "user_id",
+                "created_at",
+                "updated_at",
+                "change_seq",
+            ],
+            successors,
+        )
+    )
+    return result.rowcount
+
+
+def run_once(db: Session) -> int:
+    """Wszystkie zaległe paczki, każda we własnej transakcji."""
+    total = 0
+    while True:
+        rolled = roll_forward(db)
+        db.commit()
+        total += rolled
+        if rolled < BATCH:
+            return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Roll forward recurring tasks")
+    parser.add_argument("--once", action="store_true", help="single pass (cron)")
+    args = parser.parse_args()
+
+    print("Task rollover worker started.")
+    while True:
+        db = SessionLocal()
+        try:
+            rolled = run_once(db)
+        except Exception:
+            # Paczki sprzed błędu są już zatwierdzone; reszta w kolejnym przebiegu
+            db.rollback()
+            if args.once:
+                raise
+            traceback.print_exc()
+            rolled = 0
+        finally:
+            db.close()
+        if rolled:
+            print(f"Rolled forward {rolled} recurring tasks.")
+        if args.once:
+            return
+        time.sleep(INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark POST /eisenhower-tasks/auto-schedule — setki tasków, miesiąc.
+
+    python -m benchmarks.auto_schedule [tasków] [eventów_dziennie]
+
+Mierzy osobno sam algorytm (scalanie zajętości, wolne sloty, first-fit —
+bez bazy) i cały endpoint (zapytania + INSERT eventów + UPDATE linków).
+"""
+
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import delete, insert, update
+
+from app.api.v1.eisenhower_tasks import auto_schedule_tasks
+from app.core.scheduling import (
+    busy_intervals,
+    daily_windows,
+    free_intervals,
+    place_tasks,
+    rank_tasks,
+)
+from app.models.eisenhower_task import EisenhowerTask
+from app.models.event import Event
+from app.models.user import User
+from app.schemas.eisenhower_task import AutoScheduleRequest
+from benchmarks.common import bench_user, count_queries, timeit
+
+DAYS = 31
+
+
+def seed(db, user_id: int, origin: datetime, tasks: int, per_day: int) -> None:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    events = []
+    for day in range(DAYS):
+        for _ in range(per_day):
+            start = origin + timedelta(
+                days=day, hours=rng.randint(7, 20), minutes=rng.choice([0, 15, 30])
+            )
+            events.append(
+                {
+                    "title": "busy",
+                    "start_datetime": start,
+                    "end_datetime": start + timedelta(minutes=rng.choice([30, 60])),
+                    "user_id": user_id,
+                    "is_background": rng.random() < 0.1,
+                    "created_at": now,
+                }
+            )
+    db.execute(insert(Event), events)
+    db.execute(
+        insert(EisenhowerTask),
+        [
+            {
+                "title": f"task {i}",
+                "urgent": rng.random() < 0.5,
+                "important": rng.random() < 0.7,
+                "status": "todo",
+                "due_date": (
+                    origin + timedelta(days=rng.randrange(DAYS))
+                    if rng.random() < 0.4
+                    else None
+                ),
+                "user_id": user_id,
+                "created_at": now,
+            }
+            for i in range(tasks)
+        ],
+    )
+    db.commit()
+
+
+def unschedule(db, user_id: int, event_ids) -> None:
+    """Cofa wynik przebiegu, żeby kolejny planował od zera."""
+    db.execute(
+        update(EisenhowerTask)
+        .where(EisenhowerTask.user_id == user_id)
+        .values(linked_event_id=None)
+    )
+    db.execute(delete(Event).where(Event.id.in_(event_ids)))
+    db.commit()
+
+
+def main() -> None:
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    origin = datetime(2026, 11, 2, tzinfo=timezone.utc)
+    payload = AutoScheduleRequest(
+        start=origin,
+        days=DAYS,
+        duration_minutes=30,
+        gap_minutes=5,
+        hour_start=8,
+        hour_end=22,
+        timezone="Europe/Warsaw",
+        include_eliminate=True,
+    )
+    with bench_user() as (db, user_id):
+        seed(db, user_id, origin, tasks, per_day)
+        end = origin + timedelta(days=DAYS)
+        zone = ZoneInfo(payload.timezone)
+
+        busy = busy_intervals(db, user_id, origin, end)
+        ranked = rank_tasks(
+            db.query(EisenhowerTask).filter(EisenhowerTask.user_id == user_id)
+        )
+
+        def algorithm():
+            free = free_intervals(daily_windows(origin, end, 8, 22, zone), busy)
+            return place_tasks(
+                ranked, free, timedelta(minutes=30), timedelta(minutes=5)
+            )
+
+        placed = sum(slot is not None for _, slot in algorithm())
+        print(f"{tasks} tasks, {DAYS * per_day} events, {placed} placed")
+        timeit("algorithm only (in memory)", algorithm, repeat=50)
+
+        user = db.get(User, user_id)
+        samples = []
+        for run in range(10):
+            with count_queries() as counter:
+                t0 = time.perf_counter()
+                out = auto_schedule_tasks(payload, db, user)
+                samples.append((time.perf_counter() - t0) * 1000)
+            if run == 0:
+                print(f"{'endpoint':<48} queries={counter['n']}")
+            unschedule(db, user_id, [item.event.id for item in out.scheduled])
+        print(
+            f"{'endpoint (query + insert + link)':<48} "
+            f"median={statistics.median(samples):8.2f} ms  max={max(samples):8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark wirtualnych urodzin — 100k kontaktów z datą urodzin.
+
+    python -m benchmarks.birthdays [kontaktów]
+
+Tydzień w środku roku (jeden zakres po ix_contacts_user_birthday) i przez
+przełom roku (dwa zakresy) — czas zależy od liczby urodzin w oknie,
+nie od liczby kontaktów.
+"""
+
+import random
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import insert
+
+from app.core.birthdays import birthdays_between
+from app.models.contact import Contact
+from benchmarks.common import bench_user, purge, timeit
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    with bench_user() as (db, user_id):
+        now = datetime.now(timezone.utc)
+        db.execute(
+            insert(Contact),
+            [
+                {
+                    "name": f"contact {i}",
+                    "birthday": date(1950, 1, 1)
+                    + timedelta(days=rng.randrange(25_000)),
+                    "user_id": user_id,
+                    "created_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+        db.commit()
+
+        for label, start in (
+            ("week in June", datetime(2026, 6, 8, tzinfo=timezone.utc)),
+            ("week across new year", datetime(2026, 12, 28, tzinfo=timezone.utc)),
+        ):
+            end = start + timedelta(days=7)
+            found = len(birthdays_between(db, user_id, start, end))
+            timeit(
+                f"{label} ({found} birthdays)",
+                lambda: birthdays_between(db, user_id, start, end),
+            )
+        purge(db, Contact, user_id)
+
+
+if __name__ == "__main__":
+    main()
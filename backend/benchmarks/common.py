@@ -0,0 +1,79 @@
+"""
+Wspólne narzędzia benchmarków — uruchamiane ręcznie na bazie z DATABASE_URL:
+
+    python -m benchmarks.<nazwa>
+
+Każdy benchmark tworzy własnego, tymczasowego usera i usuwa go na końcu.
+"""
+
+import secrets
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, event, insert
+
+from app.db.base import SessionLocal, engine
+from app.models.user import User
+
+
+@contextmanager
+def bench_user():
+    """Tworzy usera na czas benchmarku; sprząta po sobie (kaskada ORM)."""
+    db = SessionLocal()
+    user_id = db.execute(
+        insert(User)
+        .values(
+            email=f"bench-{secrets.token_hex(6)}@bench.local",
+            hashed_password="!",
+            is_admin=False,
+            preferences={},
+            created_at=datetime.now(timezone.utc),
+        )
+        .returning(User.id)
+    ).scalar_one()
+    db.commit()
+    try:
+        yield db, user_id
+    finally:
+        db.rollback()
+        user = db.get(User, user_id)
+        if user:
+            db.delete(user)
+            db.commit()
+        db.close()
+
+
+def timeit(label: str, fn, repeat: int = 20) -> float:
+    """Mierzy fn() `repeat` razy i wypisuje medianę / p95 w ms."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    median = statistics.median(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{label:<48} median={median:8.2f} ms  p95={p95:8.2f} ms")
+    return median
+
+
+@contextmanager
+def count_queries():
+    """Liczy instrukcje SQL wysłane przez engine w obrębie bloku."""
+    counter = {"n": 0}
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        counter["n"] += 1
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def purge(db, model, user_id: int) -> None:
+    db.execute(delete(model).where(model.user_id == user_id))
+    db.commit()
@@ -0,0 +1,70 @@
+"""
+Benchmark importu .ics (POST /import/events) — parsowanie + COPY porcjami.
+
+    python -m benchmarks.event_import [eventów]
+
+Generuje plik .ics w pliku tymczasowym i mierzy cały przebieg _run_import
+(z commitem) oraz samo parsowanie.
+"""
+
+import io
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from app.api.v1.event_import import _run_import
+from app.core.event_import import ics_records
+from app.models.event import Event
+from benchmarks.common import bench_user, purge
+
+
+def write_ics(target, n: int) -> None:
+    origin = datetime(2024, 1, 1, 8, tzinfo=timezone.utc)
+    target.write(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n")
+    for i in range(n):
+        start = origin + timedelta(hours=i * 3)
+        target.write(
+            (
+                "BEGIN:VEVENT\r\n"
+                f"UID:bench-{i}\r\n"
+                f"DTSTART;TZID=Europe/Warsaw:{start:%Y%m%dT%H%M%S}\r\n"
+                f"DTEND;TZID=Europe/Warsaw:{start + timedelta(hours=1):%Y%m%dT%H%M%S}\r\n"
+                f"SUMMARY:Imported event {i}\r\n"
+                "DESCRIPTION:Notes\\nsecond line\r\n"
+                "END:VEVENT\r\n"
+            ).encode()
+        )
+    target.write(b"END:VCALENDAR\r\n")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    zone = ZoneInfo("UTC")
+    with tempfile.TemporaryFile() as source:
+        write_ics(source, n)
+        total = source.tell()
+        print(f"{n} events, {total / 1e6:.1f} MB")
+
+        source.seek(0)
+        t0 = time.perf_counter()
+        text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+        parsed = sum(1 for _ in ics_records(text, zone, {}))
+        print(f"{'parse only':<48} {time.perf_counter() - t0:8.2f} s ({parsed})")
+        text.detach()
+
+        with bench_user() as (db, user_id):
+            source.seek(0)
+            t0 = time.perf_counter()
+            last = None
+            # _run_import zamyka plik źródłowy — to ostatnie użycie pliku
+            for last in _run_import(user_id, "ics", zone, source, total):
+                pass
+            print(f"{'parse + COPY + commit':<48} {time.perf_counter() - t0:8.2f} s")
+            print(last.strip())
+            purge(db, Event, user_id)
+
+
+if __name__ == "__main__":
+    main()
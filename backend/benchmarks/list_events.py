@@ -0,0 +1,100 @@
+"""
+Benchmark zapytania tygodniowego list_events przy 100k+ eventów jednego usera.
+
+    python -m benchmarks.list_events [liczba_eventów]
+
+Porównuje stary filtr (start w oknie) z zapytaniem o nakładanie się
+przedziałów (tstzrange && + ix_events_user_period) i wypisuje plan zapytania.
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select, text
+
+from app.models.event import Event
+from benchmarks.common import bench_user, purge, timeit
+
+CHUNK = 10_000
+
+
+def seed_events(db, user_id: int, n: int, origin: datetime) -> None:
+    """~5 lat historii: krótkie eventy + co 50. wielodniowy."""
+    rng = random.Random(42)
+    span_minutes = 5 * 365 * 24 * 60
+    now = datetime.now(timezone.utc)
+    for offset in range(0, n, CHUNK):
+        rows = []
+        for i in range(offset, min(n, offset + CHUNK)):
+            start = origin + timedelta(minutes=rng.randrange(span_minutes))
+            length = timedelta(days=rng.randint(1, 4)) if i % 50 == 0 else None
+            rows.append(
+                {
+                    "title": f"bench {i}",
+                    "start_datetime": start,
+                    "end_datetime": start
+                    + (length or timedelta(minutes=rng.choice([30, 60, 90]))),
+                    "user_id": user_id,
+                    "is_background": False,
+                    "created_at": now,
+                }
+            )
+        db.execute(insert(Event), rows)
+    db.commit()
+    db.execute(text("ANALYZE events"))
+    db.commit()
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    origin = datetime(2021, 1, 4, tzinfo=timezone.utc)
+    with bench_user() as (db, user_id):
+        print(f"Seeding {n} events…")
+        seed_events(db, user_id, n, origin)
+
+        rng = random.Random(7)
+        weeks = [origin + timedelta(weeks=rng.randrange(5 * 52)) for _ in range(50)]
+
+        def run(build):
+            it = iter(weeks * 2)
+
+            def _once():
+                start = next(it)
+                db.execute(build(start, start + timedelta(days=7))).all()
+
+            return _once
+
+        def old_filter(start, end):
+            return (
+                select(Event.id)
+                .where(
+                    Event.user_id == user_id,
+                    Event.start_datetime >= start,
+                    Event.start_datetime < end,
+                )
+                .order_by(Event.start_datetime)
+            )
+
+        def overlap(start, end):
+            return (
+                select(Event.id)
+                .where(Event.user_id == user_id, Event.overlaps(start, end))
+                .order_by(Event.start_datetime)
+            )
+
+        timeit("start in window (old, misses multi-day)", run(old_filter), 50)
+        timeit("tstzrange overlap (ix_events_user_period)", run(overlap), 50)
+
+        start = weeks[0]
+        sql = overlap(start, start + timedelta(days=7)).compile(
+            db.bind, compile_kwargs={"literal_binds": True}
+        )
+        plan = db.connection().exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+        print("\n".join(row[0] for row in plan))
+
+        purge(db, Event, user_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark GET /forecast/overload — horyzont roku dla jednego usera.
+
+    python -m benchmarks.overload_forecast [eventów_dziennie] [tasków]
+
+Mierzy osobno samą rasteryzację w NumPy (bez bazy) i cały endpoint
+(dwa zapytania + wystąpienia serii + obliczenia). Cel: < 50 ms.
+"""
+
+import random
+import sys
+from datetime import date, datetime, time, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import insert
+
+from app.api.v1.forecast import overload_forecast
+from app.core.forecast import day_loads, occupancy, task_load, work_window
+from app.models.eisenhower_task import EisenhowerTask
+from app.models.event import Event
+from app.models.user import User
+from benchmarks.common import bench_user, count_queries, timeit
+
+WEEKS = 52
+DAYS = WEEKS * 7
+
+
+def seed(db, user_id: int, origin: datetime, per_day: int, tasks: int) -> None:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    events = []
+    for day in range(DAYS):
+        for _ in range(per_day):
+            start = origin + timedelta(
+                days=day, hours=rng.randint(7, 20), minutes=rng.choice([0, 15, 30])
+            )
+            events.append(
+                {
+                    "title": "busy",
+                    "start_datetime": start,
+                    "end_datetime": start + timedelta(minutes=rng.choice([30, 60, 90])),
+                    "user_id": user_id,
+                    "is_background": False,
+                    "created_at": now,
+                }
+            )
+    db.execute(insert(Event), events)
+    db.execute(
+        insert(EisenhowerTask),
+        [
+            {
+                "title": f"task {i}",
+                "status": "todo",
+                "due_date": origin + timedelta(days=rng.randrange(-14, DAYS)),
+                "user_id": user_id,
+                "created_at": now,
+            }
+            for i in range(tasks)
+        ],
+    )
+    db.commit()
+
+
+def main() -> None:
+    per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    rng = np.random.default_rng(42)
+    starts = (
+        np.repeat(np.arange(DAYS), per_day) * 1440
+        + rng.integers(420, 1200, DAYS * per_day)
+    ).astype(np.float64)
+    ends = starts + rng.choice([30, 60, 90], len(starts))
+    due = rng.uniform(-14 * 1440, DAYS * 1440, tasks)
+    window = work_window(8, 22)
+
+    def algorithm():
+        return day_loads(
+            occupancy(starts, ends, DAYS), window, task_load(due, DAYS), 30
+        )
+
+    print(f"{DAYS} days, {len(starts)} events, {tasks} tasks")
+    timeit("rasterize + load (NumPy only)", algorithm, repeat=50)
+
+    origin = datetime.combine(date.today(), time(0), tzinfo=timezone.utc)
+    with bench_user() as (db, user_id):
+        seed(db, user_id, origin, per_day, tasks)
+        user = db.get(User, user_id)
+
+        def endpoint():
+            return overload_forecast(
+                WEEKS, "Europe/Warsaw", None, None, 30, 0.85, db, user
+            )
+
+        with count_queries() as counter:
+            out = endpoint()
+        overloaded = sum(day.overloaded for day in out.days)
+        print(f"{'endpoint':<48} queries={counter['n']} overloaded={overloaded}")
+        timeit("endpoint (query + rasterize)", endpoint, repeat=20)
+
+
+if __name__ == "__main__":
+    main()
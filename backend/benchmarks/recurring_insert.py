@@ -0,0 +1,87 @@
+"""
+Benchmark materializowanej serii (POST /events/recurring, materialize=true).
+
+    python -m benchmarks.recurring_insert [wystąpień]
+
+Porównuje stary przebieg (N×add, commit, N×refresh, SELECT ... IN z
+joinedload) z jednym INSERT ... RETURNING — czas i liczba zapytań SQL.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import joinedload
+
+from app.api.v1.events import RecurringEventCreate, create_recurring_events
+from app.models.activity_template import ActivityTemplate
+from app.models.event import Event
+from app.models.user import User
+from benchmarks.common import bench_user, count_queries, purge, timeit
+
+
+def legacy_create(db, payload: RecurringEventCreate, user_id: int):
+    """Implementacja sprzed zmiany — punkt odniesienia."""
+    created = []
+    for i in range(payload.occurrences):
+        delta = timedelta(days=payload.interval_days * i)
+        event = Event(
+            title=payload.title,
+            start_datetime=payload.start_datetime + delta,
+            end_datetime=payload.end_datetime + delta,
+            activity_template_id=payload.activity_template_id,
+            recurrence_rule=f"INTERVAL_DAYS={payload.interval_days}",
+            user_id=user_id,
+        )
+        db.add(event)
+        created.append(event)
+    db.commit()
+    for ev in created:
+        db.refresh(ev)
+    return (
+        db.query(Event)
+        .options(joinedload(Event.activity_template))
+        .filter(Event.id.in_([ev.id for ev in created]))
+        .order_by(Event.start_datetime)
+        .all()
+    )
+
+
+def main() -> None:
+    occurrences = int(sys.argv[1]) if len(sys.argv) > 1 else 730
+    with bench_user() as (db, user_id):
+        template = ActivityTemplate(
+            name="Bench", color="#000000", icon="⏱", user_id=user_id
+        )
+        db.add(template)
+        db.commit()
+
+        start = datetime(2026, 1, 5, 8, tzinfo=timezone.utc)
+        payload = RecurringEventCreate(
+            title="bench",
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=1),
+            activity_template_id=template.id,
+            interval_days=1,
+            occurrences=occurrences,
+            materialize=True,
+        )
+        user = db.get(User, user_id)
+
+        for label, fn in (
+            ("legacy ORM add + refresh", lambda: legacy_create(db, payload, user_id)),
+            (
+                "bulk INSERT ... RETURNING",
+                lambda: create_recurring_events(
+                    payload, db, user, check_conflicts=False
+                ),
+            ),
+        ):
+            with count_queries() as counter:
+                fn()
+            print(f"{label:<48} queries={counter['n']}")
+            timeit(label, fn, repeat=5)
+            purge(db, Event, user_id)
+
+
+if __name__ == "__main__":
+    main()
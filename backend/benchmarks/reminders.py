@@ -0,0 +1,97 @@
+"""
+Benchmark przypomnień — 100k oczekujących przypomnień.
+
+    python -m benchmarks.reminders [przypomnień]
+
+Mierzy kolejkę (wstawienie wszystkich, zdejmowanie minuta po minucie) oraz
+zapytania workera: plaster LOAD_AHEAD i zmiany od ostatniego przebiegu —
+oba po częściowych indeksach, niezależnie od rozmiaru tabeli events.
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert
+
+from app.core.reminders import (
+    Reminder,
+    ReminderQueue,
+    reminders_between,
+    reminders_changed,
+)
+from app.models.event import Event
+from app.workers.reminders import LOAD_AHEAD, TICK
+from benchmarks.common import bench_user, purge, timeit
+
+HORIZON_DAYS = 30
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    origin = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    reminders = [
+        Reminder(
+            origin + timedelta(minutes=rng.randrange(HORIZON_DAYS * 24 * 60)),
+            "event",
+            i,
+            None,
+            1,
+            "bench",
+            origin,
+        )
+        for i in range(n)
+    ]
+
+    t0 = time.perf_counter()
+    queue = ReminderQueue()
+    for reminder in reminders:
+        queue.push(reminder)
+    print(f"{'push ' + str(n):<48} {(time.perf_counter() - t0) * 1000:8.1f} ms")
+    t0 = time.perf_counter()
+    popped = 0
+    minute = origin
+    while len(queue):
+        minute += timedelta(minutes=1)
+        popped += len(queue.pop_due(minute))
+    print(
+        f"{'pop minute by minute (' + str(popped) + ')':<48} "
+        f"{(time.perf_counter() - t0) * 1000:8.1f} ms"
+    )
+
+    with bench_user() as (db, user_id):
+        now = datetime.now(timezone.utc)
+        rows = []
+        for i in range(n):
+            start = now + timedelta(minutes=rng.randrange(HORIZON_DAYS * 24 * 60))
+            rows.append(
+                {
+                    "title": f"event {i}",
+                    "start_datetime": start,
+                    "end_datetime": start + timedelta(minutes=30),
+                    "reminder_minutes": rng.choice([5, 10, 15, 60]),
+                    "user_id": user_id,
+                    "is_background": False,
+                    "created_at": now,
+                    "updated_at": now - timedelta(hours=1),
+                }
+            )
+        db.execute(insert(Event), rows)
+        db.commit()
+
+        slice_rows = len(reminders_between(db, now, now + LOAD_AHEAD))
+        timeit(
+            f"slice of {LOAD_AHEAD} ({slice_rows} rows)",
+            lambda: reminders_between(db, now, now + LOAD_AHEAD),
+        )
+        timeit(
+            "changed since last tick",
+            lambda: reminders_changed(db, now - TICK, now, now + LOAD_AHEAD),
+        )
+        purge(db, Event, user_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark promocji zaplanowanych tasków — 200k tasków, z czego 50k zaplanowanych.
+
+    python -m benchmarks.task_promotion [tasków]
+
+Przebieg po częściowym indeksie na due_date: czas zależy od liczby tasków
+z terminem w zasięgu progów, nie od rozmiaru tabeli. Drugi przebieg
+niczego nie zmienia.
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert
+
+from app.models.eisenhower_task import EisenhowerTask
+from app.workers.task_promotion import promote_tasks
+from benchmarks.common import bench_user, count_queries, purge
+
+QUADRANTS = ("do_first", "schedule", "delegate", "eliminate")
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    with bench_user() as (db, user_id):
+        now = datetime.now(timezone.utc)
+        rows = []
+        for i in range(n):
+            scheduled = i % 4 == 0
+            created = now - timedelta(days=rng.randrange(60))
+            rows.append(
+                {
+                    "title": f"task {i}",
+                    "status": "done" if i % 5 == 0 else "todo",
+                    "urgent": False,
+                    "important": False,
+                    "due_date": (
+                        created + timedelta(days=rng.randrange(1, 120))
+                        if scheduled
+                        else None
+                    ),
+                    "target_quadrant": rng.choice(QUADRANTS) if scheduled else None,
+                    "user_id": user_id,
+                    "created_at": created,
+                }
+            )
+        db.execute(insert(EisenhowerTask), rows)
+        db.commit()
+
+        with count_queries() as queries:
+            t0 = time.perf_counter()
+            promoted = promote_tasks(db, now)
+            db.commit()
+            elapsed = (time.perf_counter() - t0) * 1000
+        print(
+            f"{'promote ' + str(promoted):<48} {elapsed:8.1f} ms  "
+            f"({queries['n']} statements)"
+        )
+        t0 = time.perf_counter()
+        again = promote_tasks(db, now)
+        db.commit()
+        print(
+            f"{'second run (' + str(again) + ' rows)':<48} "
+            f"{(time.perf_counter() - t0) * 1000:8.1f} ms"
+        )
+        purge(db, EisenhowerTask, user_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark rollovera tasków cyklicznych — 50k zrobionych tasków z recurrence_days.
+
+    python -m benchmarks.task_rollover [tasków]
+
+Mierzy pełny przebieg (paczki po BATCH, INSERT ... SELECT) i liczbę
+instrukcji, potem drugi przebieg — musi niczego nie utworzyć.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+
+from app.models.eisenhower_task import EisenhowerTask
+from app.workers.task_rollover import run_once
+from benchmarks.common import bench_user, count_queries, purge
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with bench_user() as (db, user_id):
+        now = datetime.now(timezone.utc)
+        db.execute(
+            insert(EisenhowerTask),
+            [
+                {
+                    "title": f"task {i}",
+                    "status": "done",
+                    "urgent": i % 2 == 0,
+                    "important": i % 3 == 0,
+                    "due_date": now - timedelta(days=i % 30),
+                    "recurrence_days": 1 + i % 14,
+                    "user_id": user_id,
+                    "created_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+        db.commit()
+
+        with count_queries() as queries:
+            t0 = time.perf_counter()
+            rolled = run_once(db)
+            elapsed = (time.perf_counter() - t0) * 1000
+        print(
+            f"{'roll forward ' + str(rolled):<48} {elapsed:8.1f} ms  "
+            f"({queries['n']} statements)"
+        )
+        print(f"{'second run (idempotent)':<48} {run_once(db):8d} rows")
+        todo = db.scalar(
+            select(func.count()).where(
+                EisenhowerTask.user_id == user_id, EisenhowerTask.status == "todo"
+            )
+        )
+        print(f"{'successors in db':<48} {todo:8d}")
+        purge(db, EisenhowerTask, user_id)
+
+
+if __name__ == "__main__":
+    main()
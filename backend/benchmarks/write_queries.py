@@ -0,0 +1,155 @@
+"""
+Budżet zapytań SQL dla handlerów create/update (bez uwierzytelnienia).
+
+    python -m benchmarks.write_queries
+
+Każdy zapis to: UPDATE users.change_seq (raz na transakcję) + jedna
+instrukcja INSERT/UPDATE ... RETURNING, plus ewentualny odczyt szablonu /
+taska potrzebny do walidacji. Skrypt kończy się AssertionError, gdy handler
+przekroczy budżet.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.api.v1 import activity_templates, contacts, eisenhower_tasks, events
+from app.db.base import SessionLocal
+from app.models.user import User
+from app.schemas.activity_template import (
+    ActivityTemplateCreate,
+    ActivityTemplateUpdate,
+)
+from app.schemas.contact import ContactCreate, ContactUpdate
+from app.schemas.eisenhower_task import EisenhowerTaskCreate, EisenhowerTaskUpdate
+from app.schemas.event import EventCreate, EventUpdate
+from benchmarks.common import bench_user, count_queries
+
+
+def check(label: str, budget: int, user_id: int, fn):
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        with count_queries() as counter:
+            result = fn(db, user)
+        status = "ok" if counter["n"] <= budget else "OVER BUDGET"
+        print(f"{label:<40} queries={counter['n']} budget={budget} {status}")
+        assert counter["n"] <= budget, label
+        return result
+    finally:
+        db.close()
+
+
+def main() -> None:
+    start = datetime(2026, 3, 2, 9, tzinfo=timezone.utc)
+    with bench_user() as (_, user_id):
+        tpl = check(
+            "POST /activity-templates",
+            2,
+            user_id,
+            lambda db, user: activity_templates.create_template(
+                ActivityTemplateCreate(name="Bench", description="<p>x</p>"),
+                db,
+                user,
+            ),
+        )
+        check(
+            "PUT /activity-templates/{id}",
+            2,
+            user_id,
+            lambda db, user: activity_templates.update_template(
+                tpl.id, ActivityTemplateUpdate(description="<p>y</p>"), db, user
+            ),
+        )
+        ev = check(
+            "POST /events (with template)",
+            3,
+            user_id,
+            lambda db, user: events.create_event(
+                EventCreate(
+                    title="bench",
+                    start_datetime=start,
+                    end_datetime=start + timedelta(hours=1),
+                    activity_template_id=tpl.id,
+                ),
+                db,
+                user,
+                check_conflicts=False,
+            ),
+        )
+        check(
+            "PUT /events/{id} (move)",
+            3,
+            user_id,
+            lambda db, user: events.update_event(
+                ev.id,
+                EventUpdate(
+                    start_datetime=start + timedelta(hours=2),
+                    end_datetime=start + timedelta(hours=3),
+                ),
+                db,
+                user,
+                check_conflicts=False,
+            ),
+        )
+        check(
+            "PUT /events/{id} (template description)",
+            3,
+            user_id,
+            lambda db, user: events.update_event(
+                ev.id,
+                EventUpdate(description="<p>z</p>"),
+                db,
+                user,
+                check_conflicts=False,
+            ),
+        )
+        task = check(
+            "POST /eisenhower-tasks",
+            2,
+            user_id,
+            lambda db, user: eisenhower_tasks.create_task(
+                EisenhowerTaskCreate(title="bench"), db, user
+            ),
+        )
+        check(
+            "PATCH /eisenhower-tasks/{id}",
+            2,
+            user_id,
+            lambda db, user: eisenhower_tasks.patch_task(
+                task.id, EisenhowerTaskUpdate(urgent=True), db, user
+            ),
+        )
+        check(
+            "POST /events/from-task/{id}",
+            4,
+            user_id,
+            lambda db, user: events.create_event_from_task(
+                task.id,
+                EventCreate(
+                    title="",
+                    start_datetime=start,
+                    end_datetime=start + timedelta(hours=1),
+                ),
+                db,
+                user,
+            ),
+        )
+        contact = check(
+            "POST /contacts",
+            2,
+            user_id,
+            lambda db, user: contacts.create_contact(
+                ContactCreate(name="Bench"), db, user
+            ),
+        )
+        check(
+            "PUT /contacts/{id}",
+            2,
+            user_id,
+            lambda db, user: contacts.update_contact(
+                contact.id, ContactUpdate(phone="123"), db, user
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 import { api } from './client'
 import { Event } from '../types'
 
+// Stabilny klucz eventu — wystąpienia serii nie mają id
+export function eventKey(event: Event): string {
+  return event.id !== null
+    ? String(event.id)
+    : `series-${event.series_id}-${event.occurrence_start}`
+}
+
 export const eventsApi = {
   list: async (weekStart?: string, days?: number): Promise<Event[]> => {
     const params: Record<string, string | number> = {}
@@ -15,13 +22,27 @@ export const eventsApi = {
     return res.data
   },
 
-  update: async (id: number, data: Partial<Event>): Promise<Event> => {
-    const res = await api.put<Event>(`/events/${id}`, data)
+  // Wystąpienie serii zapisuje się jako wyjątek serii (tylko to jedno)
+  update: async (event: Event, data: Partial<Event>): Promise<Event> => {
+    if (event.id === null) {
+      const res = await api.put<Event>(`/event-series/${event.series_id}/occurrences`, {
+        ...data,
+        original_start: event.occurrence_start,
+      })
+      return res.data
+    }
+    const res = await api.put<Event>(`/events/${event.id}`, data)
     return res.data
   },
 
-  delete: async (id: number): Promise<void> => {
-    await api.delete(`/events/${id}`)
+  delete: async (event: Event): Promise<void> => {
+    if (event.id === null) {
+      await api.delete(`/event-series/${event.series_id}/occurrences`, {
+        params: { original_start: event.occurrence_start },
+      })
+      return
+    }
+    await api.delete(`/events/${event.id}`)
   },
 
   createFromTask: async (taskId: number, data: Partial<Event>): Promise<Event> => {
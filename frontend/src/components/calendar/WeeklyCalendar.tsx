@@ -4,7 +4,7 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { useDroppable, useDraggable } from '@dnd-kit/core'
 import { format, addDays, subDays, startOfDay, isSameDay, parseISO, isYesterday, isToday as isTodayFn } from 'date-fns'
 import { pl } from 'date-fns/locale'
-import { eventsApi } from '../../api/events'
+import { eventKey, eventsApi } from '../../api/events'
 import { contactsApi } from '../../api/contacts'
 import { useCalendarStore, DragGhost } from '../../store/calendarStore'
 import { templatesApi } from '../../api/templates'
@@ -116,7 +116,7 @@ function BgStrip({
   const grabOffsetMinRef = useRef(0)
 
   const { attributes, listeners, setNodeRef, isDragging } = useDraggable({
-    id: `cal-event-${event.id}`,
+    id: `cal-event-${eventKey(event)}`,
     data: {
       type: 'calendar_event',
       event,
@@ -346,7 +346,7 @@ function EventBlock({
   }, [])
 
   const { attributes, listeners, setNodeRef, isDragging } = useDraggable({
-    id: `cal-event-${event.id}`,
+    id: `cal-event-${eventKey(event)}`,
     data: {
       type: 'calendar_event',
       event,
@@ -532,7 +532,7 @@ function EisenhowerCalendarBlock({
   const tooltipTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null)
 
   const { attributes, listeners, setNodeRef, isDragging } = useDraggable({
-    id: `cal-event-${event.id}`,
+    id: `cal-event-${eventKey(event)}`,
     data: {
       type: 'calendar_event',
       event,
@@ -855,7 +855,7 @@ function DayColumn({
       {/* Paski "Proces w tle" — wąski strip po prawej, klikalny */}
       {events.filter(ev => ev.is_background).map((ev) => (
         <BgStrip
-          key={`bg-${ev.id}`}
+          key={`bg-${eventKey(ev)}`}
           event={ev}
           hourStart={hourStart}
           onRightClick={onEventRightClick}
@@ -875,7 +875,7 @@ function DayColumn({
         )
         return (
           <EventBlock
-            key={ev.id}
+            key={eventKey(ev)}
             event={ev}
             columnRef={columnRef}
             hourStart={hourStart}
@@ -899,7 +899,7 @@ function DayColumn({
         )
         return (
           <EisenhowerCalendarBlock
-            key={`eis-${ev.id}`}
+            key={`eis-${eventKey(ev)}`}
             event={ev}
             columnRef={columnRef}
             hourStart={hourStart}
@@ -1087,8 +1087,8 @@ export function WeeklyCalendar() {
   })
 
   const updateMut = useMutation({
-    mutationFn: ({ id, data }: { id: number; data: Partial<Event> }) =>
-      eventsApi.update(id, data),
+    mutationFn: ({ event, data }: { event: Event; data: Partial<Event> }) =>
+      eventsApi.update(event, data),
     onSuccess: () => {
       qc.invalidateQueries({ queryKey: ['events'] })
       // Dwukierunkowa sync: opis propagowany do szablonu i innych eventów
@@ -1239,13 +1239,13 @@ export function WeeklyCalendar() {
                 iconSet={iconSet}
                 onEventRightClick={(ev) => setModalData({ mode: 'edit', event: ev })}
                 onEventDelete={async (ev) => {
-                  await eventsApi.delete(ev.id)
+                  await eventsApi.delete(ev)
                   qc.invalidateQueries({ queryKey: ['events'] })
                 }}
                 onEventResizeEnd={(ev, newDur) => {
                   const start = parseISO(ev.start_datetime)
                   const end = new Date(start.getTime() + newDur * 60000)
-                  updateMut.mutate({ id: ev.id, data: { end_datetime: end.toISOString() } })
+                  updateMut.mutate({ event: ev, data: { end_datetime: end.toISOString() } })
                 }}
                 eisenhowerTasks={eisenhowerTasks}
                 onTaskStatusChange={handleTaskStatusChange}
@@ -1269,14 +1269,14 @@ export function WeeklyCalendar() {
             if (modalData.mode === 'create') {
               createMut.mutate(data as Parameters<typeof eventsApi.create>[0])
             } else if (modalData.event) {
-              updateMut.mutate({ id: modalData.event.id, data })
+              updateMut.mutate({ event: modalData.event, data })
             }
             setModalData(null)
           }}
           onDelete={
             modalData.mode === 'edit' && modalData.event
               ? async () => {
-                  await eventsApi.delete(modalData.event!.id)
+                  await eventsApi.delete(modalData.event!)
                   qc.invalidateQueries({ queryKey: ['events'] })
                   setModalData(null)
                 }
@@ -165,8 +165,8 @@ export function AppLayout() {
   })
 
   const updateMut = useMutation({
-    mutationFn: ({ id, data }: { id: number; data: Partial<Event> }) =>
-      eventsApi.update(id, data),
+    mutationFn: ({ event, data }: { event: Event; data: Partial<Event> }) =>
+      eventsApi.update(event, data),
     onSuccess: () => qc.invalidateQueries({ queryKey: ['events'] }),
   })
 
@@ -317,7 +317,7 @@ export function AppLayout() {
       const end = new Date(targetDate)
       end.setMinutes(end.getMinutes() + durationMin)
       updateMut.mutate({
-        id: event.id,
+        event,
         data: {
           start_datetime: targetDate.toISOString(),
           end_datetime: end.toISOString(),
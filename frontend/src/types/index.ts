@@ -11,7 +11,9 @@ export interface ActivityTemplate {
 }
 
 export interface Event {
-  id: number
+  id: number | null              // null = wirtualne wystąpienie serii
+  series_id?: number | null      // wystąpienie serii: (series_id, occurrence_start)
+  occurrence_start?: string | null
   title: string
   start_datetime: string
   end_datetime: string